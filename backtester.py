@@ -8,7 +8,6 @@
 
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import pandas as pd
 
 class UnifiedBacktester:
     def __init__(self, initial_capital: float = 10000, commission_rate: float = 0.001):
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+🧊 검증된 불변 설정 스냅샷
+- futures_config / spot_config의 최종 값을 시작 시 한 번 읽어 검증 후 동결
+  (dict -> MappingProxyType, list -> tuple, 멤버십 목록 -> frozenset)
+- 같은 이름을 여러 번 정의한 설정은 경고로 기록 (마지막 정의가 적용됨)
+- SUPPORTED_ASSETS 기반 심볼별 틱/로트 반올림 테이블을 미리 계산하여 O(1) 조회
+- ConfigRegistry.reload(): 새 스냅샷을 검증 후 참조 한 번 교체로 원자적 적용
+  (검증 실패 시 기존 스냅샷 유지)
+"""
+
+import ast
+import importlib
+import math
+import os
+import sys
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_DIRS = (os.path.join(ROOT_DIR, "futures"), os.path.join(ROOT_DIR, "spot"))
+QUOTE_SUFFIXES = ("-PERPETUAL", "/USDT", "-USDT", "/USD", "-USD", "USDT", "USD")
+
+
+def freeze(value):
+    """중첩 설정 값을 읽기 전용 구조로 변환"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def base_asset(symbol: str) -> str:
+    """'BTC/USDT', 'BTC-USD', 'BTCUSDT', 'BTC-PERPETUAL' -> 'BTC'"""
+    symbol = symbol.upper()
+    for suffix in QUOTE_SUFFIXES:
+        if symbol.endswith(suffix) and len(symbol) > len(suffix):
+            return symbol[:-len(suffix)]
+    return symbol
+
+
+def find_redefinitions(path: str) -> Tuple[str, ...]:
+    """모듈 최상위에서 두 번 이상 대입된 대문자 설정 이름"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    seen, repeated = set(), []
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id.isupper():
+                if target.id in seen and target.id not in repeated:
+                    repeated.append(target.id)
+                seen.add(target.id)
+    return tuple(repeated)
+
+
+def _module_settings(module) -> Dict[str, Any]:
+    return {name: getattr(module, name) for name in dir(module) if name.isupper()}
+
+
+class SymbolSpec:
+    """심볼별 주문 단위"""
+
+    __slots__ = ('asset', 'tick_size', 'lot_size', 'price_precision', 'quantity_precision')
+
+    def __init__(self, asset: str, min_order: float, price_precision: int):
+        self.asset = asset
+        self.tick_size = 10.0 ** -price_precision
+        self.lot_size = float(min_order)
+        self.price_precision = price_precision
+        self.quantity_precision = max(0, -int(math.floor(math.log10(min_order))))
+
+    def round_price(self, price: float, side: Optional[str] = None) -> float:
+        """틱 단위 정렬 (매수는 내림, 매도는 올림, 방향 미지정 시 반올림)"""
+        ticks = price / self.tick_size
+        if side == 'BUY':
+            ticks = math.floor(ticks + 1e-9)
+        elif side == 'SELL':
+            ticks = math.ceil(ticks - 1e-9)
+        else:
+            ticks = round(ticks)
+        return round(ticks * self.tick_size, self.price_precision)
+
+    def round_quantity(self, quantity: float) -> float:
+        """로트 단위 내림 (최소 주문 수량 미만이면 0)"""
+        lots = math.floor(quantity / self.lot_size + 1e-9)
+        return round(lots * self.lot_size, self.quantity_precision)
+
+
+class ConfigSnapshot:
+    """시작 시 한 번 만들어지는 읽기 전용 설정"""
+
+    __slots__ = ('version', 'created_at', 'futures', 'spot', 'symbols', 'symbol_specs',
+                 'funding_hours', 'active_hours', 'warnings')
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"ConfigSnapshot is read-only: {name}")
+        object.__setattr__(self, name, value)
+
+    def __init__(self, futures: Dict[str, Any], spot: Dict[str, Any], version: int = 1,
+                 warnings: Tuple[str, ...] = ()):
+        issues = validate(futures, spot)
+        if issues:
+            raise ValueError("Invalid config: " + "; ".join(issues))
+
+        self.version = version
+        self.created_at = time.time()
+        self.futures = freeze(futures)
+        self.spot = freeze(spot)
+
+        specs = {}
+        for asset, rules in spot.get("SUPPORTED_ASSETS", {}).items():
+            specs[asset.upper()] = SymbolSpec(asset.upper(), rules["min_order"], rules["price_precision"])
+        symbols = set()
+        for name in ("SUPPORTED_SYMBOLS", "SUPPORTED_FUTURES"):
+            symbols.update(futures.get(name, ()))
+        symbols.update(spot.get("SUPPORTED_SPOT_SYMBOLS", ()))
+        symbols.update(spot.get("YAHOO_SYMBOLS", {}).values())
+        # 모든 표기(BTC/USDT, BTC-USD, BTCUSDT ...)를 미리 펼쳐 조회 시 문자열 처리 없음
+        by_symbol = dict(specs)
+        for symbol in symbols:
+            spec = specs.get(base_asset(symbol))
+            if spec is not None:
+                by_symbol[symbol] = spec
+                by_symbol[symbol.replace("/", "").replace("-", "")] = spec
+        self.symbols = frozenset(symbols)
+        self.symbol_specs = MappingProxyType(by_symbol)
+
+        trading_hours = futures.get("TRADING_HOURS", {})
+        self.funding_hours = frozenset(trading_hours.get("funding_times", ()))
+        self.active_hours = frozenset(range(trading_hours.get("active_start", 0),
+                                            trading_hours.get("active_end", 23) + 1))
+        self.warnings = tuple(warnings)
+
+    def is_supported(self, symbol: str) -> bool:
+        return symbol in self.symbols
+
+    def spec(self, symbol: str) -> Optional[SymbolSpec]:
+        spec = self.symbol_specs.get(symbol)
+        if spec is None:
+            spec = self.symbol_specs.get(base_asset(symbol))
+        return spec
+
+    def tick_size(self, symbol: str, default: float = 0.01) -> float:
+        spec = self.spec(symbol)
+        return spec.tick_size if spec is not None else default
+
+    def round_price(self, symbol: str, price: float, side: Optional[str] = None) -> float:
+        spec = self.spec(symbol)
+        return spec.round_price(price, side) if spec is not None else price
+
+    def round_quantity(self, symbol: str, quantity: float) -> float:
+        spec = self.spec(symbol)
+        return spec.round_quantity(quantity) if spec is not None else quantity
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'version': self.version,
+            'created_at': self.created_at,
+            'symbols': sorted(self.symbols),
+            'assets_with_rules': sorted({spec.asset for spec in self.symbol_specs.values()}),
+            'warnings': list(self.warnings),
+        }
+
+
+def validate(futures: Dict[str, Any], spot: Dict[str, Any]) -> List[str]:
+    """설정 값 검증, 문제 목록 반환"""
+    issues = []
+    for key, rate in futures.get("FEES", {}).items():
+        if isinstance(rate, (int, float)) and not 0 <= rate < 1:
+            issues.append(f"futures.FEES.{key} must be in [0, 1): {rate}")
+    for key, leverage in futures.get("TIME_BASED_LEVERAGE", {}).items():
+        if isinstance(leverage, (int, float)) and leverage <= 0:
+            issues.append(f"futures.TIME_BASED_LEVERAGE.{key} must be positive: {leverage}")
+    hours = futures.get("TRADING_HOURS", {})
+    if isinstance(hours, dict):
+        if not 0 <= hours.get("active_start", 0) <= hours.get("active_end", 23) <= 23:
+            issues.append("futures.TRADING_HOURS active_start/active_end must satisfy 0 <= start <= end <= 23")
+        if any(not 0 <= hour <= 23 for hour in hours.get("funding_times", ())):
+            issues.append("futures.TRADING_HOURS.funding_times must be UTC hours (0-23)")
+    for asset, rules in spot.get("SUPPORTED_ASSETS", {}).items():
+        if rules.get("min_order", 0) <= 0:
+            issues.append(f"spot.SUPPORTED_ASSETS.{asset}.min_order must be positive")
+        if not isinstance(rules.get("price_precision"), int) or rules["price_precision"] < 0:
+            issues.append(f"spot.SUPPORTED_ASSETS.{asset}.price_precision must be a non-negative int")
+    return issues
+
+
+def _load_modules(reload: bool = False):
+    for directory in CONFIG_DIRS:
+        if directory not in sys.path:
+            sys.path.append(directory)
+    modules = []
+    for name in ("futures_config", "spot_config"):
+        module = importlib.import_module(name)
+        modules.append(importlib.reload(module) if reload else module)
+    return modules
+
+
+def build_snapshot(futures_module=None, spot_module=None, version: int = 1,
+                   reload: bool = False) -> ConfigSnapshot:
+    """설정 모듈에서 스냅샷 생성 (모듈 미지정 시 futures_config / spot_config 사용)"""
+    if futures_module is None or spot_module is None:
+        loaded_futures, loaded_spot = _load_modules(reload)
+        futures_module = futures_module or loaded_futures
+        spot_module = spot_module or loaded_spot
+
+    warnings = []
+    for label, module in (("futures", futures_module), ("spot", spot_module)):
+        path = getattr(module, "__file__", None)
+        if path and path.endswith(".py"):
+            for name in find_redefinitions(path):
+                warnings.append(f"{label}_config defines {name} more than once; last definition wins")
+    return ConfigSnapshot(_module_settings(futures_module), _module_settings(spot_module), version, tuple(warnings))
+
+
+class ConfigRegistry:
+    """현재 스냅샷 보관 및 무중단 교체"""
+
+    def __init__(self, snapshot: Optional[ConfigSnapshot] = None):
+        self._snapshot = snapshot
+        self._lock = threading.Lock()
+        self._listeners = []
+
+    @property
+    def current(self) -> ConfigSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = build_snapshot()
+                snapshot = self._snapshot
+        return snapshot
+
+    def subscribe(self, callback: Callable[[ConfigSnapshot], Any]):
+        self._listeners.append(callback)
+
+    def swap(self, snapshot: ConfigSnapshot) -> ConfigSnapshot:
+        """검증된 스냅샷으로 교체 (참조 대입 한 번, 읽는 쪽은 잠금 불필요)"""
+        with self._lock:
+            self._snapshot = snapshot
+        for callback in list(self._listeners):
+            try:
+                callback(snapshot)
+            except Exception as e:
+                print(f"Config listener failed: {e}")
+        return snapshot
+
+    def reload(self, futures_module=None, spot_module=None) -> Dict[str, Any]:
+        """설정 파일을 다시 읽어 새 스냅샷 적용 (실패 시 기존 스냅샷 유지)"""
+        version = self.current.version + 1
+        try:
+            snapshot = build_snapshot(futures_module, spot_module, version=version,
+                                      reload=futures_module is None or spot_module is None)
+        except Exception as e:
+            return {'success': False, 'error': str(e), 'version': self.current.version}
+        self.swap(snapshot)
+        return {'success': True, 'version': snapshot.version, 'warnings': list(snapshot.warnings)}
+
+
+CONFIG = ConfigRegistry()
+
+
+def get_config() -> ConfigSnapshot:
+    """현재 설정 스냅샷 (시작 시 init_config()를 호출하지 않았다면 첫 호출 시 생성)"""
+    return CONFIG.current
+
+
+def init_config(verbose: bool = True) -> ConfigSnapshot:
+    """진입점 시작 시 스냅샷 생성 (설정 검증/중복 정의 검사 비용을 거래 경로 밖에서 처리)"""
+    snapshot = CONFIG.current
+    if verbose:
+        for warning in snapshot.warnings:
+            print(f"Config warning: {warning}")
+    return snapshot
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+🧊 호가 적응형 실행 알고리즘
+- 아이스버그: 전체 수량 중 일부만 노출하고 체결되면 다시 채움
+  (노출 수량은 같은 방향 최우선 호가 잔량의 일정 비율로 제한)
+- 리밋 체이싱: 최우선 호가를 따라 지정가를 재조정, 가격 변화가 임계 틱 미만이면 유지
+- decide()는 순수 산술 연산만 수행 (네트워크/할당 없음)
+- AlgoExecutor가 SpotMCPClient(get_depth/create_order/cancel_order/get_order_status) 또는
+  FuturesMCPClient(get_market_data/place_order)로 결정을 실행
+"""
+
+import math
+import time
+from typing import Dict, Any, Optional, Tuple
+
+from config_snapshot import get_config
+
+ACTION_HOLD = 0
+ACTION_PLACE = 1
+ACTION_REPLACE = 2
+ACTION_DONE = 3
+ACTION_NAMES = ('hold', 'place', 'replace', 'done')
+
+EPSILON = 1e-12
+HOLD = (ACTION_HOLD, 0.0, 0.0)
+DONE = (ACTION_DONE, 0.0, 0.0)
+CLOSED_STATUSES = ('CANCELLED', 'CANCELED', 'EXPIRED', 'REJECTED')
+
+
+def _level(row) -> Tuple[float, float]:
+    if isinstance(row, dict):
+        return float(row['price']), float(row.get('quantity', row.get('qty', 0.0)))
+    return float(row[0]), float(row[1])
+
+
+def top_of_book(depth: Dict[str, Any]) -> Optional[Tuple[float, float, float, float]]:
+    """호가 응답에서 (매수 1호가, 잔량, 매도 1호가, 잔량) 추출"""
+    if not isinstance(depth, dict) or not depth.get('bids') or not depth.get('asks'):
+        return None
+    bid, bid_qty = _level(depth['bids'][0])
+    ask, ask_qty = _level(depth['asks'][0])
+    return bid, bid_qty, ask, ask_qty
+
+
+def round_to_tick(price: float, tick_size: float, side: str) -> float:
+    """매수는 내림, 매도는 올림으로 틱 단위 정렬 (지정가 한도를 넘지 않도록)"""
+    ticks = price / tick_size
+    ticks = math.floor(ticks + 1e-9) if side == 'BUY' else math.ceil(ticks - 1e-9)
+    return round(ticks * tick_size, 12)
+
+
+class IcebergOrder:
+    """일부 수량만 노출하는 아이스버그 주문"""
+
+    __slots__ = ('symbol', 'side', 'quantity', 'display_quantity', 'limit_price', 'depth_fraction',
+                 'min_display', 'filled', 'working_id', 'working_price', 'working_quantity', 'working_filled',
+                 'refills')
+
+    def __init__(self, symbol: str, side: str, quantity: float, display_quantity: float,
+                 limit_price: float = None, depth_fraction: float = 0.25, min_display: float = 0.0):
+        self.symbol = symbol
+        self.side = side.upper()
+        self.quantity = quantity
+        self.display_quantity = display_quantity
+        self.limit_price = limit_price
+        self.depth_fraction = depth_fraction
+        self.min_display = min_display
+        self.filled = 0.0
+        self.working_id = None
+        self.working_price = 0.0
+        self.working_quantity = 0.0
+        self.working_filled = 0.0  # 현재 걸린 주문의 누적 체결 수량
+        self.refills = 0
+
+    @property
+    def remaining(self) -> float:
+        return self.quantity - self.filled
+
+    def decide(self, bid: float, bid_qty: float, ask: float, ask_qty: float) -> Tuple[int, float, float]:
+        """(행동, 가격, 수량) 반환"""
+        remaining = self.quantity - self.filled
+        if remaining <= EPSILON:
+            return DONE
+        if self.working_quantity > EPSILON:
+            return HOLD  # 노출 조각이 아직 호가에 걸려 있음
+
+        # 같은 방향 최우선 잔량 대비 과도하게 큰 주문을 노출하지 않음
+        queue = bid_qty if self.side == 'BUY' else ask_qty
+        show = min(self.display_quantity, remaining, max(self.min_display, self.depth_fraction * queue))
+        if show <= EPSILON:
+            return HOLD
+        price = self.limit_price
+        if price is None:
+            price = bid if self.side == 'BUY' else ask
+        return ACTION_PLACE, price, show
+
+    def on_placed(self, order_id, price: float, quantity: float, replaced: bool = False):
+        self.working_id = order_id
+        self.working_price = price
+        self.working_quantity = quantity
+        self.working_filled = 0.0
+        self.refills += 1
+
+    def on_fill(self, quantity: float):
+        quantity = min(quantity, self.working_quantity)
+        self.filled += quantity
+        self.working_filled += quantity
+        self.working_quantity -= quantity
+        if self.working_quantity <= EPSILON:
+            self.working_id = None
+            self.working_quantity = 0.0
+
+    def on_cancelled(self):
+        self.working_id = None
+        self.working_quantity = 0.0
+
+
+class LimitChaser:
+    """최우선 호가를 따라가는 지정가 주문"""
+
+    __slots__ = ('symbol', 'side', 'quantity', 'fixed_tick_size', 'offset_ticks', 'reprice_ticks', 'limit_price',
+                 'filled', 'working_id', 'working_price', 'working_quantity', 'working_filled', 'reprices')
+
+    def __init__(self, symbol: str, side: str, quantity: float, tick_size: float = None,
+                 offset_ticks: int = 0, reprice_ticks: int = 2, limit_price: float = None):
+        self.symbol = symbol
+        self.side = side.upper()
+        self.quantity = quantity
+        # 틱 크기 미지정 시 현재 설정 스냅샷의 심볼별 가격 정밀도 사용 (설정 재적재 반영)
+        self.fixed_tick_size = tick_size
+        self.offset_ticks = offset_ticks
+        self.reprice_ticks = reprice_ticks
+        self.limit_price = limit_price  # 추격 상한(매수) / 하한(매도)
+        self.filled = 0.0
+        self.working_id = None
+        self.working_price = 0.0
+        self.working_quantity = 0.0
+        self.working_filled = 0.0  # 현재 걸린 주문의 누적 체결 수량
+        self.reprices = 0
+
+    @property
+    def remaining(self) -> float:
+        return self.quantity - self.filled
+
+    @property
+    def tick_size(self) -> float:
+        if self.fixed_tick_size is not None:
+            return self.fixed_tick_size
+        return get_config().tick_size(self.symbol)
+
+    def target_price(self, bid: float, ask: float, tick: float = None) -> float:
+        tick = tick or self.tick_size
+        if self.side == 'BUY':
+            # 매수 1호가에 붙거나 개선하되 스프레드를 넘지 않음
+            price = min(bid + self.offset_ticks * tick, ask - tick) if ask > bid else bid
+            if self.limit_price is not None:
+                price = min(price, self.limit_price)
+        else:
+            price = max(ask - self.offset_ticks * tick, bid + tick) if ask > bid else ask
+            if self.limit_price is not None:
+                price = max(price, self.limit_price)
+        return round_to_tick(price, tick, self.side)
+
+    def decide(self, bid: float, bid_qty: float, ask: float, ask_qty: float) -> Tuple[int, float, float]:
+        """(행동, 가격, 수량) 반환"""
+        remaining = self.quantity - self.filled
+        if remaining <= EPSILON:
+            return DONE
+        tick = self.tick_size
+        target = self.target_price(bid, ask, tick)
+        if self.working_id is None:
+            return ACTION_PLACE, target, remaining
+        if abs(target - self.working_price) < self.reprice_ticks * tick - EPSILON:
+            return HOLD  # 임계 틱 미만 변화: 취소/재주문 생략
+        return ACTION_REPLACE, target, self.working_quantity
+
+    def on_placed(self, order_id, price: float, quantity: float, replaced: bool = False):
+        if replaced:
+            self.reprices += 1
+        self.working_id = order_id
+        self.working_price = price
+        self.working_quantity = quantity
+        self.working_filled = 0.0
+
+    def on_fill(self, quantity: float):
+        quantity = min(quantity, self.working_quantity)
+        self.filled += quantity
+        self.working_filled += quantity
+        self.working_quantity -= quantity
+        if self.working_quantity <= EPSILON:
+            self.working_id = None
+            self.working_quantity = 0.0
+
+    def on_cancelled(self):
+        self.working_id = None
+        self.working_quantity = 0.0
+
+
+class AlgoExecutor:
+    """실행 알고리즘 결정을 거래소 클라이언트 호출로 변환"""
+
+    def __init__(self, client, depth_limit: int = 5):
+        self.client = client
+        self.depth_limit = depth_limit
+        self.stats = {'steps': 0, 'polled': 0, 'placed': 0, 'replaced': 0, 'held': 0, 'errors': 0}
+
+    def book(self, symbol: str) -> Optional[Tuple[float, float, float, float]]:
+        if hasattr(self.client, 'get_depth'):
+            return top_of_book(self.client.get_depth(symbol, limit=self.depth_limit))
+        # 호가 조회가 없는 클라이언트(선물 시뮬레이터): 현재가를 양쪽 호가로 사용
+        market = self.client.get_market_data(symbol)
+        if not isinstance(market, dict) or 'price' not in market:
+            return None
+        price = float(market['price'])
+        return price, math.inf, price, math.inf
+
+    def _submit(self, algo, price: float, quantity: float) -> Optional[Dict[str, Any]]:
+        if hasattr(self.client, 'create_order'):
+            return self.client.create_order(algo.symbol, algo.side, price, quantity)
+        return self.client.place_order(algo.symbol, algo.side, quantity, price)
+
+    @staticmethod
+    def _apply_executed(algo, executed):
+        """거래소의 주문별 누적 체결 수량을 알고리즘 체결 증분으로 반영"""
+        if executed is None:
+            return
+        delta = float(executed) - algo.working_filled
+        if delta > EPSILON:
+            algo.on_fill(delta)
+
+    def _cancel(self, algo) -> bool:
+        if not hasattr(self.client, 'cancel_order'):
+            return False
+        response = self.client.cancel_order(algo.working_id)
+        status = str(response.get('status', '')).upper() if isinstance(response, dict) else ''
+        if 'error' in (response or {}) or status not in CLOSED_STATUSES + ('FILLED',):
+            # 취소 미확인(오류/브레이커 차단): 기존 주문이 살아 있을 수 있으므로 유지하고 다음 단계에서 재시도
+            self.stats['errors'] += 1
+            return False
+        # 취소 전에 체결된 수량 반영
+        executed = response.get('executed_quantity')
+        if executed is None and status == 'FILLED':
+            executed = algo.working_filled + algo.working_quantity
+        self._apply_executed(algo, executed)
+        if algo.working_id is not None:
+            algo.on_cancelled()
+        return True
+
+    def poll(self, algo):
+        """걸려 있는 주문의 체결/종료 상태 조회 (조회를 지원하지 않는 클라이언트는 생략)"""
+        if algo.working_id is None or not hasattr(self.client, 'get_order_status'):
+            return
+        self.stats['polled'] += 1
+        response = self.client.get_order_status(algo.working_id)
+        if not isinstance(response, dict) or 'error' in response:
+            self.stats['errors'] += 1
+            return
+        status = str(response.get('status', '')).upper()
+        executed = response.get('executed_quantity')
+        if executed is None and status == 'FILLED':
+            executed = algo.working_filled + algo.working_quantity
+        self._apply_executed(algo, executed)
+        if status in CLOSED_STATUSES and algo.working_id is not None:
+            algo.on_cancelled()  # 거래소에서 종료된 주문 - 남은 수량은 다시 노출
+
+    def step(self, algo) -> int:
+        """호가 1회 조회 후 결정 실행, 수행한 행동 코드 반환"""
+        self.stats['steps'] += 1
+        self.poll(algo)
+        book = self.book(algo.symbol)
+        if book is None:
+            self.stats['errors'] += 1
+            return ACTION_HOLD
+        action, price, quantity = algo.decide(*book)
+        if action == ACTION_HOLD:
+            self.stats['held'] += 1
+            return action
+        if action == ACTION_DONE:
+            return action
+        if action == ACTION_REPLACE:
+            if not self._cancel(algo):
+                self.stats['held'] += 1
+                return ACTION_HOLD  # 취소 미지원/미확인 시 기존 주문 유지
+            quantity = algo.remaining
+            if quantity <= EPSILON:
+                return ACTION_DONE  # 취소 직전에 전량 체결
+
+        response = self._submit(algo, price, quantity)
+        if not isinstance(response, dict) or response.get('status') in ('FAILED', 'REJECTED'):
+            self.stats['errors'] += 1
+            return ACTION_HOLD
+        algo.on_placed(response.get('order_id'), price, quantity, action == ACTION_REPLACE)
+        self.stats['replaced' if action == ACTION_REPLACE else 'placed'] += 1
+
+        status = str(response.get('status', '')).upper()
+        if status in ('FILLED', 'PARTIALLY_FILLED'):
+            default = quantity if status == 'FILLED' else 0.0
+            self._apply_executed(algo, response.get('executed_quantity', default))
+        return action
+
+    def run(self, algo, max_steps: int = 100, interval: float = 0.5, sleep=time.sleep) -> Dict[str, Any]:
+        """완료 또는 max_steps까지 반복 실행"""
+        for _ in range(max_steps):
+            if self.step(algo) == ACTION_DONE:
+                break
+            sleep(interval)
+        return {
+            'symbol': algo.symbol,
+            'side': algo.side,
+            'quantity': algo.quantity,
+            'filled': algo.filled,
+            'working_id': algo.working_id,
+            'stats': dict(self.stats),
+        }
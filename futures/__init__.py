@@ -1,18 +1,44 @@
-
 """
 Futures Trading Package
+- 패키지 멤버는 처음 접근할 때 로드 (PEP 562) - `import futures` 자체는 가볍게 유지
 """
 
-from .futures_main import FuturesTrader
-from .futures_backtester import FuturesBacktester
-from .claude_enhanced_trader import ClaudeEnhancedTrader
-from .futures_config import *
+import importlib
+
+# 공개 이름 -> (모듈, 속성)
+_LAZY_MEMBERS = {
+    'FuturesTrader': ('.futures_main', 'FuturesTrader'),
+    'FuturesBacktester': ('backtester', 'FuturesBacktester'),
+    'ClaudeEnhancedTrader': ('.claude_enhanced_trader', 'ClaudeEnhancedTrader'),
+}
 
 __all__ = [
     'FuturesTrader',
-    'FuturesBacktester', 
+    'FuturesBacktester',
     'ClaudeEnhancedTrader',
     'FUTURES_TRADING_CONFIG',
     'SUPPORTED_FUTURES',
     'RISK_MANAGEMENT'
 ]
+
+
+def __getattr__(name):
+    target = _LAZY_MEMBERS.get(name)
+    if target is not None:
+        module_name, attribute = target
+        module = importlib.import_module(module_name, __name__ if module_name.startswith('.') else None)
+    elif name.isupper():
+        # 설정 상수 (기존 `from .futures_config import *` 동작 유지)
+        module, attribute = importlib.import_module('.futures_config', __name__), name
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(module, attribute)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value  # 이후 접근은 일반 속성 조회
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MEMBERS) | set(__all__))
@@ -5,50 +5,95 @@ Claude AI 향상된 거래자
 """
 
 import json
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+try:
+    from .futures_config import TRADE_JOURNAL
+except ImportError:
+    from futures_config import TRADE_JOURNAL
+
+def rule_based_signal(symbol: str, market_data: Dict[str, Any]) -> Dict[str, Any]:
+    """가격 수준 기반 규칙 신호 (모델 응답이 늦을 때의 대체 신호로도 사용)"""
+    # 기본 분석
+    price = market_data.get('price', 50000)
+    volume = market_data.get('volume', 1000)
+
+    # 간단한 신호 로직
+    if price > 45000:
+        action = "BUY"
+        confidence = 75
+    elif price < 40000:
+        action = "SELL"
+        confidence = 80
+    else:
+        action = "HOLD"
+        confidence = 60
+
+    return {
+        'symbol': symbol,
+        'action': action,
+        'confidence': confidence,
+        'price': price,
+        'volume': volume,
+        'timestamp': datetime.now().isoformat(),
+        'reasoning': f"Price analysis based on {price} level"
+    }
+
+
+class MarketSnapshot:
+    """틱당 한 번 수집하는 시장 스냅샷 - 모든 분석이 같은 가격/포지션/계정을 사용"""
+
+    __slots__ = ('symbol', 'market_data', 'position', 'account', 'captured_at')
+
+    def __init__(self, symbol: str, market_data: Dict[str, Any], position: Optional[Dict[str, Any]] = None,
+                 account: Optional[Dict[str, Any]] = None):
+        self.symbol = symbol
+        self.market_data = market_data
+        self.position = position or {}
+        self.account = account or {}
+        self.captured_at = datetime.now()
+
+    @classmethod
+    def capture(cls, mcp_client, symbol: str) -> 'MarketSnapshot':
+        """MCP 클라이언트에서 시장 데이터, 포지션, 계정 정보를 한 번에 수집"""
+        market_data = mcp_client.get_market_data(symbol)
+        position = mcp_client.get_position(symbol) if hasattr(mcp_client, 'get_position') else None
+        account = mcp_client.get_account_info() if hasattr(mcp_client, 'get_account_info') else None
+        return cls(symbol, market_data, position, account)
+
+    @property
+    def price(self) -> float:
+        return self.market_data.get('price', 50000)
+
+
 class ClaudeEnhancedTrader:
     """Claude AI 향상된 거래자"""
 
-    def __init__(self, claude_api_key: str = "demo_key", mcp_client=None):
+    def __init__(self, claude_api_key: str = "demo_key", mcp_client=None, journal=None):
         self.claude_api_key = claude_api_key
         self.mcp_client = mcp_client or MockMCPClient()
-        self.analysis_history = []
+        # 최근 분석만 메모리에 유지, 전체 기록은 저널(있는 경우)에 저장
+        self.journal = journal
+        self.analysis_history = journal.tail if journal is not None else deque(maxlen=TRADE_JOURNAL["tail_size"])
+
+    def capture_snapshot(self, symbol: str) -> MarketSnapshot:
+        """틱 시작 시 한 번 호출하여 모든 분석에 전달할 스냅샷 생성"""
+        return MarketSnapshot.capture(self.mcp_client, symbol)
 
-    def get_intelligent_trading_signal(self, symbol: str) -> Dict[str, Any]:
+    def get_intelligent_trading_signal(self, symbol: str, snapshot: Optional[MarketSnapshot] = None) -> Dict[str, Any]:
         """지능형 거래 신호 생성"""
         try:
-            # 시장 데이터 수집
-            market_data = self.mcp_client.get_market_data(symbol)
-            position_info = self.mcp_client.get_position(symbol)
+            # 시장 데이터 수집 (스냅샷이 없을 때만)
+            snapshot = snapshot or self.capture_snapshot(symbol)
 
-            # 기본 분석
-            price = market_data.get('price', 50000)
-            volume = market_data.get('volume', 1000)
-
-            # 간단한 신호 로직
-            if price > 45000:
-                action = "BUY"
-                confidence = 75
-            elif price < 40000:
-                action = "SELL"
-                confidence = 80
-            else:
-                action = "HOLD"
-                confidence = 60
+            signal = rule_based_signal(symbol, snapshot.market_data)
 
-            signal = {
-                'symbol': symbol,
-                'action': action,
-                'confidence': confidence,
-                'price': price,
-                'volume': volume,
-                'timestamp': datetime.now().isoformat(),
-                'reasoning': f"Price analysis based on {price} level"
-            }
-
-            self.analysis_history.append(signal)
+            if self.journal is not None:
+                self.journal.append(signal)
+            else:
+                self.analysis_history.append(signal)
             return signal
 
         except Exception as e:
@@ -61,10 +106,10 @@ class ClaudeEnhancedTrader:
                 'timestamp': datetime.now().isoformat()
             }
 
-    def get_market_narrative(self, symbol: str) -> str:
+    def get_market_narrative(self, symbol: str, snapshot: Optional[MarketSnapshot] = None) -> str:
         """시장 해석 생성"""
         try:
-            market_data = self.mcp_client.get_market_data(symbol)
+            market_data = snapshot.market_data if snapshot else self.mcp_client.get_market_data(symbol)
             price = market_data.get('price', 50000)
 
             narrative = f"""
@@ -85,10 +130,11 @@ Recommendation: {'Consider buying on dips' if price > 45000 else 'Wait for bette
         except Exception as e:
             return f"Market narrative generation failed: {e}"
 
-    def analyze_risk_reward(self, symbol: str, position_size: float) -> Dict[str, Any]:
+    def analyze_risk_reward(self, symbol: str, position_size: float,
+                            snapshot: Optional[MarketSnapshot] = None) -> Dict[str, Any]:
         """리스크/수익 분석"""
         try:
-            market_data = self.mcp_client.get_market_data(symbol)
+            market_data = snapshot.market_data if snapshot else self.mcp_client.get_market_data(symbol)
             price = market_data.get('price', 50000)
 
             # 간단한 리스크 계산
@@ -111,9 +157,11 @@ Recommendation: {'Consider buying on dips' if price > 45000 else 'Wait for bette
         except Exception as e:
             return {'error': str(e)}
 
-    def get_analysis_history(self) -> list:
-        """분석 기록 반환"""
-        return self.analysis_history
+    def get_analysis_history(self, start=None, end=None) -> list:
+        """분석 기록 반환 (start/end 지정 시 저널에서 해당 시간 범위만 조회)"""
+        if (start is not None or end is not None) and self.journal is not None:
+            return self.journal.read_range(start, end)
+        return list(self.analysis_history)
 
 
 class MockMCPClient:
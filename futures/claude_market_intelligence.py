@@ -1,8 +1,20 @@
 import json
-import requests
+import os
+import sys
 from datetime import datetime, timedelta
-import anthropic
-from .futures_config import *
+from typing import Dict, Any, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from instrumentation import LLM_METRICS
+
+try:
+    from .futures_config import *
+except ImportError:
+    from futures_config import *
+
+SNAPSHOT_HEADER = "symbol,price,volume"
+VALID_RECOMMENDATIONS = ("BUY", "SELL", "HOLD")
 
 class MarketDataCollector:
     """
@@ -23,52 +35,152 @@ class MarketDataCollector:
             'timestamp': datetime.now().isoformat()
         }
 
+    # 하위 호환성을 위한 별칭
+    collect_data = collect_market_data
+
 class ClaudeMarketIntelligence:
     """
     Claude AI 기반 시장 인텔리전스
+    - 여러 심볼을 한 번의 요청으로 묶어 분석 (파싱 실패 시 심볼별 요청으로 대체)
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: Optional[str] = None,
+                 data_collector: Optional[MarketDataCollector] = None, model_config: Optional[dict] = None,
+                 response_cache=None):
         self.api_key = api_key
-        self.claude_client = anthropic.Anthropic(api_key=api_key)
-        self.data_collector = MarketDataCollector()
+        self.response_cache = response_cache
+        self.base_url = base_url
+        self.model_config = dict(CLAUDE_MODEL_CONFIG, **(model_config or {}))
+        self._claude_client = None
+        self.data_collector = data_collector or MarketDataCollector()
+
+    @property
+    def claude_client(self):
+        """anthropic 클라이언트 (첫 모델 호출 시 생성 - import 비용 지연)"""
+        if self._claude_client is None:
+            import anthropic
+
+            self._claude_client = anthropic.Anthropic(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                timeout=self.model_config["timeout"],
+                max_retries=self.model_config["max_retries"]
+            )
+        return self._claude_client
+
+    @claude_client.setter
+    def claude_client(self, client):
+        self._claude_client = client
 
     def analyze_market(self, symbol: str) -> dict:
         """
-        시장 분석 수행
+        시장 분석 수행 (단일 심볼)
         """
         market_data = self.data_collector.collect_market_data(symbol)
 
+        try:
+            prompt = self._build_prompt([market_data])
+            parsed = self._parse_results(self._call_model(prompt, 'market_intelligence.single'))
+            if symbol in parsed:
+                return self._build_result(symbol, parsed[symbol], market_data, 'single')
+        except Exception as e:
+            print(f"Market analysis error for {symbol}: {e}")
+
         return {
             'symbol': symbol,
             'analysis': 'Market analysis completed',
             'recommendation': 'HOLD',
-            'data': market_data
-        }
-import json
-from datetime import datetime
-
-class ClaudeMarketIntelligence:
-    def __init__(self, claude_api_key: str):
-        self.claude_api_key = claude_api_key
-    
-    def analyze_market(self, symbol: str) -> dict:
-        """시장 분석"""
-        return {
-            'symbol': symbol,
-            'analysis': 'Market intelligence analysis',
+            'confidence': 0,
+            'data': market_data,
+            'source': 'default',
             'timestamp': datetime.now().isoformat()
         }
 
-class MarketDataCollector:
-    def __init__(self):
-        pass
-    
-    def collect_data(self, symbol: str) -> dict:
-        """시장 데이터 수집"""
+    def analyze_markets(self, symbols: List[str]) -> Dict[str, dict]:
+        """
+        다중 심볼 일괄 분석 - batch_size 단위로 한 번의 요청에 묶음
+        """
+        results = {}
+        batch_size = self.model_config["batch_size"]
+
+        for start in range(0, len(symbols), batch_size):
+            batch = symbols[start:start + batch_size]
+            snapshots = {symbol: self.data_collector.collect_market_data(symbol) for symbol in batch}
+
+            try:
+                prompt = self._build_prompt(list(snapshots.values()))
+                parsed = self._parse_results(self._call_model(prompt, 'market_intelligence.batch'))
+            except Exception as e:
+                print(f"Batch analysis failed, falling back to per-symbol calls: {e}")
+                parsed = {}
+
+            for symbol in batch:
+                if symbol in parsed:
+                    results[symbol] = self._build_result(symbol, parsed[symbol], snapshots[symbol], 'batch')
+                else:
+                    results[symbol] = self.analyze_market(symbol)
+
+        return results
+
+    def _build_prompt(self, snapshots: List[dict]) -> str:
+        """압축된 시장 스냅샷 프롬프트 생성"""
+        rows = [
+            f"{data['symbol']},{float(data.get('price', 0)):.2f},{float(data.get('volume', 0)):.0f}"
+            for data in snapshots
+        ]
+        return "\n".join([
+            "You are a crypto futures market analyst. Give one recommendation per symbol below.",
+            'Respond with JSON only: {"results": [{"symbol": str, "recommendation": "BUY"|"SELL"|"HOLD", '
+            '"confidence": 0-100, "analysis": str}]}',
+            "",
+            SNAPSHOT_HEADER,
+            *rows
+        ])
+
+    def _call_model(self, prompt: str, path: str = 'market_intelligence') -> str:
+        """Claude 모델 호출 후 텍스트 응답 반환 (응답 캐시가 있으면 미스일 때만 호출)"""
+        with LLM_METRICS.track(path, self.model_config["model"]) as call:
+            if self.response_cache is None:
+                return self._request_model(prompt, call)
+
+            params = {'model': self.model_config["model"], 'max_tokens': self.model_config["max_tokens"]}
+            hits_before = self.response_cache.hits
+            text = self.response_cache.get_or_call(prompt, params, lambda: self._request_model(prompt, call))
+            call.cache_hit = self.response_cache.hits > hits_before
+            return text
+
+    def _request_model(self, prompt: str, call) -> str:
+        response = self.claude_client.messages.create(
+            model=self.model_config["model"],
+            max_tokens=self.model_config["max_tokens"],
+            messages=[{"role": "user", "content": prompt}]
+        )
+        call.input_tokens = response.usage.input_tokens
+        call.output_tokens = response.usage.output_tokens
+        return "".join(block.text for block in response.content if getattr(block, 'type', '') == 'text')
+
+    def _parse_results(self, text: str) -> Dict[str, dict]:
+        """구조화된 응답 파싱 - 형식이 잘못된 항목은 제외"""
+        start, end = text.find('{'), text.rfind('}')
+        if start < 0 or end < start:
+            raise ValueError("No JSON object in model response")
+
+        payload = json.loads(text[start:end + 1])
+        parsed = {}
+        for item in payload.get('results', []):
+            if not isinstance(item, dict) or item.get('recommendation') not in VALID_RECOMMENDATIONS:
+                continue
+            parsed[item.get('symbol')] = item
+        return parsed
+
+    def _build_result(self, symbol: str, item: dict, market_data: dict, source: str) -> dict:
+        """분석 결과 딕셔너리 생성"""
         return {
             'symbol': symbol,
-            'price': 45000,
-            'volume': 1000000,
+            'analysis': item.get('analysis', ''),
+            'recommendation': item['recommendation'],
+            'confidence': item.get('confidence', 0),
+            'data': market_data,
+            'source': source,
             'timestamp': datetime.now().isoformat()
         }
@@ -0,0 +1,149 @@
+"""
+💾 Claude 응답 디스크 캐시
+- 프롬프트 + 모델 파라미터 해시를 키로 하는 내용 주소 기반 저장소
+- 단일 파일 추가 전용 레코드 + 메모리 인덱스, mmap 기반 읽기
+- 백테스트에서 기록된 모델 결정을 디스크 속도로 재생
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Any, Callable, Optional
+
+try:
+    from .futures_config import RESPONSE_CACHE
+except ImportError:
+    from futures_config import RESPONSE_CACHE
+
+MAGIC = b"CLRC0001"
+RECORD_HEADER = struct.Struct("<32sI")  # sha256 digest, payload 길이
+
+
+class ClaudeResponseCache:
+    """내용 주소 기반 단일 파일 응답 캐시"""
+
+    def __init__(self, path: str = None, fsync: bool = None):
+        # 미지정 값은 RESPONSE_CACHE 설정 사용
+        self.path = path or RESPONSE_CACHE["path"]
+        self.fsync = RESPONSE_CACHE["fsync"] if fsync is None else fsync
+        self.index = {}  # digest -> (payload offset, payload length)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._map = None
+        self._mapped_size = 0
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, 'a+b')
+        self._load_index()
+
+    @staticmethod
+    def make_key(prompt: str, **params) -> bytes:
+        """프롬프트와 모델 파라미터의 sha256 다이제스트"""
+        canonical = json.dumps({'prompt': prompt, 'params': params}, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).digest()
+
+    def _load_index(self):
+        """레코드 헤더만 순회하여 인덱스 구성 (잘린 마지막 레코드는 제거)"""
+        self._file.seek(0, os.SEEK_END)
+        size = self._file.tell()
+        if size == 0:
+            self._file.write(MAGIC)
+            self._file.flush()
+            return
+
+        self._file.seek(0)
+        if self._file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{self.path} is not a Claude response cache file")
+
+        offset = len(MAGIC)
+        while offset + RECORD_HEADER.size <= size:
+            self._file.seek(offset)
+            digest, length = RECORD_HEADER.unpack(self._file.read(RECORD_HEADER.size))
+            payload_offset = offset + RECORD_HEADER.size
+            if payload_offset + length > size:
+                break
+            self.index[digest] = (payload_offset, length)
+            offset = payload_offset + length
+
+        if offset < size:
+            print(f"Truncating incomplete cache record in {self.path} at offset {offset}")
+            self._file.truncate(offset)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if offset + length > self._mapped_size:
+            # 파일이 커졌으면 다시 매핑
+            if self._map is not None:
+                self._map.close()
+            self._file.flush()
+            self._mapped_size = os.fstat(self._file.fileno()).st_size
+            self._map = mmap.mmap(self._file.fileno(), self._mapped_size, access=mmap.ACCESS_READ)
+        return self._map[offset:offset + length]
+
+    def get(self, key: bytes) -> Optional[str]:
+        """캐시된 응답 조회"""
+        with self._lock:
+            location = self.index.get(key)
+            if location is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._read(*location).decode('utf-8')
+
+    def put(self, key: bytes, response: str):
+        """응답 저장 (파일 끝에 추가)"""
+        payload = response.encode('utf-8')
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(RECORD_HEADER.pack(key, len(payload)))
+            self._file.write(payload)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.index[key] = (offset + RECORD_HEADER.size, len(payload))
+
+    def get_or_call(self, prompt: str, params: Dict[str, Any], call_fn: Callable[[], str]) -> str:
+        """캐시 미스일 때만 모델 호출"""
+        key = self.make_key(prompt, **params)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        response = call_fn()
+        self.put(key, response)
+        return response
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        return {
+            'entries': len(self.index),
+            'hits': self.hits,
+            'misses': self.misses,
+            'file_size': os.path.getsize(self.path)
+        }
+
+    def close(self):
+        """파일 및 매핑 닫기"""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+                self._mapped_size = 0
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -152,3 +152,82 @@ RISK_MANAGEMENT = {
     "stop_loss": 0.02,
     "take_profit": 0.03
 }
+
+# 거래 신호 캐시 설정
+SIGNAL_CACHE = {
+    "max_size": 1024,
+    "ttl_seconds": 30.0,
+    "price_bucket_pct": 0.1,  # 가격 양자화 단위 (%)
+    "amount_step": 10.0,      # 주문 금액 양자화 단위
+    "history_size": 1000      # 요청 기록 링 버퍼 크기
+}
+
+# Claude 모델 호출 설정
+CLAUDE_MODEL_CONFIG = {
+    "model": "claude-3-5-sonnet-20241022",
+    "max_tokens": 2048,
+    "timeout": 30.0,
+    "max_retries": 2,
+    "batch_size": 25  # 요청 1회에 묶는 최대 심볼 수
+}
+
+# 비동기 신호 파이프라인 설정
+SIGNAL_PIPELINE = {
+    "deadline_seconds": 2.0,  # 틱당 모델 응답 대기 한도
+    "max_concurrency": 4,     # 동시 모델 호출 수
+    "late_result_ttl": 30.0   # 늦게 도착한 응답을 다음 틱에 사용할 수 있는 시간 (초)
+}
+
+# Claude 응답 디스크 캐시 설정 (백테스트 재생용)
+RESPONSE_CACHE = {
+    "path": "data/claude_responses.cache",
+    "fsync": False
+}
+
+# 비동기 다중 심볼 거래 엔진 설정
+TRADING_ENGINE = {
+    "tick_interval": 1.0,       # 심볼별 틱 주기 (초)
+    "tick_timeout_ratio": 0.9,  # 틱 주기 대비 한 틱의 최대 실행 시간
+    "signal_deadline_ratio": 0.5,  # 틱 주기 대비 모델 신호 대기 한도
+    "io_workers": 32,           # 블로킹 클라이언트 호출용 스레드 수
+    "default_amount": 1000.0
+}
+
+# 거래 저널 설정
+TRADE_JOURNAL = {
+    "tail_size": 1000,       # 메모리에 유지할 최근 항목 수
+    "index_interval": 256,   # 희소 시간 인덱스 간격 (레코드 수)
+    "fsync_batch": 64,       # fsync 전 최대 미동기화 레코드 수
+    "fsync_interval": 1.0    # fsync 최대 간격 (초)
+}
+
+# 로컬 포지션 관리 설정
+POSITION_KEEPER = {
+    "initial_balance": 10000.0,
+    "reconcile_interval": 30.0  # 거래소 포지션 대조 주기 (초)
+}
+
+# 타이밍 휠 스케줄러 설정
+TIMING_WHEEL = {
+    "tick_seconds": 0.1,          # 휠 한 칸의 시간
+    "wheel_bits": 8,              # 휠당 슬롯 수 = 2^8
+    "levels": 4,                  # 휠 단계 수 (최대 범위 = tick * 2^(bits*levels))
+    "funding_derisk_lead": 300.0, # 펀딩 시각 몇 초 전에 리스크 축소 작업 실행
+    "reconcile_interval": 30.0    # 주기적 대조 작업 간격 (초)
+}
+
+# 세션 모니터 설정
+SESSION_MONITOR = {
+    "check_interval": 5.0,      # 세션 점검 작업 주기 (초)
+    "session_timeout": 30.0,    # 마지막 하트비트 이후 만료까지 시간 (초)
+    "heartbeat_interval": 10.0, # 하트비트가 이보다 오래되면 상태 점검 대상
+    "probe_batch_size": 256,    # 배치당 점검 세션 수
+    "probe_workers": 16         # 동시 점검 스레드 수
+}
+
+# 거래량 프로파일 설정
+VOLUME_PROFILE = {
+    "directory": "data/volume_profiles",
+    "high_volume_ratio": 1.0,  # 평균 대비 거래량 비율이 이 이상이면 고거래량 슬롯
+    "min_samples": 4           # 슬롯별 최소 봉 수 (미만이면 고정 시간대 규칙 사용)
+}
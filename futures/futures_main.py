@@ -5,13 +5,25 @@
 - Claude AI 통합 거래 시스템
 """
 
+import asyncio
 import sys
 import os
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional
 
 # Import 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from claude_enhanced_trader import rule_based_signal
+from config_snapshot import init_config
+from futures_signal_cache import market_fingerprint
+from futures_config import RISK_MANAGEMENT, TRADE_JOURNAL
+from futures_signal_pipeline import DeadlineSignalPipeline
+from futures_trade_journal import TradeJournal, to_epoch
+from risk_engine import PreTradeRiskEngine
+from tracing import TRACER
 
 # The edited snippet seems to be a complete replacement for the FuturesTrader class
 # and introduces its own imports. We will ensure the necessary imports are present
@@ -26,11 +38,25 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 class FuturesTrader:
     """선물 거래 메인 클래스"""
 
-    def __init__(self, claude_client=None, mcp_client=None, claude_api_key=None):
+    def __init__(self, claude_client=None, mcp_client=None, claude_api_key=None, signal_pipeline=None,
+                 journal: Optional[TradeJournal] = None, risk_engine: Optional[PreTradeRiskEngine] = None):
         self.claude_client = claude_client
         self.mcp_client = mcp_client
         self.claude_api_key = claude_api_key
-        self.trading_history = []
+        # 최근 거래만 메모리에 유지, 전체 기록은 저널(있는 경우)에 저장
+        self.journal = journal
+        self.trading_history = journal.tail if journal is not None else deque(maxlen=TRADE_JOURNAL["tail_size"])
+
+        # 모델 응답 마감 시간 관리 (초과 시 규칙 기반 신호 사용)
+        self.signal_pipeline = signal_pipeline or DeadlineSignalPipeline()
+
+        # 주문 전 리스크 검사 (계정 잔고를 자기자본으로 사용)
+        if risk_engine is None:
+            equity = 10000.0
+            if mcp_client is not None and hasattr(mcp_client, 'get_account_info'):
+                equity = mcp_client.get_account_info().get('balance', equity)
+            risk_engine = PreTradeRiskEngine(RISK_MANAGEMENT, equity=equity)
+        self.risk_engine = risk_engine
 
         # Enhanced trader 초기화
         if claude_api_key and mcp_client:
@@ -57,73 +83,146 @@ class FuturesTrader:
         try:
             print(f"Executing futures trading strategy for {symbol} with amount ${amount}")
 
-            # 시장 데이터 가져오기
-            if self.mcp_client:
-                market_data = self.mcp_client.get_market_data(symbol)
-            else:
-                # Default market data if client is not available
-                market_data = {'price': 50000, 'volume': 1000}
-
-            # 거래 신호 생성
-            if self.claude_client:
-                # Assuming generate_trading_signal returns a dict like {'action': 'BUY', 'confidence': 90}
-                signal = self.claude_client.generate_trading_signal(symbol, amount)
-            else:
-                # Default signal if client is not available
-                signal = {'action': 'HOLD', 'confidence': 50}
+            with TRACER.span('futures.tick'):
+                # 시장 데이터 가져오기
+                with TRACER.span('futures.market_data'):
+                    if self.mcp_client:
+                        market_data = self.mcp_client.get_market_data(symbol)
+                    else:
+                        # Default market data if client is not available
+                        market_data = {'price': 50000, 'volume': 1000}
+
+                # 거래 신호 생성
+                with TRACER.span('futures.signal'):
+                    if self.claude_client:
+                        # Assuming generate_trading_signal returns a dict like {'action': 'BUY', 'confidence': 90}
+                        signal = self.signal_pipeline.get_signal_blocking(
+                            market_fingerprint(symbol, amount, market_data),
+                            lambda: self.claude_client.generate_trading_signal(symbol, amount, market_data),
+                            lambda: rule_based_signal(symbol, market_data)
+                        )
+                    else:
+                        # Default signal if client is not available
+                        signal = {'action': 'HOLD', 'confidence': 50}
+
+                return self._record_trade(symbol, amount, market_data, signal)
 
-            # 거래 실행 시뮬레이션 (This part is a simulation as per the snippet)
-            trade_result = {
+        except Exception as e:
+            error_result = {
                 'symbol': symbol,
                 'amount': amount,
-                'market_data': market_data,
-                'signal': signal,
-                'executed': True, # Assuming simulation means it's 'executed' in a simulated sense
-                'timestamp': datetime.now().isoformat(),
-                'success': True
+                'error': str(e),
+                'success': False,
+                'timestamp': datetime.now().isoformat()
             }
+            print(f"Error in execute_futures_trading_strategy: {e}") # Added print for error visibility
+            return error_result
 
-            # Store in history
-            self.trading_history.append(trade_result)
-            return trade_result
+    async def execute_futures_trading_strategy_async(self, symbol: str, amount: float,
+                                                     signal_deadline: Optional[float] = None) -> Dict[str, Any]:
+        """기본 선물 거래 전략 실행 (비동기 엔진용 - 이벤트 루프를 막지 않음)"""
+        try:
+            with TRACER.span('futures.tick'):
+                with TRACER.span('futures.market_data'):
+                    if self.mcp_client:
+                        market_data = await asyncio.to_thread(self.mcp_client.get_market_data, symbol)
+                    else:
+                        market_data = {'price': 50000, 'volume': 1000}
+
+                with TRACER.span('futures.signal'):
+                    if self.claude_client:
+                        signal = await self.signal_pipeline.get_signal(
+                            market_fingerprint(symbol, amount, market_data),
+                            lambda: self.claude_client.generate_trading_signal(symbol, amount, market_data),
+                            lambda: rule_based_signal(symbol, market_data),
+                            deadline=signal_deadline
+                        )
+                    else:
+                        signal = {'action': 'HOLD', 'confidence': 50}
+
+                return self._record_trade(symbol, amount, market_data, signal)
 
         except Exception as e:
-            error_result = {
+            return {
                 'symbol': symbol,
                 'amount': amount,
                 'error': str(e),
                 'success': False,
                 'timestamp': datetime.now().isoformat()
             }
-            print(f"Error in execute_futures_trading_strategy: {e}") # Added print for error visibility
-            return error_result
 
-    def execute_intelligent_trading_strategy(self, symbol: str) -> Dict[str, Any]:
-        """지능형 거래 전략 실행"""
+    def _record_trade(self, symbol: str, amount: float, market_data: Dict[str, Any],
+                      signal: Dict[str, Any]) -> Dict[str, Any]:
+        """거래 결과 생성 및 기록"""
+        price = market_data.get('price', 0)
+        action = str(signal.get('action', 'HOLD')).upper()
+        risk_check = None
+        with TRACER.span('futures.risk_check'):
+            self.risk_engine.on_price(symbol, price)
+            if action in ('BUY', 'SELL') and price:
+                risk_check = self.risk_engine.check_order(symbol, action, amount / price, price)
+
+        # 거래 실행 시뮬레이션 (This part is a simulation as per the snippet)
+        with TRACER.span('futures.order'):
+            executed = risk_check is None or risk_check['allowed']
+            if risk_check is not None and executed:
+                self.risk_engine.on_fill(symbol, action, amount / price, price)
+            trade_result = {
+                'symbol': symbol,
+                'amount': amount,
+                'market_data': market_data,
+                'signal': signal,
+                'executed': executed, # Assuming simulation means it's 'executed' in a simulated sense
+                'timestamp': datetime.now().isoformat(),
+                'success': True
+            }
+            if not executed:
+                trade_result['risk_rejection'] = risk_check['reason']
+
+            # Store in history
+            if self.journal is not None:
+                self.journal.append(trade_result)
+            else:
+                self.trading_history.append(trade_result)
+        return trade_result
+
+    def execute_intelligent_trading_strategy(self, symbol: str, include_narrative: bool = True) -> Dict[str, Any]:
+        """지능형 거래 전략 실행 (해석 텍스트가 필요 없으면 include_narrative=False로 렌더링 생략)"""
         try:
             if self.enhanced_trader:
-                # Assuming enhanced_trader has these methods
-                analysis = self.enhanced_trader.get_intelligent_trading_signal(symbol)
-                narrative = self.enhanced_trader.get_market_narrative(symbol)
-
-                return {
+                # 틱당 한 번만 시장 데이터/포지션/계정을 수집하여 모든 분석에 공유
+                with TRACER.span('futures.market_data'):
+                    snapshot = self.enhanced_trader.capture_snapshot(symbol)
+                with TRACER.span('futures.signal'):
+                    # 늦은 응답은 같은 가격/거래량 버킷의 다음 틱에만 재사용 (기본 경로 키와 구분)
+                    analysis = self.signal_pipeline.get_signal_blocking(
+                        ('intelligent',) + market_fingerprint(symbol, 0, snapshot.market_data),
+                        lambda: self.enhanced_trader.get_intelligent_trading_signal(symbol, snapshot),
+                        lambda: rule_based_signal(symbol, snapshot.market_data)
+                    )
+                result = {
                     'success': True,
                     'analysis': analysis,
-                    'narrative': narrative,
                     'timestamp': datetime.now().isoformat()
                 }
+                if include_narrative:
+                    # 해석도 같은 스냅샷으로 렌더링
+                    result['narrative'] = self.enhanced_trader.get_market_narrative(symbol, snapshot)
+                return result
             else:
                 # Fallback analysis if enhanced_trader is not available
-                return {
+                result = {
                     'success': True,
                     'analysis': {
                         'action': 'HOLD',
                         'confidence': 60,
                         'reasoning': 'Basic analysis - Enhanced trader not available'
                     },
-                    'narrative': f"Basic market analysis for {symbol}",
                     'timestamp': datetime.now().isoformat()
                 }
+                if include_narrative:
+                    result['narrative'] = f"Basic market analysis for {symbol}"
+                return result
 
         except Exception as e:
             print(f"Error in execute_intelligent_trading_strategy: {e}") # Added print for error visibility
@@ -146,18 +245,31 @@ class FuturesTrader:
             print(f"Error generating market intelligence report for {symbol}: {e}") # Added print for error visibility
             return f"Intelligence report generation failed: {e}"
 
-    def get_trading_history(self) -> list:
-        """거래 기록 반환"""
+    def get_trading_history(self, start=None, end=None) -> list:
+        """거래 기록 반환 (start/end 지정 시 저널에서 해당 시간 범위만 조회)"""
         # This method was added in the edited snippet
-        return self.trading_history
+        if start is None and end is None:
+            return list(self.trading_history)
+        if self.journal is not None:
+            return self.journal.read_range(start, end)
+
+        start_ts, end_ts = to_epoch(start), to_epoch(end)
+        return [
+            entry for entry in self.trading_history
+            if (start_ts is None or to_epoch(entry['timestamp']) >= start_ts)
+            and (end_ts is None or to_epoch(entry['timestamp']) <= end_ts)
+        ]
 
 # The original main function and dummy clients are preserved.
 def main():
     """메인 실행 함수"""
     try:
+        # 설정 스냅샷은 시작 시 한 번 검증/생성
+        init_config()
+
         # 클라이언트 초기화 (Dummy clients from original __main__ block)
         class DummyFuturesClaudeClient:
-            def generate_trading_signal(self, symbol: str, amount: float) -> Dict[str, Any]:
+            def generate_trading_signal(self, symbol: str, amount: float, market_data: dict = None) -> Dict[str, Any]:
                 print(f"[DummyFuturesClaudeClient] Generating signal for {symbol} with amount {amount}")
                 if amount > 1000:
                     return {"action": "BUY", "confidence": 95}
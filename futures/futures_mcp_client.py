@@ -1,14 +1,34 @@
+import os
+import sys
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import random
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from position_keeper import PositionKeeper
+
+try:
+    from .futures_config import FUTURES_TRADING_CONFIG, POSITION_KEEPER
+except ImportError:
+    from futures_config import FUTURES_TRADING_CONFIG, POSITION_KEEPER
+
 class FuturesMCPClient:
     """Futures MCP 클라이언트"""
 
-    def __init__(self, api_key: str = "test_api", api_secret: str = "test_secret"):
+    def __init__(self, api_key: str = "test_api", api_secret: str = "test_secret",
+                 position_keeper: Optional[PositionKeeper] = None):
         self.api_key = api_key
         self.api_secret = api_secret
         self.connected = True
+        # 포지션/계정은 로컬에서 관리하고 거래소와는 주기적으로만 대조
+        self.position_keeper = position_keeper or PositionKeeper(
+            initial_balance=POSITION_KEEPER["initial_balance"],
+            leverage=FUTURES_TRADING_CONFIG["default_leverage"],
+            commission_rate=FUTURES_TRADING_CONFIG["commission_rate"],
+            reconcile_interval=POSITION_KEEPER["reconcile_interval"]
+        )
+        self._venue_positions = {}  # 시뮬레이션 거래소 측 포지션 장부
 
     def get_market_data(self, symbol: str) -> Dict[str, Any]:
         """시장 데이터 조회"""
@@ -28,6 +48,7 @@ class FuturesMCPClient:
                 'timestamp': datetime.now().isoformat()
             }
 
+            self.position_keeper.update_mark(symbol, market_data['price'])
             return market_data
 
         except Exception as e:
@@ -38,18 +59,10 @@ class FuturesMCPClient:
             }
 
     def get_position(self, symbol: str) -> Dict[str, Any]:
-        """포지션 정보 조회"""
+        """포지션 정보 조회 (로컬 상태, 네트워크 왕복 없음)"""
         try:
-            position = {
-                'symbol': symbol,
-                'size': 0.0,  # 기본적으로 포지션 없음
-                'entry_price': 0.0,
-                'mark_price': self.get_market_data(symbol)['price'],
-                'unrealized_pnl': 0.0,
-                'timestamp': datetime.now().isoformat()
-            }
-
-            return position
+            self.position_keeper.maybe_reconcile(self._fetch_venue_positions)
+            return self.position_keeper.get_position(symbol)
 
         except Exception as e:
             return {
@@ -71,6 +84,8 @@ class FuturesMCPClient:
                 'timestamp': datetime.now().isoformat()
             }
 
+            self.position_keeper.apply_fill(symbol, side, amount, order['price'])
+            self._record_venue_fill(symbol, side, amount, order['price'])
             return order
 
         except Exception as e:
@@ -80,20 +95,23 @@ class FuturesMCPClient:
             }
 
     def get_account_info(self) -> Dict[str, Any]:
-        """계정 정보 조회"""
+        """계정 정보 조회 (체결과 표시 가격으로 계산)"""
         try:
-            account = {
-                'balance': 10000.0,
-                'available_balance': 9000.0,
-                'margin_used': 1000.0,
-                'positions': [],
-                'timestamp': datetime.now().isoformat()
-            }
-
-            return account
+            self.position_keeper.maybe_reconcile(self._fetch_venue_positions)
+            return self.position_keeper.get_account_info()
 
         except Exception as e:
             return {
                 'error': str(e),
                 'balance': 0
-            }
\ No newline at end of file
+            }
+
+    def _record_venue_fill(self, symbol: str, side: str, amount: float, price: float):
+        """시뮬레이션 거래소 장부 갱신"""
+        venue = self._venue_positions.setdefault(symbol, {'size': 0.0, 'entry_price': price})
+        venue['size'] += amount if side.upper() in ('BUY', 'LONG') else -amount
+        venue['entry_price'] = price
+
+    def _fetch_venue_positions(self) -> Dict[str, Dict[str, float]]:
+        """거래소 포지션 조회 (주기적 대조용)"""
+        return {symbol: dict(position) for symbol, position in self._venue_positions.items()}
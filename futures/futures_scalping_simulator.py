@@ -0,0 +1,159 @@
+"""
+⚡ 틱 단위 스캘핑 시뮬레이터
+- SCALPING_MODE 규칙 적용: 보유 시간 초과 청산, 익절/손절 임계값 청산, 동시 포지션 수 제한
+- 열린 포지션은 고정 크기 numpy 배열(슬롯)에 보관
+- 청산 시점은 힙으로 관리하여 진입 신호가 있는 틱만 순회
+- 각 포지션의 청산 틱은 보유 구간을 청크 단위로 벡터 탐색
+"""
+
+import heapq
+import os
+import sys
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_snapshot import get_config
+
+EXIT_TAKE_PROFIT = 0
+EXIT_STOP_LOSS = 1
+EXIT_TIMEOUT = 2
+EXIT_END_OF_DATA = 3
+EXIT_REASONS = ('take_profit', 'stop_loss', 'timeout', 'end_of_data')
+
+TRADE_DTYPE = np.dtype([
+    ('entry_index', np.int64), ('exit_index', np.int64), ('side', np.int8),
+    ('entry_price', np.float64), ('exit_price', np.float64), ('hold_seconds', np.float64),
+    ('pnl', np.float64), ('reason', np.int8)
+])
+
+
+class ScalpingSimulator:
+    """틱/체결 단위 스캘핑 규칙 시뮬레이터"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, fee_rate: float = None,
+                 notional: float = 1000.0, scan_chunk: int = 4096):
+        # 명시한 값만 고정, 나머지는 run() 시점의 설정 스냅샷을 따름 (설정 재적재 반영)
+        self.overrides = dict(config or {})
+        self.fee_override = fee_rate
+        self.notional = notional
+        self.scan_chunk = scan_chunk
+        self._snapshot = None
+        self._apply_config(get_config())
+
+    def _apply_config(self, snapshot):
+        config = dict(snapshot.futures["SCALPING_MODE"], **self.overrides)
+        self.max_positions = config.get("max_positions", 3)
+        self.max_hold_time = config.get("max_hold_time", 300)
+        self.quick_exit_threshold = config.get("quick_exit_threshold", 0.005)
+        self.stop_loss = config.get("stop_loss", 0.02)
+        self.min_profit = config.get("min_profit", 0.001)
+        fee_rate = self.fee_override
+        self.fee_rate = snapshot.futures["FEES"].get("taker", 0.0004) if fee_rate is None else fee_rate
+
+        # 익절은 왕복 수수료를 빼고도 min_profit 이상 남는 수준에서만 실행
+        self.take_profit = max(self.quick_exit_threshold, self.min_profit + 2 * self.fee_rate)
+
+        # 열린 포지션 슬롯 (동시 포지션 수 제한만큼만 할당)
+        self.slot_side = np.zeros(self.max_positions, dtype=np.int8)
+        self.slot_entry_index = np.full(self.max_positions, -1, dtype=np.int64)
+        self.slot_entry_price = np.zeros(self.max_positions)
+        self._snapshot = snapshot
+
+    def _find_exit(self, timestamps: np.ndarray, prices: np.ndarray, entry: int, side: int):
+        """진입 이후 첫 청산 틱과 사유 탐색 (청크 단위 벡터 연산)"""
+        entry_price = prices[entry]
+        deadline = np.searchsorted(timestamps, timestamps[entry] + self.max_hold_time, side='left')
+        last = len(prices) - 1
+        end = min(deadline, last)
+        upper = entry_price * (1 + self.take_profit if side > 0 else 1 + self.stop_loss)
+        lower = entry_price * (1 - self.stop_loss if side > 0 else 1 - self.take_profit)
+
+        start = entry + 1
+        while start <= end:
+            stop = min(start + self.scan_chunk, end + 1)
+            window = prices[start:stop]
+            hits = np.flatnonzero((window >= upper) | (window <= lower))
+            if hits.size:
+                index = start + int(hits[0])
+                profit_hit = prices[index] >= upper if side > 0 else prices[index] <= lower
+                return index, EXIT_TAKE_PROFIT if profit_hit else EXIT_STOP_LOSS
+            start = stop
+
+        if deadline <= last:
+            return deadline, EXIT_TIMEOUT
+        return last, EXIT_END_OF_DATA
+
+    def run(self, timestamps, prices, signals) -> Dict[str, Any]:
+        """틱 스트림 시뮬레이션 (signals: +1 롱 진입, -1 숏 진입, 0 없음)"""
+        snapshot = get_config()
+        if snapshot is not self._snapshot:
+            self._apply_config(snapshot)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        signals = np.asarray(signals)
+
+        self.slot_side[:] = 0
+        self.slot_entry_index[:] = -1
+        free_slots = list(range(self.max_positions))
+        exits = []  # (청산 틱, 순번, 슬롯, 사유) 최소 힙
+        trades = []
+        rejected = 0
+        max_open = 0
+
+        def close(exit_index: int, slot: int, reason: int):
+            side = int(self.slot_side[slot])
+            entry_index = int(self.slot_entry_index[slot])
+            entry_price = self.slot_entry_price[slot]
+            exit_price = prices[exit_index]
+            gross = side * (exit_price / entry_price - 1)
+            pnl = self.notional * (gross - 2 * self.fee_rate)
+            trades.append((entry_index, exit_index, side, entry_price, exit_price,
+                           timestamps[exit_index] - timestamps[entry_index], pnl, reason))
+            self.slot_side[slot] = 0
+            self.slot_entry_index[slot] = -1
+            free_slots.append(slot)
+
+        for entry in np.flatnonzero(signals):
+            entry = int(entry)
+            while exits and exits[0][0] <= entry:
+                exit_index, _, slot, reason = heapq.heappop(exits)
+                close(exit_index, slot, reason)
+
+            if not free_slots:
+                rejected += 1
+                continue
+
+            side = 1 if signals[entry] > 0 else -1
+            slot = free_slots.pop()
+            self.slot_side[slot] = side
+            self.slot_entry_index[slot] = entry
+            self.slot_entry_price[slot] = prices[entry]
+            exit_index, reason = self._find_exit(timestamps, prices, entry, side)
+            heapq.heappush(exits, (exit_index, entry, slot, reason))
+            max_open = max(max_open, self.max_positions - len(free_slots))
+
+        while exits:
+            exit_index, _, slot, reason = heapq.heappop(exits)
+            close(exit_index, slot, reason)
+
+        return self._summarize(np.array(trades, dtype=TRADE_DTYPE), rejected, max_open, len(prices))
+
+    def _summarize(self, trades: np.ndarray, rejected: int, max_open: int, ticks: int) -> Dict[str, Any]:
+        pnl = trades['pnl']
+        return {
+            'ticks': ticks,
+            'trades': trades,
+            'trade_count': len(trades),
+            'rejected_entries': rejected,
+            'max_open_positions': max_open,
+            'total_pnl': float(pnl.sum()),
+            'win_rate': float((pnl > 0).mean()) if len(trades) else 0.0,
+            'avg_hold_seconds': float(trades['hold_seconds'].mean()) if len(trades) else 0.0,
+            'exits': {
+                name: int((trades['reason'] == code).sum())
+                for code, name in enumerate(EXIT_REASONS)
+            }
+        }
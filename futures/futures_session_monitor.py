@@ -1,32 +1,232 @@
+import heapq
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from instrumentation import MetricsRegistry
+
+try:
+    from .futures_config import SESSION_MONITOR
+    from .futures_timing_wheel import HierarchicalTimingWheel
+except ImportError:
+    from futures_config import SESSION_MONITOR
+    from futures_timing_wheel import HierarchicalTimingWheel
+
+
+class SessionRecord:
+    """모니터링 중인 세션 상태"""
+
+    __slots__ = ('session_id', 'data', 'last_heartbeat', 'expires_at', 'timeout', 'probe_failures',
+                 'expiry_entry', 'probe_entry')
+
+    def __init__(self, session_id, data, now, timeout):
+        self.session_id = session_id
+        self.data = data
+        self.last_heartbeat = now
+        self.timeout = timeout
+        self.expires_at = now + timeout
+        self.probe_failures = 0
+        # 힙에 남아 있는 유효 항목의 순번 (다른 순번의 항목은 대체된 것으로 보고 버림)
+        self.expiry_entry = None
+        self.probe_entry = None
+
+    def to_dict(self):
+        return {
+            'session_id': self.session_id,
+            'data': self.data,
+            'last_heartbeat': self.last_heartbeat,
+            'expires_at': self.expires_at,
+            'probe_failures': self.probe_failures
+        }
+
+
 class FuturesSessionMonitor:
-    def __init__(self, session_manager):
+    def __init__(self, session_manager, wheel=None, clock=time.monotonic, metrics=None, on_expire=None):
         self.session_manager = session_manager
-        self.active_sessions = {}
+        self.active_sessions = {}  # session_id -> SessionRecord
+        # 세션 점검은 공용 타이밍 휠에서 실행 (세션별 스레드 없음)
+        self.wheel = wheel if wheel is not None else HierarchicalTimingWheel()
+        self._owns_wheel = wheel is None  # 주입된 휠은 다른 작업(펀딩/대사)과 공유하므로 멈추지 않음
+        self.clock = clock
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self.on_expire = on_expire
+        self._check_timer = None
+        # (시각, 순번, session_id) 최소 힙 - 세션당 유효 항목 1개, 하트비트 갱신은 지연 삭제로 처리
+        self._expiry_heap = []
+        self._probe_heap = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._executor = None
 
-    def start_monitoring(self):
+    def start_monitoring(self, check_interval=None):
         print("Starting futures session monitoring...")
-        # In a real scenario, this would involve background threads or scheduled tasks
-        # For demonstration, we'll simulate checking sessions periodically
+        interval = check_interval or SESSION_MONITOR["check_interval"]
+        if self._check_timer is not None:
+            self.wheel.cancel(self._check_timer)
+        self._check_timer = self.wheel.schedule(
+            interval, self.check_due_sessions, interval=interval, name="session_check"
+        )
+        self.wheel.start()
 
-    def check_session(self, session_id):
-        if session_id in self.active_sessions:
-            session_info = self.active_sessions[session_id]
-            print(f"Checking session {session_id}: {session_info}")
-            # Add logic here to check session status, e.g., heartbeat, expiration
-        else:
-            print(f"Session {session_id} not found for monitoring.")
+    def _push(self, heap, due, session_id):
+        self._sequence += 1
+        heapq.heappush(heap, (due, self._sequence, session_id))
+        return self._sequence
+
+    def add_session(self, session_id, session_data, timeout=None):
+        with self._lock:
+            record = SessionRecord(session_id, session_data, self.clock(),
+                                   timeout or SESSION_MONITOR["session_timeout"])
+            self.active_sessions[session_id] = record
+            record.expiry_entry = self._push(self._expiry_heap, record.expires_at, session_id)
+            record.probe_entry = self._push(self._probe_heap,
+                                            record.last_heartbeat + SESSION_MONITOR["heartbeat_interval"], session_id)
+        self.metrics.inc("session_added_total")
+        return record
 
-    def add_session(self, session_id, session_data):
-        self.active_sessions[session_id] = session_data
-        print(f"Added session {session_id} for monitoring.")
+    def heartbeat(self, session_id, now=None):
+        """하트비트 기록 (힙은 건드리지 않고 만료 시각만 연장)"""
+        record = self.active_sessions.get(session_id)
+        if record is None:
+            self.metrics.inc("session_heartbeat_unknown_total")
+            return False
+        record.last_heartbeat = self.clock() if now is None else now
+        record.expires_at = record.last_heartbeat + record.timeout
+        record.probe_failures = 0
+        return True
 
     def remove_session(self, session_id):
-        if session_id in self.active_sessions:
-            del self.active_sessions[session_id]
-            print(f"Removed session {session_id} from monitoring.")
-        else:
-            print(f"Session {session_id} not found for removal.")
+        with self._lock:
+            removed = self.active_sessions.pop(session_id, None)
+        self.metrics.inc("session_removed_total" if removed else "session_remove_unknown_total")
+        return removed is not None
+
+    def check_session(self, session_id):
+        """단일 세션 상태 조회"""
+        record = self.active_sessions.get(session_id)
+        if record is None:
+            self.metrics.inc("session_check_unknown_total")
+            return None
+        return record.to_dict()
+
+    def expire_due_sessions(self, now=None):
+        """만료 시각이 지난 세션만 힙에서 꺼내 만료 처리"""
+        now = self.clock() if now is None else now
+        expired = []
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                _, sequence, session_id = heapq.heappop(heap)
+                record = self.active_sessions.get(session_id)
+                if record is None or record.expiry_entry != sequence:
+                    continue  # 이미 제거되었거나 재등록으로 대체된 항목
+                if record.expires_at > now:
+                    # 하트비트로 연장된 세션은 새 만료 시각으로 재등록
+                    record.expiry_entry = self._push(heap, record.expires_at, session_id)
+                    continue
+                del self.active_sessions[session_id]
+                expired.append(record)
+
+        if expired:
+            self.metrics.inc("session_expired_total", amount=len(expired))
+            if self.on_expire is not None:
+                for record in expired:
+                    self.on_expire(record)
+        return [record.session_id for record in expired]
+
+    def stale_sessions(self, now=None):
+        """하트비트가 heartbeat_interval보다 오래된 세션 (점검 시각이 된 세션만 힙에서 꺼냄)"""
+        now = self.clock() if now is None else now
+        interval = SESSION_MONITOR["heartbeat_interval"]
+        stale = []
+        with self._lock:
+            heap = self._probe_heap
+            while heap and heap[0][0] <= now:
+                _, sequence, session_id = heapq.heappop(heap)
+                record = self.active_sessions.get(session_id)
+                if record is None or record.probe_entry != sequence:
+                    continue
+                if record.last_heartbeat + interval <= now:
+                    stale.append(session_id)
+                    record.probe_entry = self._push(heap, now + interval, session_id)
+                else:
+                    record.probe_entry = self._push(heap, record.last_heartbeat + interval, session_id)
+        return stale
+
+    def probe_sessions(self, session_ids):
+        """세션 상태를 배치 단위로 동시 점검, 응답한 세션은 하트비트 갱신"""
+        if not session_ids:
+            return {}
+        batch_probe = getattr(self.session_manager, 'probe_sessions', None)
+        single_probe = getattr(self.session_manager, 'probe_session', None)
+        if batch_probe is None and single_probe is None:
+            return {}
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=SESSION_MONITOR["probe_workers"], thread_name_prefix="session-probe"
+            )
+        batch_size = SESSION_MONITOR["probe_batch_size"]
+        batches = [session_ids[i:i + batch_size] for i in range(0, len(session_ids), batch_size)]
+
+        def run_batch(batch):
+            started = time.perf_counter()
+            try:
+                if batch_probe is not None:
+                    healthy = batch_probe(batch)
+                else:
+                    healthy = {sid: bool(single_probe(sid)) for sid in batch}
+            except Exception:
+                self.metrics.inc("session_probe_batches_total", (("outcome", "error"),))
+                healthy = {sid: False for sid in batch}
+            else:
+                self.metrics.inc("session_probe_batches_total", (("outcome", "ok"),))
+            self.metrics.observe("session_probe_batch_latency_us", (), (time.perf_counter() - started) * 1e6)
+            return healthy
+
+        results = {}
+        for healthy in self._executor.map(run_batch, batches):
+            results.update(healthy)
+
+        now = self.clock()
+        alive = 0
+        for session_id, ok in results.items():
+            if ok:
+                alive += self.heartbeat(session_id, now)
+            else:
+                record = self.active_sessions.get(session_id)
+                if record is not None:
+                    record.probe_failures += 1
+        self.metrics.inc("session_probes_total", (("outcome", "healthy"),), alive)
+        self.metrics.inc("session_probes_total", (("outcome", "unhealthy"),), len(results) - alive)
+        return results
+
+    def check_due_sessions(self):
+        """주기 점검: 만료 처리 후 하트비트가 오래된 세션만 점검"""
+        started = time.perf_counter()
+        expired = self.expire_due_sessions()
+        probed = self.probe_sessions(self.stale_sessions())
+        self.metrics.observe("session_check_latency_us", (), (time.perf_counter() - started) * 1e6)
+        return {'expired': expired, 'probed': len(probed), 'active': len(self.active_sessions)}
+
+    def get_metrics(self):
+        """세션 지표 (JSON 직렬화 가능)"""
+        return dict(self.metrics.to_dict(), active_sessions=len(self.active_sessions))
 
     def stop_monitoring(self):
         print("Stopping futures session monitoring.")
-        self.active_sessions = {}
\ No newline at end of file
+        if self._check_timer is not None:
+            self.wheel.cancel(self._check_timer)
+            self._check_timer = None
+        if self._owns_wheel:
+            self.wheel.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.active_sessions = {}
+        self._expiry_heap = []
+        self._probe_heap = []
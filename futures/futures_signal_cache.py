@@ -0,0 +1,104 @@
+"""
+🗃️ 거래 신호 캐시
+- 양자화된 시장 상태 지문(fingerprint)을 키로 사용
+- TTL 만료 + LRU 제거, 적중/미스 카운터
+"""
+
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+try:
+    from .futures_config import SIGNAL_CACHE
+except ImportError:
+    from futures_config import SIGNAL_CACHE
+
+
+def _log_bucket(value: float, step_pct: float) -> int:
+    """값을 상대 간격(step_pct %) 버킷 번호로 변환"""
+    if value <= 0:
+        return 0
+    return int(math.log(value) / math.log1p(step_pct / 100.0))
+
+
+def market_fingerprint(symbol: str, amount: float, market_data: Optional[Dict[str, Any]] = None,
+                       price_bucket_pct: float = None, amount_step: float = None) -> tuple:
+    """시장 상태 지문 생성 - 같은 버킷 안의 미세한 변동은 같은 키가 됨"""
+    price_bucket_pct = price_bucket_pct or SIGNAL_CACHE["price_bucket_pct"]
+    amount_step = amount_step or SIGNAL_CACHE["amount_step"]
+
+    key = (symbol, int(round(amount / amount_step)))
+    if market_data:
+        key += (
+            _log_bucket(market_data.get('price', 0), price_bucket_pct),
+            _log_bucket(market_data.get('volume', 0), 10.0),
+        )
+    return key
+
+
+class SignalCache:
+    """시장 상태 키 기반 신호 캐시 (TTL + LRU)"""
+
+    def __init__(self, max_size: int = None, ttl_seconds: float = None, clock=time.monotonic):
+        self.max_size = max_size or SIGNAL_CACHE["max_size"]
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else SIGNAL_CACHE["ttl_seconds"]
+        self.clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (만료된 항목은 제거)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if self.clock() >= expires_at:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value: Dict[str, Any]):
+        """캐시 저장 (용량 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        self._entries[key] = (self.clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key) -> Optional[Dict[str, Any]]:
+        """조회 후 제거 (1회용 항목)"""
+        value = self.get(key)
+        if value is not None:
+            del self._entries[key]
+        return value
+
+    def clear(self):
+        """캐시 비우기"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
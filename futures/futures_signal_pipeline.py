@@ -0,0 +1,111 @@
+"""
+⏱️ 마감 시간 기반 비동기 신호 파이프라인
+- 동시 모델 호출 수 제한 (세마포어)
+- 틱당 응답 마감 시간 초과 시 규칙 기반 신호로 대체
+- 마감 이후 도착한 응답은 캐시에 저장하여 다음 틱에 사용
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from typing import Dict, Any, Callable, Hashable
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from instrumentation import LLM_METRICS
+
+try:
+    from .futures_config import SIGNAL_PIPELINE
+    from .futures_signal_cache import SignalCache
+except ImportError:
+    from futures_config import SIGNAL_PIPELINE
+    from futures_signal_cache import SignalCache
+
+
+class DeadlineSignalPipeline:
+    """마감 시간이 있는 비동기 신호 파이프라인"""
+
+    def __init__(self, deadline_seconds: float = None, max_concurrency: int = None,
+                 late_results: SignalCache = None):
+        self.deadline_seconds = deadline_seconds or SIGNAL_PIPELINE["deadline_seconds"]
+        self.max_concurrency = max_concurrency or SIGNAL_PIPELINE["max_concurrency"]
+        self.late_results = late_results if late_results is not None else SignalCache(
+            ttl_seconds=SIGNAL_PIPELINE["late_result_ttl"]
+        )
+        self.stats = {'model': 0, 'fallback': 0, 'late_cached': 0, 'late_used': 0, 'errors': 0}
+
+        self._semaphores = {}  # 이벤트 루프별 세마포어
+        self._in_flight = {}   # key -> 진행 중인 모델 호출 Task
+        self._loop = None
+        self._loop_thread = None
+
+    async def get_signal(self, key: Hashable, model_fn: Callable[[], Dict[str, Any]],
+                         fallback_fn: Callable[[], Dict[str, Any]], deadline: float = None) -> Dict[str, Any]:
+        """마감 시간 안에 모델 신호를, 초과 시 규칙 기반 신호를 반환"""
+        late = self.late_results.pop(key)
+        if late is not None:
+            self.stats['late_used'] += 1
+            return dict(late, source='model_late')
+
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not loop:
+            # 같은 키의 호출이 진행 중이면 새로 요청하지 않고 합류
+            task = loop.create_task(self._call_model(key, model_fn))
+            self._in_flight[key] = task
+
+        try:
+            signal = await asyncio.wait_for(asyncio.shield(task), timeout=deadline or self.deadline_seconds)
+            self.stats['model'] += 1
+            return dict(signal, source='model')
+        except asyncio.TimeoutError:
+            task.add_done_callback(lambda t: self._store_late_result(key, t))
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"Signal model error for {key}: {e}")
+
+        self.stats['fallback'] += 1
+        return dict(fallback_fn(), source='rule_based')
+
+    async def _call_model(self, key: Hashable, model_fn: Callable):
+        semaphore = self._semaphores.get(asyncio.get_running_loop())
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[asyncio.get_running_loop()] = semaphore
+
+        queued_at = time.perf_counter()
+        try:
+            async with semaphore:
+                LLM_METRICS.record_queue_wait('signal_pipeline', time.perf_counter() - queued_at)
+                if asyncio.iscoroutinefunction(model_fn):
+                    return await model_fn()
+                return await asyncio.to_thread(model_fn)
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _store_late_result(self, key: Hashable, task: asyncio.Task):
+        if task.cancelled() or task.exception() is not None:
+            return
+        self.late_results.put(key, task.result())
+        self.stats['late_cached'] += 1
+
+    def get_signal_blocking(self, key: Hashable, model_fn: Callable[[], Dict[str, Any]],
+                            fallback_fn: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """동기 호출자용 - 백그라운드 이벤트 루프에서 get_signal 실행"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+            self._loop_thread.start()
+
+        future = asyncio.run_coroutine_threadsafe(self.get_signal(key, model_fn, fallback_fn), self._loop)
+        return future.result()
+
+    def close(self):
+        """백그라운드 이벤트 루프 종료"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=1.0)
+            self._loop = None
+            self._loop_thread = None
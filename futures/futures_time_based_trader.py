@@ -1,68 +1,149 @@
-try:
-    from .futures_config import TIME_BASED_LEVERAGE, FEES, SCALPING_MODE, TRADING_HOURS
-except ImportError:
-    from futures_config import TIME_BASED_LEVERAGE, FEES, SCALPING_MODE, TRADING_HOURS
-from datetime import datetime
-from typing import Dict, Any
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Dict, Any, Callable, Optional
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_snapshot import get_config
+
+HOURS_PER_WEEK = 168
+EPOCH_WEEKDAY = 3  # 1970-01-01은 목요일 (월요일=0)
+
+
+def hour_of_week_slots(timestamps) -> np.ndarray:
+    """epoch 초 또는 datetime64 배열을 월요일 00시(UTC) 기준 주간 시간 슬롯으로 변환"""
+    timestamps = np.asarray(timestamps)
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        seconds = timestamps.astype('datetime64[s]').astype(np.int64)
+    else:
+        seconds = timestamps.astype(np.int64)
+    return ((seconds // 86400 + EPOCH_WEEKDAY) % 7) * 24 + (seconds // 3600) % 24
+
 
 class TimeBasedTradingManager:
     """시간 기반 거래 관리자"""
 
-    def __init__(self):
-        self.current_time = datetime.utcnow()
+    def __init__(self, clock: Optional[Callable[[], datetime]] = None, volume_profile=None, config=None):
+        # 주입 가능한 시계 (기본: 현재 UTC 시각)
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self.volume_profile = volume_profile
+        self._config = config  # 주입된 스냅샷 (미지정 시 현재 설정을 따라가며 재적재 시 테이블 재구성)
+        self._table_config = None
+        self._build_week_table()
+        self.current_time = self.clock()
+
+    @property
+    def config(self):
+        return self._config if self._config is not None else get_config()
+
+    def _refresh(self):
+        """설정 스냅샷이 교체되었으면 주간 테이블 재구성 (참조 비교 한 번)"""
+        if self.config is not self._table_config:
+            self._build_week_table()
+
+    def apply_volume_profile(self, volume_profile):
+        """학습된 거래량 프로파일로 고거래량 시간대 교체 (히스토리 재스캔 없음)"""
+        self.volume_profile = volume_profile
+        self._build_week_table()
 
-    def get_current_utc_hour(self) -> int:
+    def _build_week_table(self):
+        """주간 168개 시간 슬롯별 거래량/펀딩/레버리지/거래 여부 사전 계산"""
+        config = self.config
+        hours = np.arange(HOURS_PER_WEEK) % 24
+        leverage = config.futures["TIME_BASED_LEVERAGE"]
+        self.high_volume_table = np.isin(hours, list(config.active_hours))
+        if self.volume_profile is not None:
+            # 표본이 충분한 슬롯만 프로파일 값 사용, 나머지는 고정 시간대 규칙 유지
+            learned, sampled = self.volume_profile.high_volume_mask()
+            self.high_volume_table = np.where(sampled, learned, self.high_volume_table)
+        self.near_funding_table = np.zeros(HOURS_PER_WEEK, dtype=bool)
+        for funding_hour in config.funding_hours:
+            self.near_funding_table |= np.abs(hours - funding_hour) <= 1
+        self.leverage_table = np.where(
+            self.near_funding_table, leverage["funding_time"],
+            np.where(self.high_volume_table, leverage["high_volume"], leverage["low_volume"])
+        )
+        self.should_trade_table = self.high_volume_table & ~self.near_funding_table
+
+        # 단일 시각 조회용 파이썬 값 (numpy 스칼라 변환 비용 회피)
+        self._slots = [
+            (int(hour), bool(high), bool(funding), float(leverage), bool(trade))
+            for hour, high, funding, leverage, trade in zip(
+                hours, self.high_volume_table, self.near_funding_table,
+                self.leverage_table, self.should_trade_table
+            )
+        ]
+        self._table_config = config
+
+    @staticmethod
+    def hour_of_week(moment: datetime) -> int:
+        """월요일 00시(UTC) 기준 주간 시간 슬롯"""
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(timezone.utc)
+        return moment.weekday() * 24 + moment.hour
+
+    def _slot(self, now: Optional[datetime] = None):
+        self._refresh()
+        return self._slots[self.hour_of_week(now or self.clock())]
+
+    def get_current_utc_hour(self, now: Optional[datetime] = None) -> int:
         """현재 UTC 시간 반환"""
-        return datetime.utcnow().hour
+        return self._slot(now)[0]
 
-    def is_high_volume_time(self) -> bool:
+    def is_high_volume_time(self, now: Optional[datetime] = None) -> bool:
         """거래량이 많은 시간대인지 확인"""
-        current_hour = self.get_current_utc_hour()
-        return TRADING_HOURS["active_start"] <= current_hour <= TRADING_HOURS["active_end"]
+        return self._slot(now)[1]
 
-    def is_low_volume_time(self) -> bool:
+    def is_low_volume_time(self, now: Optional[datetime] = None) -> bool:
         """거래량이 적은 시간대인지 확인"""
-        return not self.is_high_volume_time()
+        return not self.is_high_volume_time(now)
 
-    def is_near_funding_time(self) -> bool:
+    def is_near_funding_time(self, now: Optional[datetime] = None) -> bool:
         """펀딩 시간 근처인지 확인"""
-        current_hour = self.get_current_utc_hour()
-        return any(abs(current_hour - ft) <= 1 for ft in TRADING_HOURS["funding_times"])
+        return self._slot(now)[2]
 
-    def should_avoid_trading(self) -> bool:
+    def should_avoid_trading(self, now: Optional[datetime] = None) -> bool:
         """거래를 피해야 하는 시간인지 확인"""
-        return self.is_near_funding_time()
+        return self.is_near_funding_time(now)
 
-    def get_leverage_multiplier(self) -> float:
+    def get_leverage_multiplier(self, now: Optional[datetime] = None) -> float:
         """현재 시간대에 맞는 레버리지 배수 반환"""
-        if self.is_near_funding_time():
-            return TIME_BASED_LEVERAGE["funding_time"]
-        elif self.is_high_volume_time():
-            return TIME_BASED_LEVERAGE["high_volume"]
-        else:
-            return TIME_BASED_LEVERAGE["low_volume"]
+        return self._slot(now)[3]
 
-    def get_optimal_position_size(self, base_size: float) -> float:
+    def get_optimal_position_size(self, base_size: float, now: Optional[datetime] = None) -> float:
         """최적 포지션 크기 계산"""
-        multiplier = self.get_leverage_multiplier()
+        multiplier = self.get_leverage_multiplier(now)
         return base_size * multiplier
 
-    def get_trading_recommendation(self) -> Dict[str, Any]:
-        """시간대별 거래 추천"""
-        current_hour = self.get_current_utc_hour()
-        is_high_volume = self.is_high_volume_time()
-        near_funding = self.is_near_funding_time()
-        leverage_multiplier = self.get_leverage_multiplier()
+    def get_trading_recommendation(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """시간대별 거래 추천 (시계는 한 번만 읽음)"""
+        current_hour, is_high_volume, near_funding, leverage_multiplier, should_trade = self._slot(now)
 
         return {
             "current_hour_utc": current_hour,
             "is_high_volume": is_high_volume,
             "near_funding": near_funding,
-            "should_trade": is_high_volume and not near_funding,
+            "should_trade": should_trade,
             "leverage_multiplier": leverage_multiplier,
             "reason": self._get_trading_reason(is_high_volume, near_funding)
         }
 
+    def classify(self, timestamps) -> Dict[str, np.ndarray]:
+        """타임스탬프 배열 일괄 분류 (epoch 초 또는 datetime64) - 백테스트용"""
+        self._refresh()
+        slots = hour_of_week_slots(timestamps)
+
+        return {
+            "hour_of_week": slots,
+            "is_high_volume": self.high_volume_table[slots],
+            "near_funding": self.near_funding_table[slots],
+            "should_trade": self.should_trade_table[slots],
+            "leverage_multiplier": self.leverage_table[slots]
+        }
+
     def _get_trading_reason(self, is_high_volume: bool, near_funding: bool) -> str:
         """거래 추천 사유 반환"""
         if near_funding:
@@ -1,8 +1,24 @@
 import datetime
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_snapshot import get_config
+
+try:
+    from .futures_config import TIMING_WHEEL
+    from .futures_timing_wheel import HierarchicalTimingWheel
+except ImportError:
+    from futures_config import TIMING_WHEEL
+    from futures_timing_wheel import HierarchicalTimingWheel
 
 class FuturesTimeManager:
-    def __init__(self):
-        pass
+    def __init__(self, wheel=None, utc_clock=None):
+        # 모든 시간 기반 작업은 하나의 타이밍 휠에서 실행
+        self.wheel = wheel if wheel is not None else HierarchicalTimingWheel()
+        self.utc_clock = utc_clock or (lambda: datetime.datetime.now(datetime.timezone.utc))
+        self.jobs = {}
 
     def get_current_time(self):
         return datetime.datetime.now()
@@ -11,4 +27,51 @@ class FuturesTimeManager:
         return datetime.datetime(year, month, day, hour, minute, second)
 
     def get_time_difference(self, time1, time2):
-        return abs((time1 - time2).total_seconds())
\ No newline at end of file
+        return abs((time1 - time2).total_seconds())
+
+    def get_next_funding_time(self, now=None):
+        """다음 펀딩 시각 (UTC)"""
+        now = now or self.utc_clock()
+        today = now.replace(minute=0, second=0, microsecond=0)
+        for day_offset in (0, 1):
+            for hour in sorted(get_config().funding_hours):
+                candidate = today.replace(hour=hour) + datetime.timedelta(days=day_offset)
+                if candidate > now:
+                    return candidate
+        return today + datetime.timedelta(days=1)
+
+    def schedule_funding_derisk(self, callback, lead_seconds=None):
+        """매 펀딩 시각 lead_seconds 전에 리스크 축소 작업 실행 (실행 후 다음 펀딩으로 재등록)"""
+        lead_seconds = TIMING_WHEEL["funding_derisk_lead"] if lead_seconds is None else lead_seconds
+
+        def run(funding_time):
+            try:
+                callback(funding_time)
+            finally:
+                arm(funding_time)
+
+        def arm(previous=None):
+            now = self.utc_clock()
+            start = now + datetime.timedelta(seconds=lead_seconds)
+            if previous is not None and previous > start:
+                start = previous
+            funding_time = self.get_next_funding_time(start)
+            delay = (funding_time - now).total_seconds() - lead_seconds
+            self.jobs['funding_derisk'] = self.wheel.schedule(
+                delay, lambda: run(funding_time), name='funding_derisk'
+            )
+
+        arm()
+        return self.jobs['funding_derisk']
+
+    def schedule_periodic(self, name, callback, interval=None):
+        """주기 작업 등록 (예: 포지션 대조)"""
+        interval = interval or TIMING_WHEEL["reconcile_interval"]
+        self.cancel_job(name)
+        self.jobs[name] = self.wheel.schedule(interval, callback, interval=interval, name=name)
+        return self.jobs[name]
+
+    def cancel_job(self, name):
+        timer = self.jobs.pop(name, None)
+        if timer is not None:
+            self.wheel.cancel(timer)
@@ -0,0 +1,168 @@
+"""
+⏲️ 계층형 타이밍 휠 스케줄러
+- 타이머 등록/취소 O(1), 타이머별 스레드 없음
+- 상위 휠 슬롯은 도래 시 하위 휠로 내려보냄 (cascade)
+- 단일 백그라운드 스레드 또는 advance() 수동 구동
+"""
+
+import threading
+import time
+from typing import Callable, Optional, Dict, Any
+
+try:
+    from .futures_config import TIMING_WHEEL
+except ImportError:
+    from futures_config import TIMING_WHEEL
+
+
+class Timer:
+    """휠에 등록된 타이머"""
+
+    __slots__ = ('expiry_tick', 'callback', 'interval_ticks', 'name', 'cancelled', '_bucket')
+
+    def __init__(self, expiry_tick: int, callback: Callable[[], Any], interval_ticks: int, name: str):
+        self.expiry_tick = expiry_tick
+        self.callback = callback
+        self.interval_ticks = interval_ticks
+        self.name = name
+        self.cancelled = False
+        self._bucket = None
+
+    def cancel(self):
+        """타이머 취소 (O(1))"""
+        self.cancelled = True
+        if self._bucket is not None:
+            self._bucket.discard(self)
+            self._bucket = None
+
+
+class HierarchicalTimingWheel:
+    """다단계 타이밍 휠"""
+
+    def __init__(self, tick_seconds: float = None, wheel_bits: int = None, levels: int = None,
+                 clock=time.monotonic):
+        self.tick_seconds = tick_seconds or TIMING_WHEEL["tick_seconds"]
+        self.bits = wheel_bits or TIMING_WHEEL["wheel_bits"]
+        self.levels = levels or TIMING_WHEEL["levels"]
+        self.size = 1 << self.bits
+        self.mask = self.size - 1
+        self.clock = clock
+
+        self.wheels = [[set() for _ in range(self.size)] for _ in range(self.levels)]
+        self.current_tick = 0
+        self._started_at = clock()
+        self._lock = threading.RLock()
+        self._thread = None
+        self._stopping = threading.Event()
+        self.stats = {'scheduled': 0, 'fired': 0, 'cancelled': 0, 'errors': 0, 'cascaded': 0}
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for wheel in self.wheels for bucket in wheel)
+
+    def _insert(self, timer: Timer):
+        # cascade 중에는 현재 틱 슬롯에 들어가 바로 실행됨
+        expiry = max(timer.expiry_tick, self.current_tick)
+        delta = expiry - self.current_tick
+        for level in range(self.levels):
+            if delta < 1 << (self.bits * (level + 1)):
+                break
+        else:
+            # 최대 범위를 넘는 타이머는 최상위 휠의 마지막 슬롯에 두고 cascade 때 재배치
+            level = self.levels - 1
+            expiry = self.current_tick + (1 << (self.bits * self.levels)) - 1
+        bucket = self.wheels[level][(expiry >> (self.bits * level)) & self.mask]
+        bucket.add(timer)
+        timer._bucket = bucket
+
+    def schedule(self, delay: float, callback: Callable[[], Any], interval: Optional[float] = None,
+                 name: str = "") -> Timer:
+        """delay초 후 실행 (interval 지정 시 주기 실행)"""
+        ticks = max(1, int(round(delay / self.tick_seconds)))
+        interval_ticks = max(1, int(round(interval / self.tick_seconds))) if interval else 0
+        with self._lock:
+            timer = Timer(self.current_tick + ticks, callback, interval_ticks, name)
+            self._insert(timer)
+            self.stats['scheduled'] += 1
+        return timer
+
+    def cancel(self, timer: Timer):
+        """타이머 취소"""
+        with self._lock:
+            if not timer.cancelled:
+                timer.cancel()
+                self.stats['cancelled'] += 1
+
+    def _tick(self) -> list:
+        """한 틱 전진 후 만료 타이머 목록 반환"""
+        self.current_tick += 1
+        tick = self.current_tick
+
+        # 하위 휠이 한 바퀴 돌았으면 상위 휠 슬롯을 내려보냄
+        level = 1
+        while level < self.levels and tick & ((1 << (self.bits * level)) - 1) == 0:
+            level += 1
+        for upper in range(level - 1, 0, -1):
+            index = (tick >> (self.bits * upper)) & self.mask
+            bucket = self.wheels[upper][index]
+            if bucket:
+                self.wheels[upper][index] = set()
+                self.stats['cascaded'] += len(bucket)
+                for timer in bucket:
+                    self._insert(timer)
+
+        index = tick & self.mask
+        due = self.wheels[0][index]
+        if not due:
+            return []
+        self.wheels[0][index] = set()
+        return list(due)
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """현재 시각까지 휠을 돌리고 만료 타이머 실행, 실행 수 반환"""
+        now = self.clock() if now is None else now
+        target = int((now - self._started_at) / self.tick_seconds)
+        fired = 0
+        while True:
+            with self._lock:
+                if self.current_tick >= target:
+                    break
+                due = self._tick()
+                for timer in due:
+                    timer._bucket = None
+                    if timer.interval_ticks:
+                        timer.expiry_tick += timer.interval_ticks
+                        self._insert(timer)
+            for timer in due:
+                if timer.cancelled:
+                    continue
+                fired += 1
+                try:
+                    timer.callback()
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    print(f"Timer {timer.name or timer.callback} failed: {e}")
+        self.stats['fired'] += fired
+        return fired
+
+    def start(self):
+        """단일 백그라운드 스레드로 휠 구동"""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="timing-wheel", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopping.wait(self.tick_seconds):
+            self.advance()
+
+    def stop(self):
+        """백그라운드 스레드 종료"""
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join(timeout=self.tick_seconds * 10)
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """스케줄러 통계"""
+        return dict(self.stats, pending=len(self), current_tick=self.current_tick)
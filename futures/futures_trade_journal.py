@@ -0,0 +1,172 @@
+"""
+📒 추가 전용 바이너리 거래 저널
+- 고정 폭 레코드, 일괄 fsync
+- 희소 시간 인덱스로 범위 조회 시 필요한 구간만 읽음
+- 최근 항목은 제한된 메모리 꼬리(tail)에서 제공
+"""
+
+import os
+import struct
+import time
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+try:
+    from .futures_config import TRADE_JOURNAL
+except ImportError:
+    from futures_config import TRADE_JOURNAL
+
+MAGIC = b"FTJRNL01"
+# timestamp, symbol, action, amount, price, confidence, flags(bit0=success, bit1=executed)
+RECORD = struct.Struct("<d16s8sdddB")
+READ_CHUNK_RECORDS = 4096
+
+
+def _fixed_bytes(value, size: int) -> bytes:
+    """UTF-8 인코딩 후 바이트 단위로 자름 (멀티바이트 문자 중간에서 자르지 않음)"""
+    data = str(value).encode('utf-8')[:size]
+    return data.decode('utf-8', 'ignore').encode('utf-8')
+
+
+def to_epoch(value) -> Optional[float]:
+    """datetime / ISO 문자열 / epoch 값을 epoch 초로 변환"""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+class TradeJournal:
+    """고정 폭 레코드 기반 추가 전용 거래 저널"""
+
+    def __init__(self, path: str, tail_size: int = None, index_interval: int = None,
+                 fsync_batch: int = None, fsync_interval: float = None):
+        self.path = path
+        self.index_interval = index_interval or TRADE_JOURNAL["index_interval"]
+        self.fsync_batch = fsync_batch or TRADE_JOURNAL["fsync_batch"]
+        self.fsync_interval = fsync_interval or TRADE_JOURNAL["fsync_interval"]
+        self.tail = deque(maxlen=tail_size or TRADE_JOURNAL["tail_size"])
+
+        self._index_ts = []   # 희소 인덱스: index_interval 레코드마다 (timestamp, 레코드 번호)
+        self._index_pos = []
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._last_ts = 0.0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, 'a+b')
+        self.record_count = self._load()
+
+    def _load(self) -> int:
+        """헤더 확인 후 희소 인덱스 재구성"""
+        self._file.seek(0, os.SEEK_END)
+        size = self._file.tell()
+        if size == 0:
+            self._file.write(MAGIC)
+            self._file.flush()
+            return 0
+
+        self._file.seek(0)
+        if self._file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{self.path} is not a trade journal")
+
+        count = (size - len(MAGIC)) // RECORD.size
+        if len(MAGIC) + count * RECORD.size != size:
+            # 기록 도중 중단된 마지막 레코드 제거
+            self._file.truncate(len(MAGIC) + count * RECORD.size)
+
+        for record_no in range(0, count, self.index_interval):
+            self._file.seek(len(MAGIC) + record_no * RECORD.size)
+            self._index_ts.append(struct.unpack("<d", self._file.read(8))[0])
+            self._index_pos.append(record_no)
+        if count:
+            self._file.seek(len(MAGIC) + (count - 1) * RECORD.size)
+            self._last_ts = struct.unpack("<d", self._file.read(8))[0]
+        return count
+
+    def append(self, entry: Dict[str, Any]):
+        """거래 결과 기록 (원본 딕셔너리는 메모리 꼬리에만 보관)"""
+        signal = entry.get('signal') or {}
+        market_data = entry.get('market_data') or {}
+        # 범위 조회가 이진 탐색을 쓰므로 시간은 단조 증가로 유지
+        ts = max(to_epoch(entry.get('timestamp')) or time.time(), self._last_ts)
+        flags = (1 if entry.get('success') else 0) | (2 if entry.get('executed') else 0)
+
+        self._file.write(RECORD.pack(
+            ts,
+            _fixed_bytes(entry.get('symbol', ''), 16),
+            _fixed_bytes(signal.get('action', entry.get('action', '')), 8),
+            float(entry.get('amount', 0) or 0),
+            float(market_data.get('price', signal.get('price', entry.get('price', 0))) or 0),
+            float(signal.get('confidence', entry.get('confidence', 0)) or 0),
+            flags
+        ))
+
+        if self.record_count % self.index_interval == 0:
+            self._index_ts.append(ts)
+            self._index_pos.append(self.record_count)
+        self.record_count += 1
+        self._last_ts = ts
+        self.tail.append(entry)
+
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_batch or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self):
+        """버퍼 비우고 fsync (일괄 처리)"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def read_range(self, start=None, end=None) -> List[Dict[str, Any]]:
+        """시간 범위 조회 - 희소 인덱스로 시작 위치를 찾아 필요한 구간만 읽음"""
+        start_ts = to_epoch(start)
+        end_ts = to_epoch(end)
+        self._file.flush()
+
+        record_no = 0
+        if start_ts is not None and self._index_ts:
+            slot = bisect_right(self._index_ts, start_ts) - 1
+            record_no = self._index_pos[max(slot, 0)]
+
+        results = []
+        with open(self.path, 'rb') as reader:
+            reader.seek(len(MAGIC) + record_no * RECORD.size)
+            while True:
+                chunk = reader.read(READ_CHUNK_RECORDS * RECORD.size)
+                if not chunk:
+                    return results
+                usable = len(chunk) - len(chunk) % RECORD.size
+                for ts, symbol, action, amount, price, confidence, flags in RECORD.iter_unpack(chunk[:usable]):
+                    if start_ts is not None and ts < start_ts:
+                        continue
+                    if end_ts is not None and ts > end_ts:
+                        return results
+                    results.append({
+                        'timestamp': datetime.fromtimestamp(ts).isoformat(),
+                        'symbol': symbol.rstrip(b'\0').decode('utf-8', 'replace'),
+                        'action': action.rstrip(b'\0').decode('utf-8', 'replace'),
+                        'amount': amount,
+                        'price': price,
+                        'confidence': confidence,
+                        'success': bool(flags & 1),
+                        'executed': bool(flags & 2)
+                    })
+
+    def recent(self) -> list:
+        """메모리 꼬리의 최근 항목"""
+        return list(self.tail)
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def close(self):
+        """남은 레코드 fsync 후 닫기"""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
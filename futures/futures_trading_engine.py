@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+🔁 비동기 다중 심볼 거래 엔진
+- SUPPORTED_FUTURES 전 심볼을 고정 틱 주기로 동시에 실행
+- 심볼별 독립 태스크: 느린 심볼은 자기 틱만 건너뜀
+- stop() 후 shutdown()으로 깔끔한 종료
+"""
+
+import asyncio
+import os
+import signal
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_snapshot import get_config
+
+try:
+    from .futures_config import TRADING_ENGINE
+except ImportError:
+    from futures_config import TRADING_ENGINE
+
+
+class AsyncFuturesTradingEngine:
+    """다중 심볼 비동기 거래 엔진"""
+
+    def __init__(self, trader, symbols: Optional[List[str]] = None, amount: float = None,
+                 tick_interval: float = None):
+        self.trader = trader
+        # 심볼 미지정 시 설정 스냅샷의 SUPPORTED_FUTURES를 따름 (실행 중 설정 재적재 반영)
+        self.pinned_symbols = list(symbols) if symbols else None
+        self.symbols = []
+        self.symbol_stats = {}
+        self._config = None
+        self.amount = amount or TRADING_ENGINE["default_amount"]
+        self.tick_interval = tick_interval or TRADING_ENGINE["tick_interval"]
+        self.tick_timeout = self.tick_interval * TRADING_ENGINE["tick_timeout_ratio"]
+        self.signal_deadline = self.tick_interval * TRADING_ENGINE["signal_deadline_ratio"]
+        self._stopping = None
+        self._tasks = []
+        self._set_symbols(self.pinned_symbols or self._configured_symbols())
+
+    def _configured_symbols(self) -> List[str]:
+        self._config = get_config()
+        return list(self._config.futures["SUPPORTED_FUTURES"])
+
+    def _set_symbols(self, symbols: List[str]):
+        self.symbols = symbols
+        for symbol in symbols:
+            self.symbol_stats.setdefault(
+                symbol, {'ticks': 0, 'timeouts': 0, 'errors': 0, 'skipped_ticks': 0, 'last_latency': 0.0}
+            )
+
+    def _refresh_symbols(self) -> List[str]:
+        """설정 스냅샷이 교체되었으면 심볼 목록 갱신, 새로 추가된 심볼 반환 (제거된 심볼 루프는 스스로 종료)"""
+        if self.pinned_symbols is not None or get_config() is self._config:
+            return []
+        symbols = self._configured_symbols()
+        added = [symbol for symbol in symbols if symbol not in self.symbols]
+        self._set_symbols(symbols)
+        return added
+
+    async def _symbol_loop(self, symbol: str, offset: float):
+        """심볼 하나의 틱 루프"""
+        loop = asyncio.get_running_loop()
+        stats = self.symbol_stats[symbol]
+        next_tick = loop.time() + offset  # 심볼별 시작 시점을 분산하여 부하 평탄화
+        in_flight = None
+
+        while not self._stopping.is_set() and symbol in self.symbols:
+            delay = next_tick - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+
+            if in_flight is not None and not in_flight.done():
+                # 이전 틱이 아직 진행 중이면 이번 틱은 건너뜀 (심볼당 미결 작업 최대 1개)
+                stats['skipped_ticks'] += 1
+            else:
+                started = loop.time()
+                in_flight = asyncio.ensure_future(self.trader.execute_futures_trading_strategy_async(
+                    symbol, self.amount, signal_deadline=self.signal_deadline
+                ))
+                done, _ = await asyncio.wait({in_flight}, timeout=self.tick_timeout)
+                if done:
+                    self._record_tick(stats, in_flight)
+                    stats['last_latency'] = loop.time() - started
+                else:
+                    stats['timeouts'] += 1
+
+            next_tick += self.tick_interval
+            behind = loop.time() - next_tick
+            if behind > 0:
+                # 밀린 틱은 몰아서 실행하지 않고 건너뜀
+                missed = int(behind // self.tick_interval) + 1
+                stats['skipped_ticks'] += missed
+                next_tick += missed * self.tick_interval
+
+        if in_flight is not None and not in_flight.done():
+            await asyncio.wait({in_flight}, timeout=self.tick_timeout)
+
+    @staticmethod
+    def _record_tick(stats: Dict[str, Any], task: asyncio.Future):
+        if task.exception() is None and task.result().get('success'):
+            stats['ticks'] += 1
+        else:
+            stats['errors'] += 1
+
+    async def run(self, duration: Optional[float] = None):
+        """엔진 실행 (duration 지정 시 해당 시간 후 종료)"""
+        self._stopping = asyncio.Event()
+        # 블로킹 클라이언트 호출이 기본 실행기를 고갈시키지 않도록 전용 스레드 풀 사용 (종료 시 정리)
+        executor = ThreadPoolExecutor(max_workers=TRADING_ENGINE["io_workers"], thread_name_prefix="engine-io")
+        asyncio.get_running_loop().set_default_executor(executor)
+        try:
+            self._refresh_symbols()
+            count = len(self.symbols)
+            self._tasks = [
+                asyncio.create_task(self._symbol_loop(symbol, self.tick_interval * i / count),
+                                    name=f"tick:{symbol}")
+                for i, symbol in enumerate(self.symbols)
+            ]
+            print(f"Trading engine started: {count} symbols, tick {self.tick_interval}s")
+
+            # duration이 없으면 stop() 호출(또는 종료 시그널)까지 계속 실행
+            loop = asyncio.get_running_loop()
+            deadline = None if duration is None else loop.time() + duration
+            while not self._stopping.is_set():
+                timeout = self.tick_interval
+                if deadline is not None:
+                    timeout = min(timeout, deadline - loop.time())
+                    if timeout <= 0:
+                        self.stop()
+                        break
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    # 틱 주기마다 설정 재적재로 추가된 심볼 태스크 시작
+                    self._tasks.extend(
+                        asyncio.create_task(self._symbol_loop(symbol, 0.0), name=f"tick:{symbol}")
+                        for symbol in self._refresh_symbols()
+                    )
+            await self.shutdown()
+        finally:
+            # 시간 초과로 남은 블로킹 호출은 기다리지 않음 - 유휴 스레드는 즉시 종료
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stop(self):
+        """종료 요청 (진행 중인 틱은 마무리)"""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def shutdown(self, timeout: float = None):
+        """모든 심볼 태스크 종료 대기, 시간 초과 시 취소"""
+        timeout = timeout if timeout is not None else self.tick_interval * 2
+        if not self._tasks:
+            return
+        done, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+        print(f"Trading engine stopped ({len(pending)} tasks cancelled)")
+
+    def run_forever(self):
+        """SIGINT/SIGTERM 수신 시 깔끔하게 종료하는 동기 진입점"""
+        async def main():
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, self.stop)
+                except (NotImplementedError, RuntimeError):
+                    pass
+            await self.run()
+
+        asyncio.run(main())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """엔진 전체 및 심볼별 통계"""
+        totals = {'ticks': 0, 'timeouts': 0, 'errors': 0, 'skipped_ticks': 0}
+        for stats in self.symbol_stats.values():
+            for key in totals:
+                totals[key] += stats[key]
+        return {'symbols': len(self.symbols), 'totals': totals, 'per_symbol': self.symbol_stats}
+
+
+if __name__ == "__main__":
+    from futures_main import FuturesTrader
+    from futures_mcp_client import FuturesMCPClient
+
+    engine = AsyncFuturesTradingEngine(FuturesTrader(mcp_client=FuturesMCPClient()))
+    asyncio.run(engine.run(duration=5))
+    print(engine.get_stats()['totals'])
@@ -0,0 +1,165 @@
+"""
+📊 주간 거래량 프로파일
+- 캐시된 kline 히스토리를 주간 시간 슬롯(168개)별로 벡터 집계 (np.bincount)
+- 심볼별 활동도(평균 대비 거래량)와 스프레드(봉 범위 비율) 프로파일
+- npz 파일로 저장, 새 봉이 들어오면 마지막 시각 이후만 증분 반영
+"""
+
+import os
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .futures_config import VOLUME_PROFILE
+    from .futures_time_based_trader import HOURS_PER_WEEK, hour_of_week_slots
+except ImportError:
+    from futures_config import VOLUME_PROFILE
+    from futures_time_based_trader import HOURS_PER_WEEK, hour_of_week_slots
+
+
+MS_TIMESTAMP_THRESHOLD = 1e11  # 이보다 큰 epoch 값은 밀리초 (초 단위로는 서기 5000년 이후)
+
+
+def to_epoch_seconds(timestamps) -> np.ndarray:
+    """epoch 초/밀리초가 섞인 시각 배열을 초 단위로 정규화"""
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    return np.where(timestamps > MS_TIMESTAMP_THRESHOLD, timestamps / 1000.0, timestamps)
+
+
+def klines_to_arrays(klines) -> Dict[str, np.ndarray]:
+    """kline 목록을 열 배열로 변환
+
+    [open_time_ms, open, high, low, close, volume, ...] 형식의 행 또는
+    timestamp/open_time, high, low, close, volume 키를 가진 딕셔너리 모두 지원
+    (시각은 입력 형식과 무관하게 epoch 초로 정규화)
+    """
+    if isinstance(klines, dict):
+        columns = dict(klines)
+    elif len(klines) and isinstance(klines[0], dict):
+        columns = {key: [row[key] for row in klines] for key in ('high', 'low', 'close', 'volume')}
+        columns['timestamp'] = [row['timestamp'] if 'timestamp' in row else row['open_time'] for row in klines]
+    else:
+        rows = np.asarray([row[:6] for row in klines], dtype=np.float64)
+        columns = {'timestamp': rows[:, 0], 'high': rows[:, 2], 'low': rows[:, 3],
+                   'close': rows[:, 4], 'volume': rows[:, 5]}
+    arrays = {key: np.asarray(value, dtype=np.float64) for key, value in columns.items()}
+    if 'timestamp' in arrays:
+        arrays['timestamp'] = to_epoch_seconds(arrays['timestamp'])
+    return arrays
+
+
+class VolumeProfile:
+    """심볼 하나의 주간 시간 슬롯별 거래량/스프레드 누적값"""
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.volume_sum = np.zeros(HOURS_PER_WEEK)
+        self.spread_sum = np.zeros(HOURS_PER_WEEK)
+        self.bar_count = np.zeros(HOURS_PER_WEEK, dtype=np.int64)
+        self.last_timestamp = -np.inf
+
+    def update(self, timestamps, volumes, highs, lows, closes) -> int:
+        """마지막 반영 시각 이후의 봉만 누적, 반영된 봉 수 반환"""
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        fresh = timestamps > self.last_timestamp
+        if not fresh.any():
+            return 0
+
+        closes = np.asarray(closes, dtype=np.float64)[fresh]
+        slots = hour_of_week_slots(timestamps[fresh])
+        spreads = np.divide(np.asarray(highs, dtype=np.float64)[fresh] - np.asarray(lows, dtype=np.float64)[fresh],
+                            closes, out=np.zeros_like(closes), where=closes > 0)
+
+        self.volume_sum += np.bincount(slots, weights=np.asarray(volumes, dtype=np.float64)[fresh],
+                                       minlength=HOURS_PER_WEEK)
+        self.spread_sum += np.bincount(slots, weights=spreads, minlength=HOURS_PER_WEEK)
+        self.bar_count += np.bincount(slots, minlength=HOURS_PER_WEEK)
+        self.last_timestamp = float(timestamps[fresh].max())
+        return int(fresh.sum())
+
+    def update_klines(self, klines) -> int:
+        """kline 목록으로 증분 갱신"""
+        if len(klines) == 0:
+            return 0
+        columns = klines_to_arrays(klines)
+        return self.update(columns['timestamp'], columns['volume'], columns['high'],
+                           columns['low'], columns['close'])
+
+    def activity(self) -> np.ndarray:
+        """슬롯별 평균 거래량 / 전체 평균 거래량 (표본 없는 슬롯은 0)"""
+        mean_volume = np.divide(self.volume_sum, self.bar_count,
+                                out=np.zeros(HOURS_PER_WEEK), where=self.bar_count > 0)
+        overall = self.volume_sum.sum() / self.bar_count.sum() if self.bar_count.sum() else 0.0
+        return mean_volume / overall if overall else mean_volume
+
+    def spread(self) -> np.ndarray:
+        """슬롯별 평균 봉 범위 비율 ((high - low) / close)"""
+        return np.divide(self.spread_sum, self.bar_count,
+                         out=np.zeros(HOURS_PER_WEEK), where=self.bar_count > 0)
+
+    def high_volume_mask(self, ratio: float = None, min_samples: int = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(고거래량 슬롯, 표본이 충분한 슬롯) 마스크"""
+        ratio = VOLUME_PROFILE["high_volume_ratio"] if ratio is None else ratio
+        min_samples = VOLUME_PROFILE["min_samples"] if min_samples is None else min_samples
+        sampled = self.bar_count >= min_samples
+        return (self.activity() >= ratio) & sampled, sampled
+
+    def high_volume_hours(self) -> list:
+        """고거래량 UTC 시간 (요일 무관, 해당 시간 슬롯의 과반이 고거래량인 경우)"""
+        learned, _ = self.high_volume_mask()
+        return [int(hour) for hour in np.flatnonzero(learned.reshape(7, 24).sum(axis=0) > 3)]
+
+    def save(self, path: str):
+        """npz 파일로 저장 (임시 파일 후 교체)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temp_path = path + ".tmp.npz"
+        np.savez(temp_path, volume_sum=self.volume_sum, spread_sum=self.spread_sum,
+                 bar_count=self.bar_count, last_timestamp=np.array(self.last_timestamp))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, symbol: str, path: str) -> 'VolumeProfile':
+        profile = cls(symbol)
+        with np.load(path) as data:
+            profile.volume_sum = data['volume_sum']
+            profile.spread_sum = data['spread_sum']
+            profile.bar_count = data['bar_count']
+            profile.last_timestamp = float(data['last_timestamp'])
+        return profile
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'symbol': self.symbol,
+            'bars': int(self.bar_count.sum()),
+            'last_timestamp': self.last_timestamp,
+            'high_volume_hours': self.high_volume_hours()
+        }
+
+
+class VolumeProfileStore:
+    """심볼별 프로파일 저장소 (디렉터리당 심볼 하나의 npz 파일)"""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or VOLUME_PROFILE["directory"]
+        self.profiles = {}
+
+    def _path(self, symbol: str) -> str:
+        safe_name = symbol.replace('/', '_').replace('-', '_')
+        return os.path.join(self.directory, f"{safe_name}.npz")
+
+    def get(self, symbol: str) -> VolumeProfile:
+        """메모리 또는 디스크에서 프로파일 로드 (없으면 빈 프로파일)"""
+        profile = self.profiles.get(symbol)
+        if profile is None:
+            path = self._path(symbol)
+            profile = VolumeProfile.load(symbol, path) if os.path.exists(path) else VolumeProfile(symbol)
+            self.profiles[symbol] = profile
+        return profile
+
+    def update(self, symbol: str, klines) -> VolumeProfile:
+        """새 봉 반영 후 저장"""
+        profile = self.get(symbol)
+        if profile.update_klines(klines):
+            profile.save(self._path(symbol))
+        return profile
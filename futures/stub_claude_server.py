@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+🧪 로컬 스텁 Claude 엔드포인트
+- Messages API(/v1/messages) 형식으로 응답하는 HTTP 서버
+- 테스트 및 백테스트에서 유료 모델 호출 대신 사용
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Callable, Optional
+
+SNAPSHOT_HEADER = "symbol,price,volume"
+
+
+def parse_snapshot_rows(prompt: str) -> List[Dict[str, Any]]:
+    """프롬프트의 CSV 스냅샷 행 파싱"""
+    lines = prompt.splitlines()
+    if SNAPSHOT_HEADER not in lines:
+        return []
+
+    rows = []
+    for line in lines[lines.index(SNAPSHOT_HEADER) + 1:]:
+        parts = line.strip().split(',')
+        if len(parts) != 3:
+            break
+        rows.append({'symbol': parts[0], 'price': float(parts[1]), 'volume': float(parts[2])})
+    return rows
+
+
+def rule_based_responder(prompt: str) -> str:
+    """기본 응답기 - 가격 수준에 따른 결정적 추천"""
+    results = []
+    for row in parse_snapshot_rows(prompt):
+        recommendation = "BUY" if row['price'] > 45000 else "SELL" if row['price'] < 40000 else "HOLD"
+        results.append({
+            'symbol': row['symbol'],
+            'recommendation': recommendation,
+            'confidence': 70,
+            'analysis': f"Stub analysis at {row['price']:.2f}"
+        })
+    return json.dumps({'results': results})
+
+
+class StubClaudeServer:
+    """스레드에서 동작하는 로컬 스텁 모델 서버"""
+
+    def __init__(self, responder: Optional[Callable[[str], str]] = None, host: str = "127.0.0.1", port: int = 0):
+        self.responder = responder or rule_based_responder
+        self.prompts = []
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        return len(self.prompts)
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'{}')
+                prompt = "".join(
+                    message['content'] if isinstance(message['content'], str)
+                    else "".join(block.get('text', '') for block in message['content'])
+                    for message in payload.get('messages', [])
+                )
+                stub.prompts.append(prompt)
+                text = stub.responder(prompt)
+
+                body = json.dumps({
+                    'id': f"msg_stub_{len(stub.prompts)}",
+                    'type': 'message',
+                    'role': 'assistant',
+                    'model': payload.get('model', 'stub'),
+                    'content': [{'type': 'text', 'text': text}],
+                    'stop_reason': 'end_turn',
+                    'stop_sequence': None,
+                    'usage': {'input_tokens': len(prompt) // 4, 'output_tokens': len(text) // 4}
+                }).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> 'StubClaudeServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    server = StubClaudeServer(port=8765)
+    print(f"Stub Claude endpoint listening on {server.base_url}")
+    server._server.serve_forever()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+🧪 바이너리 거래 저널 테스트
+"""
+
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from futures_trade_journal import MAGIC, RECORD, TradeJournal
+
+
+def _entry(ts: float, symbol: str = "BTC/USDT", action: str = "BUY") -> dict:
+    return {'timestamp': ts, 'symbol': symbol, 'amount': ts - 1000.0, 'success': True, 'executed': True,
+            'market_data': {'price': 50000.0}, 'signal': {'action': action, 'confidence': 80}}
+
+
+def test_read_range_across_index_boundary():
+    """희소 인덱스 경계를 넘는 범위 조회"""
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = TradeJournal(os.path.join(tmp, "trades.journal"), index_interval=4)
+        for i in range(20):
+            journal.append(_entry(1000.0 + i))
+
+        rows = journal.read_range(1006.0, 1013.0)
+        assert [row['amount'] for row in rows] == [float(i) for i in range(6, 14)]
+        assert [row['amount'] for row in journal.read_range(1003.0, 1004.0)] == [3.0, 4.0]
+        assert len(journal.read_range(start=1016.0)) == 4
+        assert len(journal.read_range(end=1000.5)) == 1
+        assert journal.read_range(2000.0) == []
+        journal.close()
+    print("✅ 범위 조회 테스트 통과")
+
+
+def test_torn_tail_truncated_on_reopen():
+    """기록 도중 중단된 마지막 레코드는 다시 열 때 제거"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trades.journal")
+        journal = TradeJournal(path, index_interval=2)
+        for i in range(5):
+            journal.append(_entry(1000.0 + i))
+        journal.close()
+        with open(path, 'ab') as f:
+            f.write(b'\x01' * (RECORD.size // 2))
+
+        journal = TradeJournal(path, index_interval=2)
+        assert len(journal) == 5
+        assert os.path.getsize(path) == len(MAGIC) + 5 * RECORD.size
+        journal.append(_entry(1005.0))
+        assert len(journal.read_range(1004.0)) == 2
+        journal.close()
+    print("✅ 손상된 꼬리 제거 테스트 통과")
+
+
+def test_tail_keeps_recent_entries():
+    """메모리 꼬리는 최근 항목만 원본 그대로 보관"""
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = TradeJournal(os.path.join(tmp, "trades.journal"), tail_size=3)
+        for i in range(10):
+            journal.append(_entry(1000.0 + i))
+        assert [entry['timestamp'] for entry in journal.recent()] == [1007.0, 1008.0, 1009.0]
+        assert len(journal) == 10
+        journal.close()
+    print("✅ 메모리 꼬리 테스트 통과")
+
+
+def test_non_ascii_symbol_truncated_on_byte_boundary():
+    """멀티바이트 심볼은 문자 경계에서 잘려 다시 읽을 수 있음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = TradeJournal(os.path.join(tmp, "trades.journal"))
+        journal.append(_entry(1000.0, symbol="비트코인이더리움선물", action="매수"))
+        row = journal.read_range()[0]
+        assert row['symbol'] == "비트코인이"  # 16바이트 = 한글 5자 + 잘린 바이트 제거
+        assert row['action'] == "매수"
+        journal.close()
+    print("✅ 비ASCII 심볼 테스트 통과")
+
+
+def main():
+    print("🧪 거래 저널 테스트 시작")
+    print("=" * 30)
+
+    test_read_range_across_index_boundary()
+    test_torn_tail_truncated_on_reopen()
+    test_tail_keeps_recent_entries()
+    test_non_ascii_symbol_truncated_on_byte_boundary()
+
+    print("\n✅ 모든 테스트 완료")
+
+
+if __name__ == "__main__":
+    main()
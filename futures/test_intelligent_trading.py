@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+🧪 지능형 거래 전략 결과 형식 테스트
+"""
+
+import json
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from claude_enhanced_trader import MockMCPClient
+from futures_main import FuturesTrader
+
+
+def test_enhanced_branch_returns_serializable_narrative():
+    """향상된 거래자 경로: 해석은 일반 문자열이며 결과 전체가 JSON 직렬화 가능"""
+    trader = FuturesTrader(claude_api_key="test_key", mcp_client=MockMCPClient())
+    result = trader.execute_intelligent_trading_strategy("BTC/USDT")
+
+    narrative = result['narrative']
+    assert result['success'] and isinstance(narrative, str)
+    assert narrative.strip().startswith("Market Analysis for BTC/USDT")
+    assert json.loads(json.dumps(result))['narrative'] == narrative
+    print("✅ 향상된 거래자 해석 테스트 통과")
+
+
+def test_narrative_can_be_skipped():
+    """include_narrative=False면 해석을 렌더링하지 않음"""
+    trader = FuturesTrader(claude_api_key="test_key", mcp_client=MockMCPClient())
+    calls = []
+    render = trader.enhanced_trader.get_market_narrative
+    trader.enhanced_trader.get_market_narrative = lambda *args: calls.append(args) or render(*args)
+
+    result = trader.execute_intelligent_trading_strategy("BTC/USDT", include_narrative=False)
+    assert result['success'] and 'narrative' not in result and calls == []
+    print("✅ 해석 생략 테스트 통과")
+
+
+def test_basic_branch_returns_same_shape():
+    """기본 경로도 같은 형식 반환"""
+    trader = FuturesTrader()
+    result = trader.execute_intelligent_trading_strategy("ETH/USDT")
+
+    assert result['success'] and result['narrative'] == "Basic market analysis for ETH/USDT"
+    assert json.loads(json.dumps(result))['narrative'] == result['narrative']
+    print("✅ 기본 경로 해석 테스트 통과")
+
+
+def test_late_analysis_is_not_reused_after_price_moves():
+    """마감 이후 도착한 분석은 시장 상태가 같은 틱에만 재사용"""
+    import time
+    from futures_signal_pipeline import DeadlineSignalPipeline
+
+    class MovingMarket(MockMCPClient):
+        price = 50000.0
+
+        def get_market_data(self, symbol):
+            return {'symbol': symbol, 'price': self.price, 'volume': 1000.0}
+
+    market = MovingMarket()
+    pipeline = DeadlineSignalPipeline(deadline_seconds=0.05)
+    trader = FuturesTrader(claude_api_key="test_key", mcp_client=market, signal_pipeline=pipeline)
+    analyze = trader.enhanced_trader.get_intelligent_trading_signal
+    trader.enhanced_trader.get_intelligent_trading_signal = lambda *args: time.sleep(0.2) or analyze(*args)
+    try:
+        assert trader.execute_intelligent_trading_strategy("BTC/USDT")['analysis']['source'] == 'rule_based'
+        time.sleep(0.3)
+        market.price = 40000.0  # 가격 버킷이 바뀐 다음 틱
+        assert trader.execute_intelligent_trading_strategy("BTC/USDT")['analysis']['source'] == 'rule_based'
+        assert pipeline.stats['late_used'] == 0
+
+        time.sleep(0.3)
+        late = trader.execute_intelligent_trading_strategy("BTC/USDT")['analysis']
+        assert late['source'] == 'model_late' and late['price'] == 40000.0
+    finally:
+        pipeline.close()
+    print("✅ 늦은 분석 재사용 범위 테스트 통과")
+
+
+def main():
+    print("🧪 지능형 거래 전략 테스트 시작")
+    print("=" * 30)
+
+    test_enhanced_branch_returns_serializable_narrative()
+    test_narrative_can_be_skipped()
+    test_basic_branch_returns_same_shape()
+    test_late_analysis_is_not_reused_after_price_moves()
+
+    print("\n✅ 모든 테스트 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+🧪 Claude 응답 디스크 캐시 테스트
+"""
+
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from claude_market_intelligence import ClaudeMarketIntelligence
+from claude_response_cache import ClaudeResponseCache
+from futures_claude_client import FuturesClaudeClient
+from stub_claude_server import StubClaudeServer
+
+
+def test_persist_and_reopen():
+    """저장한 응답이 다시 열어도 조회됨"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "responses.cache")
+        key = ClaudeResponseCache.make_key("prompt", model="m", max_tokens=10)
+
+        with ClaudeResponseCache(path) as cache:
+            cache.put(key, '{"action": "BUY"}')
+            assert cache.get(key) == '{"action": "BUY"}'
+            assert cache.get(ClaudeResponseCache.make_key("prompt", model="m", max_tokens=20)) is None
+
+        with ClaudeResponseCache(path) as cache:
+            assert len(cache) == 1
+            assert cache.get(key) == '{"action": "BUY"}'
+        print("✅ 저장 및 재시작 후 조회 테스트 통과")
+
+
+def test_truncated_tail_is_dropped():
+    """기록 중 중단된 마지막 레코드는 무시"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "responses.cache")
+        with ClaudeResponseCache(path) as cache:
+            cache.put(b"a" * 32, "first")
+            cache.put(b"b" * 32, "second")
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 3)
+
+        with ClaudeResponseCache(path) as cache:
+            assert len(cache) == 1
+            assert cache.get(b"a" * 32) == "first"
+            cache.put(b"c" * 32, "third")
+            assert cache.get(b"c" * 32) == "third"
+        print("✅ 잘린 레코드 복구 테스트 통과")
+
+
+def test_backtest_replay_skips_model():
+    """두 번째 실행은 모델 호출 없이 기록된 결정을 재생"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "responses.cache")
+        symbols = ["BTC/USDT", "ETH/USDT"]
+
+        with StubClaudeServer() as server, ClaudeResponseCache(path) as cache:
+            intelligence = ClaudeMarketIntelligence("test_api_key", base_url=server.base_url,
+                                                    response_cache=cache)
+            recorded = intelligence.analyze_markets(symbols)
+            assert server.request_count == 1
+
+        with StubClaudeServer() as server, ClaudeResponseCache(path) as cache:
+            intelligence = ClaudeMarketIntelligence("test_api_key", base_url=server.base_url,
+                                                    response_cache=cache)
+            replayed = intelligence.analyze_markets(symbols)
+            assert server.request_count == 0
+            assert cache.hits == 1
+
+        for symbol in symbols:
+            assert replayed[symbol]['recommendation'] == recorded[symbol]['recommendation']
+
+        with ClaudeResponseCache(path) as cache:
+            client = FuturesClaudeClient("test_api_key", response_cache=cache)
+            client.generate_trading_signal("BTC/USDT", 1500)
+            client.signal_cache.clear()
+            assert client.generate_trading_signal("BTC/USDT", 1500)['action'] == "BUY"
+            assert cache.get_stats()['hits'] == 1
+        print("✅ 백테스트 재생 테스트 통과")
+
+
+def test_defaults_come_from_config():
+    """경로/fsync 미지정 시 RESPONSE_CACHE 설정 사용"""
+    from claude_response_cache import RESPONSE_CACHE
+
+    original = dict(RESPONSE_CACHE)
+    with tempfile.TemporaryDirectory() as tmp:
+        RESPONSE_CACHE.update(path=os.path.join(tmp, "nested", "default.cache"), fsync=True)
+        try:
+            with ClaudeResponseCache() as cache:
+                assert cache.path == RESPONSE_CACHE["path"] and cache.fsync
+                cache.put(ClaudeResponseCache.make_key("p"), "v")
+            assert os.path.exists(RESPONSE_CACHE["path"])
+            with ClaudeResponseCache(fsync=False) as cache:
+                assert not cache.fsync and len(cache) == 1
+        finally:
+            RESPONSE_CACHE.clear()
+            RESPONSE_CACHE.update(original)
+    print("✅ 설정 기본값 테스트 통과")
+
+
+def main():
+    print("🧪 응답 캐시 테스트 시작")
+    print("=" * 30)
+
+    test_persist_and_reopen()
+    test_truncated_tail_is_dropped()
+    test_backtest_replay_skips_model()
+    test_defaults_come_from_config()
+
+    print("\n✅ 모든 테스트 완료")
+
+
+if __name__ == "__main__":
+    main()
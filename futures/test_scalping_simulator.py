@@ -0,0 +1,46 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from futures_scalping_simulator import ScalpingSimulator
+
+
+def make_simulator():
+    return ScalpingSimulator(
+        {"max_positions": 2, "max_hold_time": 10, "quick_exit_threshold": 0.01,
+         "stop_loss": 0.02, "min_profit": 0.0},
+        fee_rate=0.0, notional=100.0,
+    )
+
+
+def test_exit_rules_and_position_cap():
+    timestamps = np.arange(20, dtype=float)
+    prices = np.full(20, 100.0)
+    prices[3] = 101.5   # 롱(0) 익절
+    prices[6] = 102.5   # 숏(4) 손절
+    signals = np.zeros(20)
+    signals[[0, 1, 2, 4, 5]] = [1, 1, 1, -1, 1]
+
+    result = make_simulator().run(timestamps, prices, signals)
+    trades = result["trades"]
+
+    assert result["rejected_entries"] == 1  # 2번 틱은 동시 포지션 한도 초과
+    assert result["max_open_positions"] == 2
+    assert trades["entry_index"].tolist() == [0, 1, 4, 5]
+    assert trades["exit_index"].tolist() == [3, 3, 6, 6]
+    assert result["exits"] == {"take_profit": 3, "stop_loss": 1, "timeout": 0, "end_of_data": 0}
+    assert np.isclose(result["total_pnl"], 1.5 + 1.5 - 2.5 + 2.5)
+
+
+def test_time_based_exit():
+    timestamps = np.arange(0, 30, 0.5)
+    prices = np.full(len(timestamps), 100.0)
+    signals = np.zeros(len(timestamps))
+    signals[0] = 1
+
+    trades = make_simulator().run(timestamps, prices, signals)["trades"]
+    assert trades["reason"].tolist() == [2]
+    assert trades["hold_seconds"][0] == 10.0
@@ -0,0 +1,94 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from futures_session_monitor import FuturesSessionMonitor
+from futures_timing_wheel import HierarchicalTimingWheel
+
+
+class StubSessionManager:
+    def __init__(self, healthy):
+        self.healthy = healthy
+        self.batches = []
+
+    def probe_sessions(self, session_ids):
+        self.batches.append(list(session_ids))
+        return {sid: sid in self.healthy for sid in session_ids}
+
+
+def test_expiry_heap_honours_heartbeats():
+    now = [0.0]
+    monitor = FuturesSessionMonitor(None, clock=lambda: now[0])
+    for index in range(1000):
+        monitor.add_session(f"sub-{index}", {"account": index}, timeout=30.0)
+
+    now[0] = 20.0
+    for index in range(500):
+        monitor.heartbeat(f"sub-{index}")
+
+    now[0] = 31.0
+    expired = monitor.expire_due_sessions()
+    assert len(expired) == 500 and "sub-0" not in expired
+    assert len(monitor.active_sessions) == 500
+
+    now[0] = 51.0
+    assert len(monitor.expire_due_sessions()) == 500
+    assert monitor.metrics.counters[("session_expired_total", ())] == 1000
+
+
+def test_only_stale_sessions_are_probed_in_batches():
+    now = [0.0]
+    manager = StubSessionManager(healthy={"a", "b"})
+    monitor = FuturesSessionMonitor(manager, clock=lambda: now[0])
+    for session_id in ("a", "b", "c", "d"):
+        monitor.add_session(session_id, {}, timeout=30.0)
+
+    now[0] = 5.0
+    monitor.heartbeat("d")
+    now[0] = 12.0
+    result = monitor.check_due_sessions()
+    assert sorted(manager.batches[0]) == ["a", "b", "c"]
+    assert result == {"expired": [], "probed": 3, "active": 4}
+    assert monitor.active_sessions["a"].last_heartbeat == 12.0
+    assert monitor.active_sessions["c"].probe_failures == 1
+
+    now[0] = 31.0
+    assert monitor.check_due_sessions()["expired"] == ["c"]
+
+
+def test_heaps_hold_one_entry_per_live_session():
+    now = [0.0]
+    monitor = FuturesSessionMonitor(StubSessionManager(healthy=set()), clock=lambda: now[0])
+    for _ in range(50):
+        for session_id in ("a", "b"):
+            monitor.add_session(session_id, {}, timeout=30.0)  # 같은 세션 재등록
+    assert len(monitor.active_sessions) == 2
+
+    for step in range(1, 200):
+        now[0] = step * 11.0
+        monitor.heartbeat("a")
+        monitor.heartbeat("b")
+        monitor.expire_due_sessions()
+        monitor.stale_sessions()
+    # 오래된 항목은 꺼낼 때 버려지므로 힙 크기는 살아 있는 세션 수로 수렴
+    assert len(monitor._expiry_heap) == 2
+    assert len(monitor._probe_heap) == 2
+
+    now[0] += 100.0
+    assert sorted(monitor.expire_due_sessions()) == ["a", "b"]
+    assert monitor.metrics.counters[("session_expired_total", ())] == 2
+
+
+def test_stop_leaves_shared_wheel_running():
+    wheel = HierarchicalTimingWheel()
+    funding_job = wheel.schedule(3600.0, lambda: None, name="funding_derisk")
+    monitor = FuturesSessionMonitor(None, wheel=wheel)
+    try:
+        monitor.start_monitoring(check_interval=1.0)
+        monitor.stop_monitoring()
+        # 공유 휠의 다른 작업은 계속 실행, 세션 점검 타이머만 취소
+        assert wheel._thread is not None and wheel._thread.is_alive()
+        assert len(wheel) == 1 and not funding_job.cancelled
+    finally:
+        wheel.stop()
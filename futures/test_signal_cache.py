@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+🧪 거래 신호 캐시 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from futures_claude_client import FuturesClaudeClient
+from futures_signal_cache import SignalCache, market_fingerprint
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_fingerprint_quantization():
+    """미세한 가격 변동은 같은 키, 큰 변동은 다른 키"""
+    base = market_fingerprint("BTC/USDT", 1500, {'price': 50000, 'volume': 1000})
+    nudged = market_fingerprint("BTC/USDT", 1501, {'price': 50001, 'volume': 1010})
+    moved = market_fingerprint("BTC/USDT", 1500, {'price': 51000, 'volume': 1000})
+
+    assert base == nudged
+    assert base != moved
+    print("✅ 시장 상태 양자화 테스트 통과")
+
+
+def test_ttl_and_lru_eviction():
+    """TTL 만료와 LRU 제거"""
+    clock = FakeClock()
+    cache = SignalCache(max_size=2, ttl_seconds=10, clock=clock)
+
+    cache.put('a', {'action': 'BUY'})
+    cache.put('b', {'action': 'SELL'})
+    assert cache.get('a') == {'action': 'BUY'}  # 'a'를 최근 사용으로 갱신
+    cache.put('c', {'action': 'HOLD'})          # 'b' 제거
+    assert cache.get('b') is None
+
+    clock.now = 11
+    assert cache.get('a') is None
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+    assert stats['evictions'] == 1
+    assert stats['expirations'] == 1
+    print("✅ TTL/LRU 테스트 통과")
+
+
+def test_client_serves_cached_signal():
+    """시장이 움직이지 않으면 신호 재계산 없음, 요청 기록은 고정 크기"""
+    client = FuturesClaudeClient("test_api_key", history_size=3)
+    market_data = {'price': 50000, 'volume': 1000}
+
+    first = client.generate_trading_signal("BTC/USDT", 1500, market_data)
+    second = client.generate_trading_signal("BTC/USDT", 1500, market_data)
+    assert first == second
+    assert client.get_cache_stats()['hits'] == 1
+    assert len(client.get_request_history()) == 1
+
+    for amount in range(100, 1000, 100):
+        client.generate_trading_signal("ETH/USDT", amount)
+    assert len(client.get_request_history()) == 3
+    print("✅ 클라이언트 신호 캐시 테스트 통과")
+
+
+def test_trader_passes_market_data_to_signal():
+    """FuturesTrader 신호 호출에 현재 시장 데이터 전달 - 가격이 바뀌면 캐시 미스"""
+    from futures_main import FuturesTrader
+
+    class MovingMarket:
+        def __init__(self):
+            self.price = 50000
+
+        def get_market_data(self, symbol):
+            return {'price': self.price, 'volume': 1000}
+
+    market = MovingMarket()
+    client = FuturesClaudeClient("test_api_key")
+    trader = FuturesTrader(claude_client=client, mcp_client=market)
+
+    first = trader.execute_futures_trading_strategy("BTC/USDT", 1500)
+    assert first['signal']['price_target'] == 50000
+    market.price = 60000
+    second = trader.execute_futures_trading_strategy("BTC/USDT", 1500)
+    assert second['signal']['price_target'] == 60000
+    assert client.get_cache_stats()['misses'] == 2
+    print("✅ 시장 데이터 전달 테스트 통과")
+
+
+def main():
+    print("🧪 신호 캐시 테스트 시작")
+    print("=" * 30)
+
+    test_fingerprint_quantization()
+    test_ttl_and_lru_eviction()
+    test_client_serves_cached_signal()
+    test_trader_passes_market_data_to_signal()
+
+    print("\n✅ 모든 테스트 완료")
+
+
+if __name__ == "__main__":
+    main()
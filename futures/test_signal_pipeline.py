@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+🧪 마감 시간 기반 신호 파이프라인 테스트
+"""
+
+import asyncio
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from futures_signal_pipeline import DeadlineSignalPipeline
+
+
+def slow_model():
+    time.sleep(0.3)
+    return {'action': 'BUY', 'confidence': 90}
+
+
+def rule_fallback():
+    return {'action': 'HOLD', 'confidence': 60}
+
+
+def test_deadline_fallback_and_late_result():
+    """마감 초과 시 규칙 신호, 늦은 응답은 다음 틱에 사용"""
+    pipeline = DeadlineSignalPipeline(deadline_seconds=0.05)
+    try:
+        started = time.monotonic()
+        first = pipeline.get_signal_blocking('BTC/USDT', slow_model, rule_fallback)
+        assert time.monotonic() - started < 0.25
+        assert first['source'] == 'rule_based'
+        assert first['action'] == 'HOLD'
+
+        time.sleep(0.4)
+        second = pipeline.get_signal_blocking('BTC/USDT', slow_model, rule_fallback)
+        assert second['source'] == 'model_late'
+        assert second['action'] == 'BUY'
+        assert pipeline.stats['late_cached'] == 1
+        print("✅ 마감 시간 대체 및 늦은 응답 재사용 테스트 통과")
+    finally:
+        pipeline.close()
+
+
+def test_concurrency_cap():
+    """동시 모델 호출 수 제한"""
+    pipeline = DeadlineSignalPipeline(deadline_seconds=2.0, max_concurrency=2)
+    active = {'now': 0, 'peak': 0}
+    lock = threading.Lock()
+
+    def tracked_model():
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+        time.sleep(0.05)
+        with lock:
+            active['now'] -= 1
+        return {'action': 'SELL', 'confidence': 70}
+
+    async def run():
+        return await asyncio.gather(*[
+            pipeline.get_signal(f"SYM{i}", tracked_model, rule_fallback) for i in range(8)
+        ])
+
+    results = asyncio.run(run())
+    assert all(r['source'] == 'model' for r in results)
+    assert active['peak'] == 2
+    print(f"✅ 최대 동시 호출: {active['peak']}")
+
+
+def main():
+    print("🧪 신호 파이프라인 테스트 시작")
+    print("=" * 30)
+
+    test_deadline_fallback_and_late_result()
+    test_concurrency_cap()
+
+    print("\n✅ 모든 테스트 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,8 +11,11 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from futures_time_based_trader import TimeBasedTradingManager
+from futures_config import TRADING_HOURS
 import datetime
 
+import numpy as np
+
 def test_time_based_trading():
     """시간대 기반 거래 로직 테스트"""
     try:
@@ -48,23 +51,54 @@ def test_time_based_trading():
     except Exception as e:
         print(f"❌ 테스트 실패: {e}")
 
-if __name__ == "__main__":
-    test_time_based_trading() key, value in recommendation.items():
-            print(f"{key}: {value}")
-        
-        # 24시간 시뮬레이션
-        print(f"\n=== 24시간 거래 시뮬레이션 ===")
+def test_recommendation_reads_clock_once():
+    """한 번의 추천은 같은 시간 슬롯을 사용"""
+    reads = []
+    moments = iter([
+        datetime.datetime(2024, 1, 1, 10, 59, 59, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2024, 1, 1, 15, 0, 0, tzinfo=datetime.timezone.utc),
+    ])
+
+    def clock():
+        reads.append(1)
+        return next(moments)
+
+    time_manager = TimeBasedTradingManager(clock=clock)  # 생성 시 첫 번째 값 사용
+    recommendation = time_manager.get_trading_recommendation()
+    assert len(reads) == 2
+    assert recommendation["current_hour_utc"] == 15
+    assert recommendation["near_funding"] and not recommendation["should_trade"]
+
+
+def test_week_table_matches_hourly_rules():
+    """사전 계산 테이블이 기존 시간 규칙과 동일"""
+    time_manager = TimeBasedTradingManager()
+    for day in range(7):
         for hour in range(24):
-            is_high_volume = hour in [8, 9, 10, 14, 15, 16, 20, 21, 22]
-            is_funding_time = hour in [0, 8, 16]
-            print(f"시간 {hour:02d}:00 - 고거래량: {is_high_volume}, 펀딩시간: {is_funding_time}")
-            
-        print("✅ 시간대 기반 거래 테스트 완료")
-        return True
-        
-    except Exception as e:
-        print(f"❌ 시간대 기반 거래 테스트 실패: {e}")
-        return False
+            now = datetime.datetime(2024, 1, 1 + day, hour, 30)
+            high = TRADING_HOURS["active_start"] <= hour <= TRADING_HOURS["active_end"]
+            funding = any(abs(hour - ft) <= 1 for ft in TRADING_HOURS["funding_times"])
+            recommendation = time_manager.get_trading_recommendation(now)
+            assert recommendation["is_high_volume"] == high
+            assert recommendation["near_funding"] == funding
+            assert recommendation["should_trade"] == (high and not funding)
+
+
+def test_classify_vectorized_matches_scalar():
+    """벡터 분류 결과가 단일 시각 조회와 일치"""
+    time_manager = TimeBasedTradingManager()
+    stamps = np.arange(
+        np.datetime64("2024-01-01T00:00"), np.datetime64("2024-01-15T00:00"), np.timedelta64(37, "m")
+    )
+    labels = time_manager.classify(stamps)
+    epoch = time_manager.classify(stamps.astype("datetime64[s]").astype(np.int64))
+    assert (epoch["should_trade"] == labels["should_trade"]).all()
+
+    for index in range(0, len(stamps), 50):
+        moment = stamps[index].astype(datetime.datetime)
+        assert labels["leverage_multiplier"][index] == time_manager.get_leverage_multiplier(moment)
+        assert labels["should_trade"][index] == time_manager.get_trading_recommendation(moment)["should_trade"]
+
 
 if __name__ == "__main__":
-    test_time_based_trading()
\ No newline at end of file
+    test_time_based_trading()
@@ -0,0 +1,54 @@
+import datetime
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from futures_time_manager import FuturesTimeManager
+from futures_timing_wheel import HierarchicalTimingWheel
+
+
+def make_wheel():
+    now = [0.0]
+    wheel = HierarchicalTimingWheel(tick_seconds=1.0, wheel_bits=4, levels=3, clock=lambda: now[0])
+    return wheel, now
+
+
+def test_timers_fire_at_deadline_across_levels():
+    wheel, now = make_wheel()
+    fired = []
+    for delay in (3, 16, 40, 300, 5000):  # 5000틱은 최대 범위(4096)를 넘음
+        wheel.schedule(delay, lambda delay=delay: fired.append((delay, wheel.current_tick)))
+
+    wheel.advance(5000)
+    assert fired == [(3, 3), (16, 16), (40, 40), (300, 300), (5000, 5000)]
+    assert len(wheel) == 0
+
+
+def test_cancel_and_periodic():
+    wheel, now = make_wheel()
+    fired = []
+    cancelled = wheel.schedule(10, lambda: fired.append("cancelled"))
+    periodic = wheel.schedule(5, lambda: fired.append(wheel.current_tick), interval=5)
+    wheel.cancel(cancelled)
+
+    wheel.advance(21)
+    assert fired == [5, 10, 15, 20]
+    wheel.cancel(periodic)
+    wheel.advance(40)
+    assert fired == [5, 10, 15, 20] and len(wheel) == 0
+
+
+def test_funding_derisk_rearms_for_next_funding_time():
+    wheel, now = make_wheel()
+    utc_start = datetime.datetime(2024, 1, 1, 7, 0, tzinfo=datetime.timezone.utc)
+    manager = FuturesTimeManager(
+        wheel=wheel, utc_clock=lambda: utc_start + datetime.timedelta(seconds=now[0])
+    )
+    derisked = []
+    manager.schedule_funding_derisk(derisked.append, lead_seconds=300)
+
+    now[0] = 3300.0  # 08:00 펀딩 5분 전(07:55)에 실행
+    wheel.advance()
+    assert [t.hour for t in derisked] == [8]
+    assert manager.jobs['funding_derisk'].expiry_tick == 3300 + 8 * 3600
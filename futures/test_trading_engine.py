@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+🧪 비동기 다중 심볼 거래 엔진 테스트
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from futures_main import FuturesTrader
+from futures_signal_pipeline import DeadlineSignalPipeline
+from futures_trading_engine import AsyncFuturesTradingEngine
+
+
+class StubMarket:
+    """블로킹 시장 데이터 스텁 (심볼별 호출 수 기록)"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = {}
+
+    def get_market_data(self, symbol):
+        time.sleep(self.delay)
+        self.calls[symbol] = self.calls.get(symbol, 0) + 1
+        return {'price': 50000.0, 'volume': 1000.0}
+
+
+class StubSignals:
+    def generate_trading_signal(self, symbol, amount, market_data=None):
+        return {'action': 'HOLD', 'confidence': 50}
+
+
+def _engine_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith("engine-io")]
+
+
+def _run(engine, duration):
+    asyncio.run(engine.run(duration=duration))
+
+
+def test_runs_all_symbols_for_bounded_ticks():
+    """모든 심볼이 틱 주기마다 실행되고 종료 후 스레드가 남지 않음"""
+    market = StubMarket()
+    trader = FuturesTrader(claude_client=StubSignals(), mcp_client=market,
+                           signal_pipeline=DeadlineSignalPipeline(deadline_seconds=0.05))
+    symbols = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+    engine = AsyncFuturesTradingEngine(trader, symbols=symbols, amount=100.0, tick_interval=0.05)
+
+    _run(engine, 0.28)
+    totals = engine.get_stats()['totals']
+    assert totals['errors'] == 0 and totals['timeouts'] == 0
+    for symbol in symbols:
+        assert 3 <= engine.symbol_stats[symbol]['ticks'] <= 7
+        assert market.calls[symbol] == engine.symbol_stats[symbol]['ticks']
+    assert engine._tasks == []
+    assert _engine_threads() == []
+    print("✅ 다중 심볼 틱 실행 테스트 통과")
+
+
+def test_repeated_runs_do_not_leak_threads():
+    """같은 이벤트 루프에서 run()을 반복해도 엔진 I/O 스레드가 누적되지 않음"""
+    trader = FuturesTrader(claude_client=StubSignals(), mcp_client=StubMarket())
+    engine = AsyncFuturesTradingEngine(trader, symbols=["BTC/USDT", "ETH/USDT"], tick_interval=0.02)
+
+    async def repeated():
+        for _ in range(3):
+            await engine.run(duration=0.05)
+        for thread in _engine_threads():
+            thread.join(timeout=1.0)
+        return _engine_threads()
+
+    assert asyncio.run(repeated()) == []
+    print("✅ 스레드 정리 테스트 통과")
+
+
+def test_open_ended_run_ticks_until_stopped():
+    """duration 없이 실행하면 stop() 호출 전까지 종료하지 않음"""
+    trader = FuturesTrader(claude_client=StubSignals(), mcp_client=StubMarket())
+    engine = AsyncFuturesTradingEngine(trader, symbols=["BTC/USDT"], tick_interval=0.02)
+
+    async def run_then_stop():
+        task = asyncio.ensure_future(engine.run())
+        await asyncio.sleep(0.2)
+        running = not task.done()
+        engine.stop()
+        await asyncio.wait_for(task, timeout=1.0)
+        return running
+
+    assert asyncio.run(run_then_stop())
+    assert engine.symbol_stats["BTC/USDT"]['ticks'] >= 5
+    print("✅ 무기한 실행 테스트 통과")
+
+
+def test_running_engine_follows_reloaded_symbol_list():
+    """설정 재적재로 SUPPORTED_FUTURES가 바뀌면 실행 중인 엔진이 심볼을 추가/중단"""
+    import types
+    from config_snapshot import CONFIG, build_snapshot
+
+    def snapshot(symbols, version):
+        futures = types.SimpleNamespace(SUPPORTED_FUTURES=symbols)
+        return build_snapshot(futures, types.SimpleNamespace(), version=version)
+
+    original = CONFIG.current
+    CONFIG.swap(snapshot(["BTC/USDT", "ETH/USDT"], original.version + 1))
+    try:
+        market = StubMarket()
+        trader = FuturesTrader(claude_client=StubSignals(), mcp_client=market)
+        engine = AsyncFuturesTradingEngine(trader, tick_interval=0.02)
+
+        async def reload_while_running():
+            task = asyncio.ensure_future(engine.run())
+            await asyncio.sleep(0.1)
+            CONFIG.swap(snapshot(["BTC/USDT", "SOL/USDT"], original.version + 2))
+            await asyncio.sleep(0.15)
+            eth_calls = market.calls.get("ETH/USDT", 0)
+            await asyncio.sleep(0.1)
+            engine.stop()
+            await asyncio.wait_for(task, timeout=1.0)
+            return eth_calls
+
+        eth_calls = asyncio.run(reload_while_running())
+    finally:
+        CONFIG.swap(original)
+
+    assert engine.symbols == ["BTC/USDT", "SOL/USDT"]
+    assert engine.symbol_stats["SOL/USDT"]['ticks'] >= 3
+    assert market.calls["ETH/USDT"] == eth_calls  # 제거된 심볼은 더 이상 실행하지 않음
+    print("✅ 설정 재적재 심볼 반영 테스트 통과")
+
+
+def test_slow_symbol_times_out_without_blocking_others():
+    """느린 심볼은 자기 틱만 시간 초과, 다른 심볼은 계속 실행"""
+    class MixedMarket(StubMarket):
+        def get_market_data(self, symbol):
+            self.delay = 0.2 if symbol == "SLOW" else 0.0
+            return super().get_market_data(symbol)
+
+    trader = FuturesTrader(claude_client=StubSignals(), mcp_client=MixedMarket())
+    engine = AsyncFuturesTradingEngine(trader, symbols=["SLOW", "FAST"], tick_interval=0.05)
+    _run(engine, 0.3)
+
+    assert engine.symbol_stats["SLOW"]['timeouts'] >= 1
+    assert engine.symbol_stats["FAST"]['ticks'] >= 3
+    assert engine.symbol_stats["FAST"]['timeouts'] == 0
+    print("✅ 느린 심볼 격리 테스트 통과")
+
+
+def main():
+    print("🧪 거래 엔진 테스트 시작")
+    print("=" * 30)
+
+    test_runs_all_symbols_for_bounded_ticks()
+    test_repeated_runs_do_not_leak_threads()
+    test_open_ended_run_ticks_until_stopped()
+    test_running_engine_follows_reloaded_symbol_list()
+    test_slow_symbol_times_out_without_blocking_others()
+
+    print("\n✅ 모든 테스트 완료")
+
+
+if __name__ == "__main__":
+    main()
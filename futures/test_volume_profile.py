@@ -0,0 +1,62 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from futures_time_based_trader import TimeBasedTradingManager
+from futures_volume_profile import VolumeProfileStore
+
+MONDAY = 1704067200  # 2024-01-01 00:00 UTC (월요일)
+
+
+def make_klines(weeks, start=MONDAY):
+    rows = []
+    for hour in range(weeks * 168):
+        open_time = start + hour * 3600
+        busy = (hour % 24) in (2, 3)  # 02~03시 UTC에 거래량 집중
+        rows.append([open_time * 1000, "100", "101" if busy else "100.5", "99.5", "100", "500" if busy else "100"])
+    return rows
+
+
+def test_profile_learns_busy_hours_and_persists(tmp_path):
+    store = VolumeProfileStore(str(tmp_path))
+    profile = store.update("BTC/USDT", make_klines(4))
+    assert profile.high_volume_hours() == [2, 3]
+    assert profile.spread()[2] > profile.spread()[10]
+
+    # 이미 반영한 봉은 무시하고 새 봉만 증분 반영
+    assert profile.update_klines(make_klines(4)) == 0
+    assert profile.update_klines(make_klines(1, start=MONDAY + 4 * 7 * 86400)) == 168
+
+    reloaded = VolumeProfileStore(str(tmp_path)).get("BTC/USDT")
+    assert int(reloaded.bar_count.sum()) == 4 * 168
+
+
+def test_manager_uses_learned_profile(tmp_path):
+    profile = VolumeProfileStore(str(tmp_path)).update("ETH/USDT", make_klines(4))
+    manager = TimeBasedTradingManager(volume_profile=profile)
+    labels = manager.classify(np.array([MONDAY + 2 * 3600, MONDAY + 12 * 3600]))
+    assert labels["is_high_volume"].tolist() == [True, False]
+
+
+def test_dict_rows_use_same_timestamp_units(tmp_path):
+    from futures_volume_profile import klines_to_arrays
+
+    rows = make_klines(1)
+    dict_rows = [{"open_time": row[0], "high": row[2], "low": row[3], "close": row[4], "volume": row[5]}
+                 for row in rows]
+    seconds_rows = [dict(row, timestamp=row["open_time"] / 1000) for row in dict_rows[:3]]
+
+    from_lists = klines_to_arrays(rows)["timestamp"]
+    assert from_lists[0] == MONDAY
+    assert np.array_equal(klines_to_arrays(dict_rows)["timestamp"], from_lists)
+    assert np.array_equal(klines_to_arrays(seconds_rows)["timestamp"], from_lists[:3])
+    # 밀리초/초가 섞인 입력도 같은 슬롯으로 집계
+    mixed = klines_to_arrays(dict_rows[:2] + seconds_rows[2:])["timestamp"]
+    assert np.array_equal(mixed, from_lists[:3])
+
+    dict_weeks = [{"open_time": row[0], "high": row[2], "low": row[3], "close": row[4], "volume": row[5]}
+                  for row in make_klines(4)]
+    assert VolumeProfileStore(str(tmp_path)).update("SOL/USDT", dict_weeks).high_volume_hours() == [2, 3]
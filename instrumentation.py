@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+📈 경량 계측 모듈
+- HDR 스타일 로그-선형 히스토그램과 카운터
+- LLM 호출 지연시간, 대기시간, 토큰, 비용, 캐시 적중, 실패 기록
+- Prometheus 텍스트 / JSON 내보내기
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+
+# 모델별 가격 (USD / 100만 토큰)
+MODEL_PRICING = {
+    "default": {"input_per_mtok": 3.0, "output_per_mtok": 15.0},
+    "simulated": {"input_per_mtok": 0.0, "output_per_mtok": 0.0}
+}
+
+
+class Histogram:
+    """HDR 스타일 로그-선형 히스토그램 (정수 값, 상대 오차 약 1/2^precision_bits)"""
+
+    def __init__(self, precision_bits: int = 5, max_bits: int = 48):
+        self.precision_bits = precision_bits
+        self.half = 1 << precision_bits
+        self.counts = [0] * ((max_bits - precision_bits + 1) * self.half)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value: int) -> int:
+        if value < (self.half << 1):
+            return value
+        shift = value.bit_length() - self.precision_bits - 1
+        return shift * self.half + (value >> shift)
+
+    def _lower_bound(self, index: int) -> int:
+        if index < (self.half << 1):
+            return index
+        shift = index // self.half - 1
+        return (index - shift * self.half) << shift
+
+    def record(self, value: int):
+        """값 기록"""
+        value = max(0, int(value))
+        index = min(self._index(value), len(self.counts) - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, pct: float) -> int:
+        """분위수 값 (버킷 중간값 기준)"""
+        if self.count == 0:
+            return 0
+        target = max(1, int(round(self.count * pct / 100.0)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                middle = (self._lower_bound(index) + self._lower_bound(index + 1) - 1) // 2
+                return min(max(middle, self.min), self.max)
+        return self.max
+
+    def buckets(self):
+        """비어 있지 않은 (상한, 누적 개수) 목록"""
+        cumulative = 0
+        result = []
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count:
+                cumulative += bucket_count
+                result.append((self._lower_bound(index + 1) - 1, cumulative))
+        return result
+
+    def merge(self, other: 'Histogram'):
+        """다른 히스토그램 병합 (같은 정밀도 전제)"""
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                self.counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def summary(self) -> Dict[str, Any]:
+        """요약 통계"""
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min or 0,
+            'max': self.max or 0,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99)
+        }
+
+
+class MetricsRegistry:
+    """레이블별 카운터/히스토그램 저장소"""
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, labels: tuple = (), amount: float = 1):
+        """카운터 증가"""
+        key = (name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name: str, labels: tuple, value: int):
+        """히스토그램에 값 기록"""
+        key = (name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.record(value)
+
+    def reset(self):
+        """모든 지표 초기화"""
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    @staticmethod
+    def _format_labels(labels: tuple, extra: str = "") -> str:
+        parts = [f'{k}="{v}"' for k, v in labels]
+        if extra:
+            parts.append(extra)
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 내보내기"""
+        lines = []
+        with self._lock:
+            for name in sorted({key[0] for key in self.counters}):
+                lines.append(f"# TYPE {name} counter")
+                for (metric, labels), value in sorted(self.counters.items()):
+                    if metric == name:
+                        lines.append(f"{name}{self._format_labels(labels)} {value}")
+
+            for name in sorted({key[0] for key in self.histograms}):
+                lines.append(f"# TYPE {name} histogram")
+                for (metric, labels), histogram in sorted(self.histograms.items(), key=lambda item: item[0]):
+                    if metric != name:
+                        continue
+                    for upper, cumulative in histogram.buckets():
+                        bucket_labels = self._format_labels(labels, 'le="%d"' % upper)
+                        lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                    inf_labels = self._format_labels(labels, 'le="+Inf"')
+                    lines.append(f"{name}_bucket{inf_labels} {histogram.count}")
+                    lines.append(f"{name}_sum{self._format_labels(labels)} {histogram.total}")
+                    lines.append(f"{name}_count{self._format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 딕셔너리"""
+        with self._lock:
+            return {
+                'counters': [
+                    {'name': name, 'labels': dict(labels), 'value': value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                'histograms': [
+                    {'name': name, 'labels': dict(labels), **histogram.summary()}
+                    for (name, labels), histogram in sorted(self.histograms.items(), key=lambda item: item[0])
+                ]
+            }
+
+    def to_json(self) -> str:
+        """JSON 문자열로 내보내기"""
+        return json.dumps(self.to_dict(), indent=2)
+
+
+class LLMCall:
+    """진행 중인 LLM 호출 정보 (호출자가 토큰/캐시 정보를 채움)"""
+
+    __slots__ = ('path', 'model', 'input_tokens', 'output_tokens', 'cache_hit', 'queue_wait')
+
+    def __init__(self, path: str, model: str):
+        self.path = path
+        self.model = model
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_hit = False
+        self.queue_wait = 0.0
+
+
+class LLMInstrumentation:
+    """모든 모델 호출을 감싸는 계측 레이어"""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, pricing: Optional[dict] = None):
+        self.registry = registry or MetricsRegistry()
+        self.pricing = pricing or MODEL_PRICING
+        self.enabled = True
+
+    @contextmanager
+    def track(self, path: str, model: str = "default"):
+        """모델 호출 계측 컨텍스트 (예외 발생 시 실패로 기록)"""
+        call = LLMCall(path, model)
+        started = time.perf_counter()
+        try:
+            yield call
+        except Exception:
+            if self.enabled:
+                self._record(call, time.perf_counter() - started, "error")
+            raise
+        if self.enabled:
+            self._record(call, time.perf_counter() - started, "cache_hit" if call.cache_hit else "ok")
+
+    def record_queue_wait(self, path: str, seconds: float):
+        """동시성 제한 대기 시간 기록"""
+        if self.enabled:
+            self.registry.observe("llm_queue_wait_us", (("path", path),), seconds * 1e6)
+
+    def _record(self, call: LLMCall, seconds: float, outcome: str):
+        labels = (("path", call.path),)
+        registry = self.registry
+        registry.inc("llm_calls_total", labels + (("outcome", outcome),))
+        registry.observe("llm_latency_us", labels, seconds * 1e6)
+        if call.queue_wait:
+            registry.observe("llm_queue_wait_us", labels, call.queue_wait * 1e6)
+        if outcome == "cache_hit":
+            return
+
+        registry.observe("llm_input_tokens", labels, call.input_tokens)
+        registry.observe("llm_output_tokens", labels, call.output_tokens)
+        price = self.pricing.get(call.model, self.pricing["default"])
+        cost = (call.input_tokens * price["input_per_mtok"] + call.output_tokens * price["output_per_mtok"]) / 1e6
+        registry.inc("llm_cost_usd_total", labels, cost)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """경로별 호출 수, 실패율, 지연시간, 토큰, 비용 요약"""
+        paths = {}
+        for (name, labels), value in list(self.registry.counters.items()):
+            label_map = dict(labels)
+            entry = paths.setdefault(label_map["path"], {
+                'calls': 0, 'errors': 0, 'cache_hits': 0, 'cost_usd': 0.0
+            })
+            if name == "llm_calls_total":
+                entry['calls'] += value
+                if label_map["outcome"] == "error":
+                    entry['errors'] += value
+                elif label_map["outcome"] == "cache_hit":
+                    entry['cache_hits'] += value
+            elif name == "llm_cost_usd_total":
+                entry['cost_usd'] += value
+
+        for (name, labels), histogram in list(self.registry.histograms.items()):
+            entry = paths.setdefault(dict(labels)["path"], {
+                'calls': 0, 'errors': 0, 'cache_hits': 0, 'cost_usd': 0.0
+            })
+            if name == "llm_latency_us":
+                entry['latency_p50_us'] = histogram.percentile(50)
+                entry['latency_p99_us'] = histogram.percentile(99)
+                entry['total_latency_us'] = histogram.total
+            elif name == "llm_input_tokens":
+                entry['input_tokens'] = histogram.total
+            elif name == "llm_output_tokens":
+                entry['output_tokens'] = histogram.total
+
+        for entry in paths.values():
+            entry['error_rate'] = entry['errors'] / entry['calls'] if entry['calls'] else 0.0
+        return paths
+
+    def to_prometheus(self) -> str:
+        return self.registry.to_prometheus()
+
+    def to_json(self) -> str:
+        return json.dumps({'summary': self.summary(), 'metrics': self.registry.to_dict()}, indent=2)
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (약 4자당 1토큰)"""
+    return max(1, len(text) // 4)
+
+
+# 전역 기본 계측 인스턴스
+LLM_METRICS = LLMInstrumentation()
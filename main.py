@@ -2,41 +2,382 @@
 #!/usr/bin/env python3
 """
 🚀 Claude AI Trading System - 간소화된 메인
+
+인자 없이 실행하면 기존 데모 백테스트, 하위 명령으로 배치 작업 실행:
+  python main.py backtest   --symbols BTC-USD,ETH-USD --workers 4
+  python main.py sweep      --symbols BTC-USD --ma-windows 3,5,10,20 --trade-sizes 0.05,0.1 --format csv
+  python main.py replay     --journal data/trades.journal --start 2024-01-01
+  python main.py live-paper --symbols BTC/USDT --ticks 10 --interval 1
+공통 옵션: --data-source, --symbols, --workers, --format, --profile
 """
 
+import argparse
+import contextlib
+import csv
+import io
+import itertools
+import json
+import os
+import sys
+import time
 from datetime import datetime
 from backtester import UnifiedBacktester
 
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_FORMATS = ("text", "json", "csv")
+
+
+def _add_module_path(subdir: str):
+    """하위 패키지 디렉터리를 sys.path에 한 번만 추가 (작업마다 중복 항목이 쌓이지 않도록)"""
+    path = os.path.join(ROOT_DIR, subdir)
+    if path not in sys.path:
+        sys.path.append(path)
+
+
 def run_simple_backtest():
     """간단한 백테스팅 실행"""
     print("📊 백테스팅 시작")
     print("-" * 30)
-    
+
     bt = UnifiedBacktester(10000)
-    
+
     # 샘플 거래들
     bt.buy('BTC', 45000, 0.1)
     bt.buy('ETH', 3000, 1.0)
     bt.sell('BTC', 47000, 0.1)
     bt.sell('ETH', 3200, 0.8)
-    
+
     # 결과 출력
     print(bt.generate_report())
 
-def main():
+
+# ---- 데이터 소스 ----
+
+def load_prices(data_source: str, symbol: str, start_date: str, end_date: str):
+    """가격 목록 로드 ('sample'이면 None - 백테스터가 랜덤 워크 생성)
+
+    csv:<경로> - date,symbol,price[,volume] 열을 가진 CSV (symbol 열이 없으면 전체 사용)
+    yahoo      - yfinance 일봉 종가
+    """
+    if data_source == "sample":
+        return None
+    if data_source.startswith("csv:"):
+        rows = []
+        with open(data_source[4:], newline="") as f:
+            for row in csv.DictReader(f):
+                if row.get("symbol", symbol) != symbol:
+                    continue
+                date = datetime.fromisoformat(row["date"])
+                if start_date <= row["date"][:10] <= end_date:
+                    rows.append({"date": date, "price": float(row["price"]),
+                                 "volume": float(row.get("volume") or 0.0)})
+        return rows
+    if data_source == "yahoo":
+        import yfinance as yf
+
+        history = yf.download(symbol, start=start_date, end=end_date, progress=False)
+        return [{"date": index.to_pydatetime(), "price": float(row["Close"]), "volume": float(row["Volume"])}
+                for index, row in history.iterrows()]
+    raise ValueError(f"Unknown data source: {data_source}")
+
+
+def run_backtest_job(job: dict) -> dict:
+    """백테스트 1회 실행 (프로세스 풀 작업 단위 - pickle 가능한 dict 입출력)"""
+    _add_module_path("spot")
+    from spot_backtester import SpotBacktester
+
+    started = time.perf_counter()
+    backtester = SpotBacktester(job["symbol"], job["start_date"], job["end_date"],
+                                initial_capital=job["initial_capital"], ma_window=job["ma_window"],
+                                trade_quantity=job["trade_quantity"], seed=job.get("seed"))
+    prices = load_prices(job["data_source"], job["symbol"], job["start_date"], job["end_date"])
+    if prices is not None:
+        backtester.price_data = prices
+    equity_curve = backtester.run()
+    performance = backtester.get_performance()
+    # 수익률은 마지막 가격으로 평가한 자산 가치 기준 (get_performance는 고정 기본 가격 사용)
+    final_value = equity_curve[-1]["total_value"] if equity_curve else job["initial_capital"]
+    result = {
+        "symbol": job["symbol"],
+        "ma_window": job["ma_window"],
+        "trade_quantity": job["trade_quantity"],
+        "final_value": final_value,
+        "roi_percent": (final_value - job["initial_capital"]) / job["initial_capital"] * 100,
+        "buy_and_hold_return": performance.get("buy_and_hold_return", 0.0),
+        "total_trades": performance["total_trades"],
+        "bars": len(equity_curve),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+    if job.get("keep_series"):
+        # 결과 저장소 기록은 부모 프로세스에서 (인덱스 단일 기록자)
+        result["_equity_curve"] = equity_curve
+        result["_trades"] = backtester.trades
+    return result
+
+
+def save_results(results, args, kind: str):
+    """--results-dir 지정 시 실행별 지표/거래/자산 곡선 저장"""
+    if not args.results_dir:
+        return results
+    from results_store import ResultsStore
+
+    store = ResultsStore(args.results_dir)
+    for result in results:
+        equity_curve = result.pop("_equity_curve")
+        trades = result.pop("_trades")
+        params = {"symbol": result["symbol"], "ma_window": result["ma_window"],
+                  "trade_quantity": result["trade_quantity"], "start_date": args.start, "end_date": args.end,
+                  "data_source": args.data_source, "seed": args.seed, "initial_capital": args.capital}
+        metrics = {key: value for key, value in result.items() if key not in params}
+        result["run_id"] = store.write_run(params, metrics, trades=trades, equity_curve=equity_curve, kind=kind)
+    return results
+
+
+def run_jobs(func, jobs, workers: int, progress=None):
+    """작업 실행 - workers > 1이면 프로세스 풀, 완료 순서대로 결과 전달"""
+    total = len(jobs)
+    results = []
+    if workers <= 1 or total <= 1:
+        completed = map(func, jobs)
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        futures = [executor.submit(func, job) for job in jobs]
+        completed = (future.result() for future in as_completed(futures))
+    try:
+        for done, result in enumerate(completed, 1):
+            results.append(result)
+            if progress is not None:
+                progress(done, total, result)
+    finally:
+        if workers > 1 and total > 1:
+            executor.shutdown(cancel_futures=True)
+    return results
+
+
+# ---- 출력 ----
+
+def stream_progress(stream=None):
+    started = time.perf_counter()
+
+    def report(done, total, result):
+        out = stream if stream is not None else sys.stderr
+        label = " ".join(f"{key}={result[key]}" for key in ("symbol", "ma_window", "trade_quantity") if key in result)
+        roi = f" roi={result['roi_percent']:.2f}%" if "roi_percent" in result else ""
+        out.write(f"[{done}/{total}] {time.perf_counter() - started:6.2f}s {label}{roi}\n")
+        out.flush()
+    return report
+
+
+def format_results(rows, output_format: str) -> str:
+    if output_format == "json":
+        return json.dumps(rows, indent=2, default=str, ensure_ascii=False)
+    if not rows:
+        return ""
+    columns = list(rows[0])
+    if output_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue().rstrip("\n")
+    widths = {column: max(len(column), *(len(_cell(row.get(column))) for row in rows)) for column in columns}
+    lines = ["  ".join(column.ljust(widths[column]) for column in columns)]
+    lines += ["  ".join(_cell(row.get(column)).ljust(widths[column]) for column in columns) for row in rows]
+    return "\n".join(lines)
+
+
+def _cell(value) -> str:
+    return f"{value:.4f}" if isinstance(value, float) else str(value)
+
+
+# ---- 하위 명령 ----
+
+def _parse_list(value: str, cast=str):
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+
+def _backtest_jobs(args, ma_windows, trade_sizes):
+    # 같은 심볼은 모든 파라미터 조합에서 같은 sample 가격 경로 사용
+    return [
+        {"symbol": symbol, "start_date": args.start, "end_date": args.end, "initial_capital": args.capital,
+         "ma_window": ma_window, "trade_quantity": trade_size, "data_source": args.data_source,
+         "seed": args.seed + args.symbols.index(symbol), "keep_series": bool(args.results_dir)}
+        for symbol, ma_window, trade_size in itertools.product(args.symbols, ma_windows, trade_sizes)
+    ]
+
+
+def cmd_backtest(args):
+    jobs = _backtest_jobs(args, [args.ma_window], [args.trade_size])
+    return save_results(run_jobs(run_backtest_job, jobs, args.workers, stream_progress()), args, "backtest")
+
+
+def cmd_sweep(args):
+    jobs = _backtest_jobs(args, _parse_list(args.ma_windows, int), _parse_list(args.trade_sizes, float))
+    results = save_results(run_jobs(run_backtest_job, jobs, args.workers, stream_progress()), args, "sweep")
+    return sorted(results, key=lambda row: row["roi_percent"], reverse=True)
+
+
+def cmd_replay(args):
+    """거래 저널을 백테스터에 다시 적용"""
+    _add_module_path("futures")
+    from futures_trade_journal import TradeJournal
+
+    journal = TradeJournal(args.journal)
+    try:
+        entries = journal.read_range(args.start_time, args.end_time)
+    finally:
+        journal.close()
+
+    backtester = UnifiedBacktester(args.capital)
+    symbols = set(args.symbols) if args.symbols else None
+    for entry in entries:
+        if symbols is not None and entry["symbol"] not in symbols:
+            continue
+        if not entry["executed"] or entry["price"] <= 0:
+            continue
+        quantity = entry["amount"] / entry["price"]
+        if entry["action"] == "BUY":
+            backtester.buy(entry["symbol"], entry["price"], quantity)
+        elif entry["action"] == "SELL":
+            backtester.sell(entry["symbol"], entry["price"], min(quantity, backtester.positions.get(entry["symbol"], 0)))
+    performance = backtester.get_performance()
+    performance["journal_entries"] = len(entries)
+    return [performance]
+
+
+def cmd_live_paper(args):
+    """시뮬레이션 거래소로 실시간 페이퍼 트레이딩"""
+    _add_module_path("futures")
+    from futures_claude_client import FuturesClaudeClient
+    from futures_main import FuturesTrader
+    from futures_mcp_client import FuturesMCPClient
+
+    trader = FuturesTrader(claude_client=FuturesClaudeClient("paper_trading"), mcp_client=FuturesMCPClient())
+    progress = stream_progress()
+    total = args.ticks * len(args.symbols)
+    results = []
+    for tick in range(args.ticks):
+        for symbol in args.symbols:
+            result = trader.execute_futures_trading_strategy(symbol, args.amount)
+            signal = result.get("signal") or {}
+            row = {"tick": tick, "symbol": symbol, "action": signal.get("action", "HOLD"),
+                   "price": (result.get("market_data") or {}).get("price"),
+                   "executed": bool(result.get("executed")), "error": result.get("error", "")}
+            results.append(row)
+            progress(len(results), total, row)
+        if tick + 1 < args.ticks:
+            time.sleep(args.interval)
+    return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--data-source", default="sample",
+                        help="가격 데이터: sample | csv:<경로> | yahoo (기본: sample)")
+    common.add_argument("--symbols", type=_parse_list, default=None, help="쉼표로 구분한 심볼 목록")
+    common.add_argument("--workers", type=int, default=1, help="병렬 프로세스 수 (기본: 1)")
+    common.add_argument("--format", choices=OUTPUT_FORMATS, default="text", help="결과 출력 형식")
+    common.add_argument("--profile", action="store_true", help="cProfile 결과를 stderr에 출력 (부모 프로세스 기준)")
+    common.add_argument("--profile-output", default=None, help="cProfile 통계 파일 저장 경로")
+    common.add_argument("--capital", type=float, default=10000.0, help="초기 자본")
+
+    parser = argparse.ArgumentParser(prog="main.py", description="Claude AI Trading System")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_range(sub):
+        sub.add_argument("--start", default="2023-01-01", help="시작일 (YYYY-MM-DD)")
+        sub.add_argument("--end", default="2023-12-31", help="종료일 (YYYY-MM-DD)")
+        sub.add_argument("--seed", type=int, default=0, help="sample 데이터 난수 시드 (심볼마다 +1)")
+        sub.add_argument("--results-dir", default=None, help="실행 결과 저장소 디렉터리 (results_store)")
+
+    backtest = commands.add_parser("backtest", parents=[common], help="심볼별 백테스트")
+    add_range(backtest)
+    backtest.add_argument("--ma-window", type=int, default=5)
+    backtest.add_argument("--trade-size", type=float, default=0.1)
+    backtest.set_defaults(handler=cmd_backtest, default_symbols=["BTC-USD"])
+
+    sweep = commands.add_parser("sweep", parents=[common], help="파라미터 격자 백테스트")
+    add_range(sweep)
+    sweep.add_argument("--ma-windows", default="3,5,10,20")
+    sweep.add_argument("--trade-sizes", default="0.1")
+    sweep.set_defaults(handler=cmd_sweep, default_symbols=["BTC-USD"])
+
+    replay = commands.add_parser("replay", parents=[common], help="거래 저널 재생")
+    replay.add_argument("--journal", required=True, help="TradeJournal 파일 경로")
+    replay.add_argument("--start", dest="start_time", default=None, help="시작 시각 (ISO 8601)")
+    replay.add_argument("--end", dest="end_time", default=None, help="종료 시각 (ISO 8601)")
+    replay.set_defaults(handler=cmd_replay, default_symbols=None)
+
+    live = commands.add_parser("live-paper", parents=[common], help="시뮬레이션 거래소 페이퍼 트레이딩")
+    live.add_argument("--ticks", type=int, default=5)
+    live.add_argument("--interval", type=float, default=1.0, help="틱 간격 (초)")
+    live.add_argument("--amount", type=float, default=1000.0)
+    live.set_defaults(handler=cmd_live_paper, default_symbols=["BTC/USDT"])
+    return parser
+
+
+def run_cli(argv) -> int:
+    args = build_parser().parse_args(argv)
+    if args.symbols is None:
+        args.symbols = args.default_symbols
+
+    profiler = None
+    if args.profile or args.profile_output:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        # 실행 중 모듈 로그는 stderr로 보내 stdout에는 결과만 남김
+        with contextlib.redirect_stdout(sys.stderr):
+            from config_snapshot import init_config
+
+            init_config()  # 설정 검증/스냅샷 생성은 작업 시작 전에 한 번
+            results = args.handler(args)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            _report_profile(profiler, args)
+
+    output = format_results(results, args.format)
+    if output:
+        print(output)
+    return 0
+
+
+def _report_profile(profiler, args):
+    import pstats
+
+    if args.profile_output:
+        profiler.dump_stats(args.profile_output)
+    if args.profile:
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats("cumulative").print_stats(25)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        return run_cli(argv) == 0
+
     print("🚀 Claude AI Trading System")
     print("=" * 40)
     print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
+
     try:
         run_simple_backtest()
         print("✅ 시스템이 성공적으로 실행되었습니다!")
-        
+
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
         return False
-    
+
     return True
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+📒 로컬 포지션 관리자
+- 주문 체결을 적용하여 평균 진입가, 실현/미실현 손익, 사용 증거금 갱신
+- 표시 가격은 시장 데이터 수신 시 스트리밍 갱신
+- 거래소와는 주기적으로만 대조하여 조회 시 네트워크 왕복 없음
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Callable, Optional
+
+SIDE_SIGN = {'BUY': 1.0, 'SELL': -1.0, 'LONG': 1.0, 'SHORT': -1.0}
+
+
+class PositionKeeper:
+    """체결 기반 로컬 포지션/계정 상태"""
+
+    def __init__(self, initial_balance: float = 10000.0, leverage: float = 1.0,
+                 commission_rate: float = 0.0, reconcile_interval: float = 30.0, clock=time.monotonic):
+        self.initial_balance = initial_balance
+        self.leverage = leverage
+        self.commission_rate = commission_rate
+        self.reconcile_interval = reconcile_interval
+        self.clock = clock
+
+        self.positions = {}  # symbol -> {'size', 'entry_price', 'realized_pnl'}
+        self.marks = {}      # symbol -> 최근 표시 가격
+        self.realized_pnl = 0.0
+        self.fees_paid = 0.0
+        self.stats = {'fills': 0, 'reconciles': 0, 'corrections': 0}
+        self._last_reconcile = clock()
+        self._lock = threading.Lock()
+
+    def update_mark(self, symbol: str, price: float):
+        """표시 가격 갱신"""
+        if price:
+            self.marks[symbol] = price
+
+    def apply_fill(self, symbol: str, side: str, quantity: float, price: float):
+        """체결 적용 - 평균 진입가 및 실현 손익 갱신"""
+        signed = SIDE_SIGN[side.upper()] * quantity
+        fee = abs(quantity * price) * self.commission_rate
+        with self._lock:
+            position = self.positions.setdefault(symbol, {'size': 0.0, 'entry_price': 0.0, 'realized_pnl': 0.0})
+            held = position['size']
+            new_size = held + signed
+
+            if held == 0 or held * signed > 0:
+                position['entry_price'] = (held * position['entry_price'] + signed * price) / new_size
+            else:
+                closed = min(abs(signed), abs(held))
+                pnl = closed * (price - position['entry_price']) * (1 if held > 0 else -1)
+                position['realized_pnl'] += pnl
+                self.realized_pnl += pnl
+                if new_size == 0:
+                    position['entry_price'] = 0.0
+                elif held * new_size < 0:
+                    position['entry_price'] = price
+
+            position['size'] = new_size
+            position['realized_pnl'] -= fee
+            self.realized_pnl -= fee
+            self.fees_paid += fee
+            self.stats['fills'] += 1
+        self.update_mark(symbol, price)
+
+    def _unrealized(self, symbol: str, position: Dict[str, float]) -> float:
+        mark = self.marks.get(symbol, position['entry_price'])
+        return position['size'] * (mark - position['entry_price'])
+
+    def _margin(self, symbol: str, position: Dict[str, float]) -> float:
+        mark = self.marks.get(symbol, position['entry_price'])
+        return abs(position['size'] * mark) / self.leverage
+
+    def get_position(self, symbol: str) -> Dict[str, Any]:
+        """로컬 포지션 조회 (네트워크 호출 없음)"""
+        position = self.positions.get(symbol, {'size': 0.0, 'entry_price': 0.0, 'realized_pnl': 0.0})
+        return {
+            'symbol': symbol,
+            'size': position['size'],
+            'entry_price': position['entry_price'],
+            'mark_price': self.marks.get(symbol, position['entry_price']),
+            'unrealized_pnl': self._unrealized(symbol, position),
+            'realized_pnl': position['realized_pnl'],
+            'margin': self._margin(symbol, position),
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def get_account_info(self) -> Dict[str, Any]:
+        """체결과 표시 가격으로 계산한 계정 정보"""
+        open_positions = {s: p for s, p in self.positions.items() if p['size']}
+        unrealized = sum(self._unrealized(s, p) for s, p in open_positions.items())
+        margin_used = sum(self._margin(s, p) for s, p in open_positions.items())
+        balance = self.initial_balance + self.realized_pnl
+        return {
+            'balance': balance,
+            'equity': balance + unrealized,
+            'available_balance': balance + unrealized - margin_used,
+            'margin_used': margin_used,
+            'unrealized_pnl': unrealized,
+            'realized_pnl': self.realized_pnl,
+            'positions': [self.get_position(symbol) for symbol in open_positions],
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def needs_reconcile(self) -> bool:
+        return self.clock() - self._last_reconcile >= self.reconcile_interval
+
+    def reconcile(self, venue_positions: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+        """거래소 포지션으로 로컬 상태 보정, 차이 나는 심볼 반환"""
+        corrections = {}
+        with self._lock:
+            for symbol in set(self.positions) | set(venue_positions):
+                venue = venue_positions.get(symbol, {'size': 0.0, 'entry_price': 0.0})
+                local = self.positions.get(symbol)
+                local_size = local['size'] if local else 0.0
+                if abs(local_size - venue['size']) > 1e-12:
+                    corrections[symbol] = {'local': local_size, 'venue': venue['size']}
+                    position = self.positions.setdefault(
+                        symbol, {'size': 0.0, 'entry_price': 0.0, 'realized_pnl': 0.0}
+                    )
+                    position['size'] = venue['size']
+                    position['entry_price'] = venue.get('entry_price', position['entry_price'])
+            self._last_reconcile = self.clock()
+            self.stats['reconciles'] += 1
+            self.stats['corrections'] += len(corrections)
+        if corrections:
+            print(f"Position reconcile corrected {len(corrections)} symbols: {corrections}")
+        return corrections
+
+    def maybe_reconcile(self, fetch_venue_positions: Callable[[], Optional[Dict[str, Dict[str, float]]]]):
+        """주기가 지났을 때만 거래소 포지션을 가져와 대조"""
+        if not self.needs_reconcile():
+            return None
+        venue_positions = fetch_venue_positions()
+        if venue_positions is None:
+            self._last_reconcile = self.clock()
+            return None
+        return self.reconcile(venue_positions)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+🗄️ 백테스트 결과 열 저장소
+- 실행마다 거래/자산 곡선을 NumPy 열 파일(.npz) 하나로 저장 (pickle 미사용)
+- 실행 메타데이터(파라미터 + 지표)는 추가 전용 JSON Lines 인덱스에 기록
+- 인덱스 열을 numpy 배열로 캐시하여 수천 건의 스윕 결과를 벡터 필터로 조회
+- 열 파일은 필요한 열만 지연 로드
+"""
+
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+
+import numpy as np
+
+SIDE_CODES = {'buy': 1, 'sell': -1}
+FILTER_OPS = {
+    'gt': np.greater, 'gte': np.greater_equal, 'lt': np.less, 'lte': np.less_equal,
+    'eq': np.equal, 'ne': np.not_equal,
+}
+RESERVED_KEYS = ('run_id', 'created_at', 'kind', 'tags')
+
+
+def _epoch(value) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+def equity_columns(equity_curve: Iterable[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """[{'date', 'total_value', 'price'}, ...] -> 열 배열"""
+    rows = list(equity_curve)
+    return {
+        'equity_timestamp': np.array([_epoch(row['date']) for row in rows], dtype=np.float64),
+        'equity_value': np.array([row['total_value'] for row in rows], dtype=np.float64),
+        'equity_price': np.array([row.get('price', np.nan) for row in rows], dtype=np.float64),
+    }
+
+
+def trade_columns(trades: Iterable[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """UnifiedBacktester.trades 형식 -> 열 배열 (자산명은 코드 + 사전)"""
+    rows = list(trades)
+    assets = sorted({row['asset'] for row in rows})
+    codes = {asset: code for code, asset in enumerate(assets)}
+    return {
+        'trade_timestamp': np.array([_epoch(row['timestamp']) for row in rows], dtype=np.float64),
+        'trade_side': np.array([SIDE_CODES[row['type']] for row in rows], dtype=np.int8),
+        'trade_asset': np.array([codes[row['asset']] for row in rows], dtype=np.int32),
+        'trade_price': np.array([row['price'] for row in rows], dtype=np.float64),
+        'trade_quantity': np.array([row['quantity'] for row in rows], dtype=np.float64),
+        'trade_assets': np.array(assets, dtype=str),
+    }
+
+
+class ResultsStore:
+    """디렉터리 기반 백테스트 실행 저장소 (기록은 단일 프로세스에서)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.runs_dir = os.path.join(directory, 'runs')
+        self.index_path = os.path.join(directory, 'index.jsonl')
+        os.makedirs(self.runs_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.records = []      # 인덱스 행 (기록 순서)
+        self._positions = {}   # run_id -> 행 번호
+        self._columns = {}     # 인덱스 열 캐시 (기록 시 무효화)
+        self._load_index()
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단된 마지막 줄 무시
+                self._positions[record['run_id']] = len(self.records)
+                self.records.append(record)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, run_id) -> bool:
+        return run_id in self._positions
+
+    # ---- 기록 ----
+
+    def write_run(self, params: Dict[str, Any], metrics: Dict[str, Any], trades=None, equity_curve=None,
+                  kind: str = 'backtest', tags: Optional[List[str]] = None, run_id: str = None) -> str:
+        """실행 1건 저장 후 run_id 반환"""
+        record = {}
+        for source in (params, metrics):
+            for key, value in source.items():
+                if key in RESERVED_KEYS:
+                    raise ValueError(f"Reserved result key: {key}")
+                if key in record and record[key] != value:
+                    raise ValueError(f"Conflicting values for result key: {key}")
+                record[key] = value
+
+        run_id = run_id or f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        columns = {}
+        if equity_curve is not None:
+            columns.update(equity_columns(equity_curve))
+        if trades is not None:
+            columns.update(trade_columns(trades))
+        if columns:
+            # 임시 파일에 쓴 뒤 교체 - 인덱스에 기록된 실행은 항상 열 파일이 완전함
+            path = self._run_path(run_id)
+            temp_path = path + '.tmp.npz'
+            np.savez(temp_path, **columns)
+            os.replace(temp_path, path)
+
+        record.update(run_id=run_id, created_at=datetime.now().isoformat(), kind=kind, tags=list(tags or []))
+        line = json.dumps(record, default=str, ensure_ascii=False)
+        with self._lock:
+            if run_id in self._positions:
+                raise ValueError(f"Duplicate run id: {run_id}")
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            self._positions[run_id] = len(self.records)
+            self.records.append(json.loads(line))
+            self._columns.clear()
+        return run_id
+
+    def write_backtester(self, backtester, params: Dict[str, Any], equity_curve=None, **kwargs) -> str:
+        """UnifiedBacktester 결과(성과 지표 + 거래 + 자산 곡선) 저장"""
+        metrics = {key: value for key, value in backtester.get_performance().items() if key not in params}
+        return self.write_run(params, metrics, trades=backtester.trades, equity_curve=equity_curve, **kwargs)
+
+    def _run_path(self, run_id: str) -> str:
+        return os.path.join(self.runs_dir, f"{run_id}.npz")
+
+    # ---- 조회 ----
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        position = self._positions.get(run_id)
+        return None if position is None else dict(self.records[position])
+
+    def column(self, name: str) -> np.ndarray:
+        """인덱스 열 (숫자면 float 배열 - 없는 값은 NaN, 그 외 object 배열)"""
+        cached = self._columns.get(name)
+        if cached is not None and len(cached) == len(self.records):
+            return cached
+        values = [record.get(name) for record in self.records]
+        numeric = all(value is None or (isinstance(value, (int, float)) and not isinstance(value, bool))
+                      for value in values)
+        if numeric:
+            array = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        else:
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+        self._columns[name] = array
+        return array
+
+    def query(self, order_by: str = None, descending: bool = False, limit: int = None,
+              **filters) -> List[Dict[str, Any]]:
+        """인덱스 필터 조회
+
+        filters: key=value, key__in=[...], key__gt / __gte / __lt / __lte / __ne=value
+        예) store.query(symbol='BTC-USD', roi_percent__gt=5, order_by='roi_percent', descending=True)
+        """
+        mask = np.ones(len(self.records), dtype=bool)
+        for expression, value in filters.items():
+            name, _, op = expression.partition('__')
+            column = self.column(name)
+            if op == 'in':
+                mask &= np.isin(column, list(value))
+            else:
+                compare = FILTER_OPS[op or 'eq']
+                with np.errstate(invalid='ignore'):
+                    mask &= np.asarray(compare(column, value), dtype=bool)
+
+        rows = np.flatnonzero(mask)
+        if order_by is not None:
+            keys = self.column(order_by)[rows]
+            if keys.dtype != object:
+                # NaN(지표 없음)은 정렬 방향과 무관하게 마지막
+                order = np.argsort(-keys if descending else keys, kind='stable')
+            else:
+                order = np.array(sorted(range(len(rows)), key=lambda i: str(keys[i]), reverse=descending),
+                                 dtype=np.int64)
+            rows = rows[order]
+        if limit is not None:
+            rows = rows[:limit]
+        return [dict(self.records[row]) for row in rows]
+
+    def load_columns(self, run_id: str, names: Iterable[str] = None) -> Dict[str, np.ndarray]:
+        """실행의 열 파일에서 요청한 열만 로드"""
+        path = self._run_path(run_id)
+        if not os.path.exists(path):
+            return {}
+        with np.load(path, allow_pickle=False) as data:
+            keys = data.files if names is None else [name for name in names if name in data.files]
+            return {key: data[key] for key in keys}
+
+    def load_equity(self, run_id: str) -> Dict[str, np.ndarray]:
+        columns = self.load_columns(run_id, ('equity_timestamp', 'equity_value', 'equity_price'))
+        return {key[len('equity_'):]: value for key, value in columns.items()}
+
+    def load_trades(self, run_id: str) -> Dict[str, np.ndarray]:
+        columns = self.load_columns(run_id, ('trade_timestamp', 'trade_side', 'trade_asset', 'trade_price',
+                                             'trade_quantity', 'trade_assets'))
+        return {key[len('trade_'):]: value for key, value in columns.items()}
+
+    def compare_equity(self, run_ids: Iterable[str]) -> Dict[str, Dict[str, float]]:
+        """실행별 자산 곡선 요약 (최종 가치, 최대 낙폭 %)"""
+        summary = {}
+        for run_id in run_ids:
+            values = self.load_columns(run_id, ('equity_value',)).get('equity_value')
+            if values is None or values.size == 0:
+                continue
+            peaks = np.maximum.accumulate(values)
+            summary[run_id] = {
+                'final_value': float(values[-1]),
+                'max_drawdown_percent': float(((peaks - values) / peaks).max() * 100),
+            }
+        return summary
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+🛡️ 주문 전 리스크 엔진
+- 체결/가격 갱신 시 노출, 일일 손익, 자산별 명목 금액을 증분 갱신
+- 단일 주문 검사 O(1), 리밸런싱 바스켓은 허용된 주문만 누적하는 단일 패스 검사
+- RISK_MANAGEMENT / SPOT_RISK_MANAGEMENT 설정 사용 (없는 한도는 검사하지 않음)
+"""
+
+import time
+from typing import Dict, Any, Optional, Sequence
+
+import numpy as np
+
+SIDE_SIGN = {'BUY': 1.0, 'SELL': -1.0}
+
+
+class PreTradeRiskEngine:
+    """증분 상태 기반 주문 전 리스크 검사"""
+
+    def __init__(self, limits: Dict[str, Any], equity: float = 10000.0, clock=time.time):
+        self.limits = limits
+        self.equity = equity
+        self.clock = clock
+
+        # max_position_size가 1 이하이면 자기자본 대비 비율, 초과하면 명목 금액 한도
+        self.max_position_size = limits.get("max_position_size")
+        self.max_single_position = limits.get("max_single_position")
+        self.max_portfolio_value = limits.get("max_portfolio_value")
+        self.max_daily_loss = limits.get("max_daily_loss")
+
+        self.positions = {}  # symbol -> [수량, 평균 진입가, 표시 가격]
+        self.gross_exposure = 0.0
+        self.unrealized_pnl = 0.0
+        self.realized_pnl = 0.0
+        self._day = self._current_day()
+        self._day_start_pnl = 0.0
+        self.stats = {'checked': 0, 'rejected': 0}
+
+    def _current_day(self) -> int:
+        return int(self.clock() // 86400)
+
+    def _roll_day(self):
+        day = self._current_day()
+        if day != self._day:
+            self._day = day
+            self._day_start_pnl = self.realized_pnl + self.unrealized_pnl
+
+    @property
+    def daily_pnl(self) -> float:
+        """당일 실현 + 미실현 손익 변화"""
+        self._roll_day()
+        return self.realized_pnl + self.unrealized_pnl - self._day_start_pnl
+
+    def position_limit(self) -> Optional[float]:
+        """자산별 명목 금액 한도 (설정 중 가장 엄격한 값)"""
+        candidates = []
+        if self.max_single_position is not None:
+            candidates.append(self.max_single_position)
+        if self.max_position_size is not None:
+            if self.max_position_size <= 1:
+                equity = self.equity + self.realized_pnl + self.unrealized_pnl
+                candidates.append(self.max_position_size * max(equity, 0.0))
+            else:
+                candidates.append(self.max_position_size)
+        return min(candidates) if candidates else None
+
+    def _set_position(self, symbol: str, quantity: float, entry: float, mark: float):
+        old = self.positions.get(symbol)
+        if old is not None:
+            self.gross_exposure -= abs(old[0] * old[2])
+            self.unrealized_pnl -= old[0] * (old[2] - old[1])
+        if quantity == 0:
+            self.positions.pop(symbol, None)
+            return
+        self.positions[symbol] = [quantity, entry, mark]
+        self.gross_exposure += abs(quantity * mark)
+        self.unrealized_pnl += quantity * (mark - entry)
+
+    def on_price(self, symbol: str, price: float):
+        """표시 가격 갱신 (보유 자산만 노출/미실현 손익 반영)"""
+        position = self.positions.get(symbol)
+        if position is not None and price:
+            self._set_position(symbol, position[0], position[1], price)
+
+    def on_fill(self, symbol: str, side: str, quantity: float, price: float):
+        """체결 반영 - 평균 진입가, 실현 손익, 노출 증분 갱신"""
+        if quantity == 0:
+            return
+        self._roll_day()
+        signed = SIDE_SIGN[side.upper()] * quantity
+        held, entry, _ = self.positions.get(symbol, (0.0, 0.0, price))
+        new_quantity = held + signed
+
+        if held == 0 or held * signed > 0:
+            # 신규 또는 추가 진입
+            entry = (held * entry + signed * price) / new_quantity
+        else:
+            # 청산 (부분/전체/반전)
+            closed = min(abs(signed), abs(held))
+            self.realized_pnl += closed * (price - entry) * (1 if held > 0 else -1)
+            if new_quantity == 0:
+                entry = 0.0
+            elif held * new_quantity < 0:
+                entry = price
+        self._set_position(symbol, new_quantity, entry, price)
+
+    def check_order(self, symbol: str, side: str, quantity: float, price: float) -> Dict[str, Any]:
+        """단일 주문 검사 (O(1))"""
+        self.stats['checked'] += 1
+        sign = SIDE_SIGN.get(side.upper())
+        if sign is None or quantity <= 0 or price <= 0:
+            return self._reject(f"Invalid order: {side} {quantity} @ {price}")
+
+        held = self.positions.get(symbol)
+        held_quantity = held[0] if held else 0.0
+        old_notional = abs(held_quantity * held[2]) if held else 0.0
+        new_notional = abs((held_quantity + sign * quantity) * price)
+        increases_risk = new_notional > old_notional
+
+        if not increases_risk:
+            # 포지션을 줄이는 주문은 항상 허용
+            return {'allowed': True, 'reason': None}
+
+        if self.max_daily_loss is not None and self.daily_pnl <= -self.max_daily_loss:
+            return self._reject(f"Daily loss limit reached ({self.daily_pnl:.2f})")
+
+        limit = self.position_limit()
+        if limit is not None and new_notional > limit:
+            return self._reject(f"{symbol} notional {new_notional:.2f} exceeds limit {limit:.2f}")
+
+        if self.max_portfolio_value is not None:
+            exposure = self.gross_exposure - old_notional + new_notional
+            if exposure > self.max_portfolio_value:
+                return self._reject(f"Portfolio exposure {exposure:.2f} exceeds {self.max_portfolio_value:.2f}")
+
+        return {'allowed': True, 'reason': None}
+
+    def _reject(self, reason: str) -> Dict[str, Any]:
+        self.stats['rejected'] += 1
+        return {'allowed': False, 'reason': reason}
+
+    def check_batch(self, symbols: Sequence[str], sides: Sequence[str], quantities: Sequence[float],
+                    prices: Sequence[float]) -> np.ndarray:
+        """리밸런싱 바스켓 검사 - 허용된 주문만 순서대로 체결된다고 가정하여 누적 노출 검사
+
+        거부된 주문은 이후 주문의 누적 수량/노출에 포함하지 않음
+        """
+        count = len(symbols)
+        self.stats['checked'] += count
+        if count == 0:
+            return np.zeros(0, dtype=bool)
+
+        signs = np.array([SIDE_SIGN.get(side.upper(), 0.0) for side in sides])
+        quantities = np.asarray(quantities, dtype=float)
+        prices = np.asarray(prices, dtype=float)
+        signed = (signs * quantities).tolist()
+        valid = ((signs != 0) & (quantities > 0) & (prices > 0)).tolist()
+        prices = prices.tolist()
+
+        loss_blocked = self.max_daily_loss is not None and self.daily_pnl <= -self.max_daily_loss
+        limit = self.position_limit()
+        max_exposure = self.max_portfolio_value
+        exposure = self.gross_exposure
+        basket = {}  # symbol -> [누적 수량, 현재 명목 금액]
+        allowed = np.zeros(count, dtype=bool)
+
+        for i in range(count):
+            if not valid[i]:
+                continue
+            symbol = symbols[i]
+            state = basket.get(symbol)
+            if state is None:
+                held = self.positions.get(symbol)
+                state = basket[symbol] = [held[0], abs(held[0] * held[2])] if held else [0.0, 0.0]
+            quantity = state[0] + signed[i]
+            new_notional = abs(quantity) * prices[i]
+            if new_notional > state[1]:
+                if loss_blocked or (limit is not None and new_notional > limit):
+                    continue
+                if max_exposure is not None and exposure - state[1] + new_notional > max_exposure:
+                    continue
+            exposure += new_notional - state[1]
+            state[0], state[1] = quantity, new_notional
+            allowed[i] = True
+
+        self.stats['rejected'] += int(count - allowed.sum())
+        return allowed
+
+    def get_state(self) -> Dict[str, Any]:
+        """현재 리스크 상태"""
+        return {
+            'gross_exposure': self.gross_exposure,
+            'realized_pnl': self.realized_pnl,
+            'unrealized_pnl': self.unrealized_pnl,
+            'daily_pnl': self.daily_pnl,
+            'position_limit': self.position_limit(),
+            'positions': {symbol: abs(p[0] * p[2]) for symbol, p in self.positions.items()},
+            'stats': dict(self.stats)
+        }
@@ -1,19 +1,22 @@
 from spot_claude_client import SpotClaudeClient
 from spot_mcp_client import SpotMCPClient
-from spot_split_order import SpotSplitOrder
+from spot_execution_scheduler import SpotExecutionScheduler
 from spot_config import *
 
 class SpotAITrader:
-    def __init__(self):
-        self.claude = SpotClaudeClient()
-        self.mcp = SpotMCPClient()
-        self.split = SpotSplitOrder(self.mcp)
+    def __init__(self, api_key="demo_api_key", mcp_client=None):
+        self.claude = SpotClaudeClient(api_key)
+        self.mcp = mcp_client or SpotMCPClient()
+        # 큰 주문은 TWAP/VWAP/POV 자식 주문으로 나누어 실행
+        self.split = SpotExecutionScheduler(self.mcp)
+        self.split.start()
 
     def execute_trade(self, order_details):
-        # Placeholder for the actual trade execution logic
+        # 부모 주문 등록 후 스케줄러가 슬라이스 시점마다 자식 주문 전송
         print("Executing trade...")
-        self.split.split_order(order_details)
-        print("Trade executed.")
+        parent = self.split.split_order(order_details)
+        print(f"Trade scheduled: {parent.parent_id} ({parent.strategy}, {parent.quantity} {parent.symbol})")
+        return parent.to_dict()
 
     def analyze_market(self):
         # Placeholder for market analysis logic
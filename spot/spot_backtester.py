@@ -5,22 +5,28 @@
 - UnifiedBacktester를 상속하여 현물 거래 전용 기능 제공
 """
 
+import random
 import sys
 import os
+from typing import Any, Dict, List, Optional
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backtester import UnifiedBacktester
 from datetime import datetime, timedelta
-import pandas as pd
 
 class SpotBacktester(UnifiedBacktester):
     """현물 거래 전용 백테스터"""
     
-    def __init__(self, symbol: str, start_date: str, end_date: str, initial_capital: float = 10000):
+    def __init__(self, symbol: str, start_date: str, end_date: str, initial_capital: float = 10000,
+                 ma_window: int = 5, trade_quantity: float = 0.1, seed: Optional[int] = None):
         super().__init__(initial_capital)
         self.symbol = symbol
         self.start_date = start_date
         self.end_date = end_date
+        self.ma_window = ma_window
+        self.trade_quantity = trade_quantity
+        self.random = random.Random(seed)
         self.price_data = []
         
     def generate_sample_data(self):
@@ -33,54 +39,61 @@ class SpotBacktester(UnifiedBacktester):
         
         while current_date <= end:
             # 간단한 랜덤 워크
-            import random
-            change = random.uniform(-0.05, 0.05)  # ±5% 변동
+            change = self.random.uniform(-0.05, 0.05)  # ±5% 변동
             current_price *= (1 + change)
             
             self.price_data.append({
                 'date': current_date,
                 'price': current_price,
-                'volume': random.uniform(1000, 10000)
+                'volume': self.random.uniform(1000, 10000)
             })
             
             current_date += timedelta(days=1)
     
-    def backtest(self) -> pd.DataFrame:
-        """백테스팅 실행"""
+    def run(self) -> List[Dict[str, Any]]:
+        """백테스팅 실행 - 일별 자산 가치 목록 반환 (pandas 불필요)"""
         if not self.price_data:
             self.generate_sample_data()
-        
+
         equity_curve = []
-        
+        window = self.ma_window
+        quantity = self.trade_quantity
+
         for i, data in enumerate(self.price_data):
             # 간단한 이동평균 전략
-            if i >= 5:  # 5일 이동평균
-                recent_prices = [p['price'] for p in self.price_data[i-4:i+1]]
-                ma5 = sum(recent_prices) / 5
+            if i >= window:
+                recent_prices = [p['price'] for p in self.price_data[i-window+1:i+1]]
+                moving_average = sum(recent_prices) / window
                 current_price = data['price']
-                
-                # 매수 신호: 현재가 > 5일 이동평균
-                if current_price > ma5 and self.balance > current_price * 0.1:
-                    self.buy(self.symbol, current_price, 0.1)
-                
-                # 매도 신호: 현재가 < 5일 이동평균
-                elif current_price < ma5 and self.symbol in self.positions:
+
+                # 매수 신호: 현재가 > 이동평균
+                if current_price > moving_average and self.balance > current_price * quantity:
+                    self.buy(self.symbol, current_price, quantity)
+
+                # 매도 신호: 현재가 < 이동평균
+                elif current_price < moving_average and self.symbol in self.positions:
                     position_size = self.positions[self.symbol]
                     if position_size > 0:
-                        self.sell(self.symbol, current_price, min(0.1, position_size))
-            
+                        self.sell(self.symbol, current_price, min(quantity, position_size))
+
             # 자산 가치 기록
             position_value = self.positions.get(self.symbol, 0) * data['price']
             total_value = self.balance + position_value
-            
+
             equity_curve.append({
                 'date': data['date'],
                 'total_value': total_value,
                 'price': data['price']
             })
-        
-        return pd.DataFrame(equity_curve)
-    
+
+        return equity_curve
+
+    def backtest(self) -> 'pd.DataFrame':
+        """백테스팅 실행 (DataFrame 반환)"""
+        import pandas as pd  # 무거운 의존성은 실제 사용 시점에 로드
+
+        return pd.DataFrame(self.run())
+
     def get_performance(self) -> dict:
         """성능 분석 (확장)"""
         base_perf = super().get_performance()
@@ -114,9 +114,15 @@ class SpotClaudeClient:
             "score": random.randint(1, 100),
             "factors": ["뉴스 분석", "소셜 미디어", "거래량 분석"]
         }
+import os
 import random
+import sys
 from typing import Dict, Any, Optional
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from instrumentation import LLM_METRICS, estimate_tokens
+
 class SpotClaudeClient:
     """Spot 거래용 Claude 클라이언트"""
     
@@ -127,8 +133,11 @@ class SpotClaudeClient:
     
     def generate_trading_signal(self, symbol: str, amount: float) -> str:
         """거래 신호 생성"""
-        signals = ["BUY", "SELL", "HOLD"]
-        signal = random.choice(signals)
+        with LLM_METRICS.track('spot.trading_signal', 'simulated') as call:
+            signals = ["BUY", "SELL", "HOLD"]
+            signal = random.choice(signals)
+            call.input_tokens = estimate_tokens(f"{symbol} {amount}")
+            call.output_tokens = estimate_tokens(signal)
         print(f"Generated signal for {symbol}: {signal}")
         return signal
     
@@ -67,3 +67,44 @@ YAHOO_SYMBOLS = {
 # API 설정
 MAX_RETRY_ATTEMPTS = 3
 REQUEST_TIMEOUT = 30
+
+# 요청 헤징 설정 (멱등 조회 요청 전용)
+REQUEST_HEDGING = {
+    "enabled": True,
+    "percentile": 95,      # 헤지 지연 = 최근 지연시간의 p95
+    "min_delay": 0.05,     # 초
+    "initial_delay": 0.5,  # 표본이 부족할 때의 지연 (초)
+    "min_samples": 20,
+    "window_size": 200,
+    "max_workers": 8
+}
+
+# 엔드포인트별 서킷 브레이커 설정
+CIRCUIT_BREAKER = {
+    "failure_threshold": 5,
+    "reset_timeout": 30.0,  # 초
+    # 실패 시 마지막 값 대신 None 반환 (주문 상태는 오래된 값을 최신으로 오인하면 안 됨)
+    "fresh_only_endpoints": ("spot/order", "spot/orders")
+}
+
+# 주문 분할 실행 스케줄러 설정
+SPOT_EXECUTION = {
+    "slice_interval": 10.0,       # 자식 주문 간격 (초)
+    "default_duration": 300.0,    # 부모 주문 기본 실행 시간 (초)
+    "default_participation": 0.1, # POV 기본 참여율
+    "min_child_quantity": 0.0001, # 이보다 작은 자식 주문은 다음 슬라이스로 이월
+    "max_catchup_slices": 3,      # 종료 시각 이후 미체결 잔량 추가 시도 횟수
+    "max_workers": 16,            # 동시 주문 전송 스레드 수
+    "poll_interval": 0.5,         # 백그라운드 스케줄러 점검 주기 (초)
+    "profile_history_hours": 672  # VWAP 주간 거래량 프로파일 학습용 1시간봉 수 (4주)
+}
+
+# 주문 상태 대사 (배치 조회 + 적응형 폴링)
+SPOT_RECONCILE = {
+    "batch_size": 50,             # 상태 조회 요청당 최대 주문 수
+    "min_interval": 1.0,          # 변화가 있는 주문 폴링 주기 (초)
+    "max_interval": 30.0,         # 변화 없는 주문 최대 폴링 주기 (초)
+    "backoff": 2.0,               # 변화가 없을 때 폴링 주기 증가 배수
+    "max_requests_per_second": 5.0,  # 전체 대사 요청 상한
+    "burst": 5                    # 토큰 버킷 최대 적립량
+}
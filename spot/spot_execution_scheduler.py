@@ -0,0 +1,390 @@
+"""
+🧩 현물 주문 분할 실행 스케줄러
+- 부모 주문을 TWAP / VWAP(주간 시간대별 거래량 프로파일) / POV 방식으로 자식 주문 분할
+- VWAP 가중치는 각 슬라이스가 실행될 요일/시간대의 과거 평균 거래량 기준
+- 자식 주문은 스레드 풀에서 SpotMCPClient.create_order로 동시 전송
+- 체결을 추적하여 남은 수량을 남은 슬라이스에 다시 배분
+- 다음 실행 시각 힙으로 도래한 부모 주문만 처리
+- POV 거래량 조회는 잠금 밖에서 수행, POV 주문은 duration이 지나면 만료
+"""
+
+import heapq
+import itertools
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional, Sequence
+
+import numpy as np
+
+from spot_config import SPOT_EXECUTION
+
+FUTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "futures")
+STRATEGIES = ("TWAP", "VWAP", "POV")
+
+
+class ParentOrder:
+    """분할 실행 중인 부모 주문"""
+
+    __slots__ = ('parent_id', 'symbol', 'side', 'quantity', 'filled', 'working', 'strategy',
+                 'limit_price', 'participation', 'weights', 'slice_index', 'start_time', 'end_time',
+                 'next_due', 'catchups', 'status', 'children', 'last_volume_check')
+
+    def __init__(self, parent_id, symbol, side, quantity, strategy, limit_price, participation,
+                 weights, start_time, end_time):
+        self.parent_id = parent_id
+        self.symbol = symbol
+        self.side = side
+        self.quantity = quantity
+        self.filled = 0.0
+        self.working = 0.0  # 전송했지만 체결/실패가 확정되지 않은 수량
+        self.strategy = strategy
+        self.limit_price = limit_price
+        self.participation = participation
+        self.weights = weights
+        self.slice_index = 0
+        self.start_time = start_time
+        self.end_time = end_time
+        self.next_due = start_time
+        self.catchups = 0
+        self.status = "ACTIVE"
+        self.children = {}  # child_id -> 요청 수량
+        self.last_volume_check = start_time
+
+    @property
+    def remaining(self):
+        return max(self.quantity - self.filled - self.working, 0.0)
+
+    def to_dict(self):
+        return {
+            "parent_id": self.parent_id,
+            "symbol": self.symbol,
+            "side": self.side,
+            "strategy": self.strategy,
+            "quantity": self.quantity,
+            "filled": self.filled,
+            "working": self.working,
+            "slices_sent": self.slice_index,
+            "status": self.status,
+        }
+
+
+class SpotExecutionScheduler:
+    def __init__(self, mcp_client, clock=time.time, config=None,
+                 volume_fn: Optional[Callable[[str], float]] = None, volume_profiles=None):
+        self.mcp = mcp_client
+        self.clock = clock
+        self.config = dict(SPOT_EXECUTION, **(config or {}))
+        # POV용 최근 시장 거래량 조회 (기본: 최근 1분 kline 거래량)
+        self.volume_fn = volume_fn or self._last_bar_volume
+        # VWAP용 주간 거래량 프로파일 저장소 (get(symbol) -> VolumeProfile, 미지정 시 1시간봉 히스토리로 학습)
+        self.volume_profiles = volume_profiles
+        self._learned_profiles = {}
+
+        self.parents = {}
+        self._due = []  # (다음 실행 시각, 순번, parent_id)
+        self._sequence = itertools.count()
+        self._child_ids = itertools.count(1)
+        self._child_parent = {}  # child_id -> parent_id
+        self._in_flight = 0       # 응답 처리가 끝나지 않은 create_order 호출 수
+        self.venue_order_ids = {}  # child_id -> 거래소 주문 ID (미체결 자식 주문 추적용)
+        self._idle = threading.Condition()
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=self.config["max_workers"],
+                                            thread_name_prefix="spot-exec")
+        self._thread = None
+        self._stopping = threading.Event()
+        self.stats = {"parents": 0, "children": 0, "child_failures": 0, "replans": 0, "completed": 0}
+
+    # ---- 계획 ----
+
+    def _slice_count(self, duration):
+        return max(1, int(math.ceil(duration / self.config["slice_interval"])))
+
+    def _vwap_weights(self, symbol, slices, volume_curve=None, start_time=None):
+        if volume_curve is None:
+            volume_curve = self._expected_volumes(symbol, slices, start_time)
+        curve = np.asarray(volume_curve if volume_curve is not None else [], dtype=np.float64)
+        if curve.size == 0 or curve.sum() <= 0:
+            return np.ones(slices)
+        # 거래량 곡선을 슬라이스 수에 맞게 묶어 합산
+        weights = np.array([chunk.sum() for chunk in np.array_split(curve, slices)])
+        return np.where(weights > 0, weights, weights[weights > 0].min() if (weights > 0).any() else 1.0)
+
+    def _volume_profile(self, symbol):
+        if self.volume_profiles is not None:
+            return self.volume_profiles.get(symbol)
+        profile = self._learned_profiles.get(symbol)
+        if profile is None:
+            if FUTURES_DIR not in sys.path:
+                sys.path.append(FUTURES_DIR)
+            from futures_volume_profile import VolumeProfile
+
+            try:
+                klines = self.mcp.get_kline(symbol, interval="1h", limit=self.config["profile_history_hours"])
+            except Exception:
+                return None
+            if not klines:
+                return None
+            profile = VolumeProfile(symbol)
+            profile.update_klines(klines)
+            self._learned_profiles[symbol] = profile
+        return profile
+
+    def _expected_volumes(self, symbol, slices, start_time):
+        """각 슬라이스가 실행될 시각의 주간 시간대 상대 거래량 (과거 같은 요일/시간대 평균 기준)"""
+        profile = self._volume_profile(symbol)
+        if profile is None or not profile.bar_count.any():
+            return None
+        from futures_time_based_trader import hour_of_week_slots
+
+        # 표본이 없는 시간대는 평균 수준(1.0)으로 간주
+        activity = np.where(profile.bar_count > 0, profile.activity(), 1.0)
+        start_time = self.clock() if start_time is None else start_time
+        midpoints = start_time + (np.arange(slices) + 0.5) * self.config["slice_interval"]
+        return activity[hour_of_week_slots(midpoints)]
+
+    def _kline_volumes(self, symbol, slices):
+        minutes = max(1, int(math.ceil(slices * self.config["slice_interval"] / 60)))
+        try:
+            klines = self.mcp.get_kline(symbol, interval="1m", limit=min(minutes, 1000))
+        except Exception:
+            return None
+        if not klines:
+            return None
+        return [row["volume"] if isinstance(row, dict) else row[5] for row in klines]
+
+    def _last_bar_volume(self, symbol):
+        volumes = self._kline_volumes(symbol, 1)
+        return float(volumes[-1]) if volumes else 0.0
+
+    def submit(self, symbol: str, side: str, quantity: float, strategy: str = "TWAP",
+               duration: float = None, limit_price: float = None, participation: float = None,
+               volume_curve: Optional[Sequence[float]] = None) -> ParentOrder:
+        strategy = strategy.upper()
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unsupported execution strategy: {strategy}")
+        duration = duration or self.config["default_duration"]
+        slices = self._slice_count(duration)
+        now = self.clock()
+        if strategy == "VWAP":
+            weights = self._vwap_weights(symbol, slices, volume_curve, now)
+        else:
+            weights = np.ones(slices)
+
+        with self._lock:
+            parent = ParentOrder(
+                f"parent_{next(self._sequence)}", symbol, side.upper(), float(quantity), strategy, limit_price,
+                participation or self.config["default_participation"], weights, now, now + duration
+            )
+            self.parents[parent.parent_id] = parent
+            self._schedule(parent)
+            self.stats["parents"] += 1
+        return parent
+
+    def split_order(self, order_details: Dict[str, Any]) -> ParentOrder:
+        # SpotAITrader.execute_trade 주문 딕셔너리 형식 지원
+        return self.submit(
+            order_details["symbol"],
+            order_details.get("side", order_details.get("order_type", "BUY")),
+            order_details["quantity"],
+            strategy=order_details.get("strategy", "TWAP"),
+            duration=order_details.get("duration"),
+            limit_price=order_details.get("price"),
+            participation=order_details.get("participation"),
+            volume_curve=order_details.get("volume_curve"),
+        )
+
+    def _schedule(self, parent):
+        heapq.heappush(self._due, (parent.next_due, next(self._sequence), parent.parent_id))
+
+    def _next_child_quantity(self, parent, now, volumes):
+        remaining = parent.remaining
+        last_slice = parent.slice_index >= len(parent.weights) - 1
+        if parent.strategy == "POV":
+            # 시장 거래량의 일정 비율만 참여 (종료 시각에 잔량을 몰아서 내지 않음)
+            elapsed = max(now - parent.last_volume_check, self.config["slice_interval"])
+            parent.last_volume_check = now
+            volume = volumes.get(parent.symbol, 0.0) * elapsed / 60.0
+            return min(parent.participation * volume, remaining)
+        if last_slice:
+            return remaining
+        weights = parent.weights[parent.slice_index:]
+        return remaining * weights[0] / weights.sum()
+
+    # ---- 실행 ----
+
+    def _fetch_volumes(self, symbols):
+        """POV 심볼별 최근 거래량 (네트워크 호출 - 잠금 밖에서 호출)"""
+        volumes = {}
+        for symbol in symbols:
+            try:
+                volumes[symbol] = float(self.volume_fn(symbol) or 0.0)
+            except Exception:
+                volumes[symbol] = 0.0  # 조회 실패 시 이번 슬라이스는 참여하지 않음
+        return volumes
+
+    def run_once(self, now: float = None) -> int:
+        now = self.clock() if now is None else now
+        with self._lock:
+            due = []
+            while self._due and self._due[0][0] <= now:
+                due_time, _, parent_id = heapq.heappop(self._due)
+                parent = self.parents.get(parent_id)
+                if parent is None or parent.status != "ACTIVE" or parent.next_due != due_time:
+                    continue  # 취소/완료되었거나 재계획된 항목
+                due.append(parent)
+            pov_symbols = {parent.symbol for parent in due if parent.strategy == "POV" and now < parent.end_time}
+
+        # 거래량 조회 중에도 submit/cancel/on_child_update가 막히지 않도록 잠금 해제 상태에서 조회
+        volumes = self._fetch_volumes(pov_symbols) if pov_symbols else {}
+
+        orders = []
+        with self._lock:
+            for parent in due:
+                if parent.status != "ACTIVE":
+                    continue  # 조회 중 취소/완료됨
+                order = self._plan_child(parent, now, volumes)
+                if order is not None:
+                    orders.append(order)
+
+        with self._idle:
+            self._in_flight += len(orders)
+        for child_id, parent, quantity in orders:
+            future = self._executor.submit(
+                self.mcp.create_order, parent.symbol, parent.side, parent.limit_price, quantity
+            )
+            future.add_done_callback(lambda f, c=child_id: self._on_response(c, f))
+        return len(orders)
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        # 전송 중인 자식 주문 응답 처리 완료 대기
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout=timeout)
+
+    def _plan_child(self, parent, now, volumes):
+        total_slices = len(parent.weights)
+        if parent.strategy == "POV" and now >= parent.end_time:
+            # 참여율 주문은 종료 시각 이후 잔량을 내지 않음 - 전송 중 주문 확인 후 만료
+            if parent.working > 0:
+                parent.next_due = now + self.config["slice_interval"]
+                self._schedule(parent)
+            elif parent.remaining > 0:
+                parent.status = "EXPIRED"
+            return None
+        if parent.slice_index >= total_slices and parent.strategy != "POV":
+            # 종료 시각 이후: 체결 대기 중이면 다시 확인, 미체결 잔량은 추가 시도
+            if parent.remaining <= 0 or parent.catchups >= self.config["max_catchup_slices"]:
+                if parent.working > 0:
+                    parent.next_due = now + self.config["slice_interval"]
+                    self._schedule(parent)
+                elif parent.remaining > 0:
+                    parent.status = "EXPIRED"
+                return None
+            parent.catchups += 1
+            self.stats["replans"] += 1
+            quantity = parent.remaining
+        else:
+            quantity = self._next_child_quantity(parent, now, volumes)
+            parent.slice_index += 1
+
+        parent.next_due = now + self.config["slice_interval"]
+        self._schedule(parent)
+        if quantity < self.config["min_child_quantity"]:
+            return None  # 다음 슬라이스로 이월
+
+        child_id = f"{parent.parent_id}_c{next(self._child_ids)}"
+        parent.children[child_id] = quantity
+        parent.working += quantity
+        self._child_parent[child_id] = parent.parent_id
+        self.stats["children"] += 1
+        return child_id, parent, quantity
+
+    def _on_response(self, child_id, future):
+        try:
+            self._apply_response(child_id, future)
+        finally:
+            with self._idle:
+                self._in_flight -= 1
+                self._idle.notify_all()
+
+    def _apply_response(self, child_id, future):
+        try:
+            response = future.result()
+        except Exception:
+            response = None
+
+        if not isinstance(response, dict):
+            self.on_child_update(child_id, 0.0, "FAILED")
+            return
+        status = str(response.get("status", "NEW")).upper()
+        if response.get("order_id") is not None:
+            self.venue_order_ids[child_id] = response["order_id"]
+        if status in ("NEW", "PENDING", "OPEN"):
+            return  # 거래소에 걸린 주문: 이후 on_child_update로 체결 반영
+        requested = self._requested(child_id)
+        filled = response.get("executed_quantity", requested if status == "FILLED" else 0.0)
+        self.on_child_update(child_id, filled, status)
+
+    def _requested(self, child_id):
+        parent = self.parents.get(self._child_parent.get(child_id))
+        return parent.children.get(child_id, 0.0) if parent else 0.0
+
+    def on_child_update(self, child_id: str, filled_quantity: float, status: str):
+        """자식 주문 최종 상태 반영 - 미체결분은 남은 슬라이스로 재배분"""
+        with self._lock:
+            parent = self.parents.get(self._child_parent.pop(child_id, None))
+            self.venue_order_ids.pop(child_id, None)
+            if parent is None:
+                return
+            requested = parent.children.pop(child_id, 0.0)
+            parent.working = max(parent.working - requested, 0.0)
+            parent.filled += min(filled_quantity, requested)
+            if filled_quantity < requested:
+                if status != "FILLED":
+                    self.stats["child_failures"] += 1
+                self.stats["replans"] += 1
+            if parent.filled >= parent.quantity - 1e-12 and parent.status == "ACTIVE":
+                parent.status = "COMPLETED"
+                self.stats["completed"] += 1
+
+    def cancel(self, parent_id: str) -> bool:
+        with self._lock:
+            parent = self.parents.get(parent_id)
+            if parent is None or parent.status != "ACTIVE":
+                return False
+            parent.status = "CANCELLED"
+            return True
+
+    def active_parents(self):
+        return [parent for parent in self.parents.values() if parent.status == "ACTIVE"]
+
+    def get_parent(self, parent_id: str) -> Optional[Dict[str, Any]]:
+        parent = self.parents.get(parent_id)
+        return parent.to_dict() if parent else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats, active=len(self.active_parents()), working_children=len(self._child_parent))
+
+    # ---- 백그라운드 구동 ----
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="spot-exec-scheduler", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopping.wait(self.config["poll_interval"]):
+            self.run_once()
+
+    def stop(self, wait: bool = True):
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join(timeout=self.config["poll_interval"] * 4)
+            self._thread = None
+        self._executor.shutdown(wait=wait)
@@ -5,15 +5,28 @@ from typing import Dict, Any, Optional
 
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config_snapshot import init_config
 from spot_backtester import SpotBacktester
 from spot_claude_client import SpotClaudeClient
+from spot_config import SPOT_RISK_MANAGEMENT
+from results_store import ResultsStore
+from risk_engine import PreTradeRiskEngine
+from tracing import TRACER
 
 class SpotTrader:
     """Spot 거래 메인 클래스"""
     
-    def __init__(self, claude_client: SpotClaudeClient):
+    def __init__(self, claude_client: SpotClaudeClient, risk_engine: Optional[PreTradeRiskEngine] = None,
+                 results_store: Optional[ResultsStore] = None):
         self.claude_client = claude_client
+        # 백테스트 결과(지표/거래/자산 곡선) 저장소
+        self.results_store = results_store
+        # 주문 전 리스크 검사 (USD 잔고를 자기자본으로 사용)
+        self.risk_engine = risk_engine or PreTradeRiskEngine(
+            SPOT_RISK_MANAGEMENT, equity=claude_client.get_balance("USD")
+        )
         print("SpotTrader initialized successfully")
     
     def execute_spot_trading_strategy(self, symbol: str, amount: float) -> Dict[str, Any]:
@@ -21,14 +34,23 @@ class SpotTrader:
         try:
             print(f"Executing spot trading strategy for {symbol} with amount {amount}")
             
-            # 잔액 확인
-            balance = self.claude_client.get_balance("USD")
-            
-            if balance < amount:
-                return {"success": False, "error": "Insufficient balance"}
-            
-            # 주문 실행
-            order = self.claude_client.place_order(symbol, amount/50000, 50000, "BUY")
+            with TRACER.span('spot.tick'):
+                # 잔액 확인
+                with TRACER.span('spot.risk_check'):
+                    balance = self.claude_client.get_balance("USD")
+                
+                    if balance < amount:
+                        return {"success": False, "error": "Insufficient balance"}
+
+                    risk_check = self.risk_engine.check_order(symbol, "BUY", amount/50000, 50000)
+                    if not risk_check["allowed"]:
+                        return {"success": False, "error": risk_check["reason"]}
+                
+                # 주문 실행
+                with TRACER.span('spot.order'):
+                    order = self.claude_client.place_order(symbol, amount/50000, 50000, "BUY")
+                    if order.get("success"):
+                        self.risk_engine.on_fill(symbol, "BUY", amount/50000, 50000)
             
             return {
                 "success": True,
@@ -51,13 +73,21 @@ class SpotTrader:
             )
             
             # 백테스팅 실행
-            equity_curve = backtester.backtest()
+            equity_curve = backtester.run()
             performance = backtester.get_performance()
-            
+
+            run_id = None
+            if self.results_store is not None:
+                params = {"symbol": symbol, "start_date": start_date, "end_date": end_date,
+                          "initial_capital": backtester.initial_capital, "ma_window": backtester.ma_window,
+                          "trade_quantity": backtester.trade_quantity}
+                run_id = self.results_store.write_backtester(backtester, params, equity_curve=equity_curve)
+
             return {
                 "success": True,
                 "performance": performance,
-                "equity_curve": equity_curve is not None
+                "equity_curve": equity_curve,
+                "run_id": run_id
             }
             
         except Exception as e:
@@ -67,6 +97,9 @@ class SpotTrader:
 def main():
     """메인 실행 함수"""
     try:
+        # 설정 스냅샷은 시작 시 한 번 검증/생성
+        init_config()
+
         # 클라이언트 초기화
         claude_client = SpotClaudeClient("demo_api_key")
         
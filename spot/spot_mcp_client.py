@@ -1,16 +1,94 @@
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spot_config import REQUEST_HEDGING, CIRCUIT_BREAKER, REQUEST_TIMEOUT
+from spot_request_guard import LatencyWindow, CircuitBreaker
+from position_keeper import SIDE_SIGN
 
 
 class SpotMCPClient:
-    def __init__(self, host="127.0.0.1", port=8080, api_key="test"):
+    def __init__(self, host="127.0.0.1", port=8080, api_key="test", hedging=None, circuit_breaker=None,
+                 position_keeper=None):
         self.host = host
+        self.position_keeper = position_keeper  # 있으면 체결된 주문을 로컬 포지션에 반영
         self.port = port
         self.api_key = api_key
         self.endpoint = f"http://{host}:{port}/api"
 
+        self.hedging = dict(REQUEST_HEDGING, **(hedging or {}))
+        self.circuit_breaker_config = dict(CIRCUIT_BREAKER, **(circuit_breaker or {}))
+        self._breakers = {}
+        self._latencies = {}
+        self._last_values = {}
+        self._executor = None
+        self.request_stats = {"hedged": 0, "hedge_wins": 0, "short_circuited": 0, "stale_served": 0}
+
+    def _endpoint_key(self, path):
+        # "spot/price/BTC" -> "spot/price": 심볼과 무관하게 엔드포인트 단위로 상태 관리
+        return "/".join(path.split("/")[:2])
+
+    def _breaker(self, endpoint):
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers.setdefault(endpoint, CircuitBreaker(
+                failure_threshold=self.circuit_breaker_config["failure_threshold"],
+                reset_timeout=self.circuit_breaker_config["reset_timeout"],
+            ))
+        return breaker
+
+    def _latency(self, endpoint):
+        window = self._latencies.get(endpoint)
+        if window is None:
+            window = self._latencies.setdefault(endpoint, LatencyWindow(self.hedging["window_size"]))
+        return window
+
+    def _send(self, method, url, params, data, headers):
+        import requests
+
+        response = requests.request(
+            method, url, params=params, json=data, headers=headers, timeout=REQUEST_TIMEOUT
+        )
+        response.raise_for_status()  # Raise an exception for bad status codes
+        return response.json()
+
+    def _hedged_send(self, method, url, params, data, headers, window):
+        """멱등 요청 헤징: p95 지연 후 두 번째 요청을 보내고 먼저 온 응답 사용"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.hedging["max_workers"])
+
+        delay = window.hedge_delay(
+            self.hedging["percentile"],
+            self.hedging["min_delay"],
+            self.hedging["initial_delay"],
+            self.hedging["min_samples"],
+        )
+        primary = self._executor.submit(self._send, method, url, params, data, headers)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        self.request_stats["hedged"] += 1
+        hedge = self._executor.submit(self._send, method, url, params, data, headers)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error = e
+                    continue
+                if future is hedge:
+                    self.request_stats["hedge_wins"] += 1
+                return result
+        raise error
+
     def _request(self, method, path, params=None, data=None, headers=None):
         import requests
 
@@ -19,15 +97,52 @@ class SpotMCPClient:
         if headers:
             request_headers.update(headers)
 
+        idempotent = method == "GET"
+        endpoint = self._endpoint_key(path)
+        # 마지막 값 대체는 시세 같은 읽기에만 사용 (주문 상태 조회 실패는 그대로 실패로 전달)
+        stale_ok = idempotent and endpoint not in self.circuit_breaker_config["fresh_only_endpoints"]
+        cache_key = (path, tuple(sorted((params or {}).items())))
+        breaker = self._breaker(endpoint)
+
+        if not breaker.allow_request():
+            # 비정상 엔드포인트: 네트워크 호출 없이 즉시 실패하고 마지막 값 반환
+            self.request_stats["short_circuited"] += 1
+            return self._stale_value(cache_key, stale_ok)
+
+        window = self._latency(endpoint)
+        started = time.monotonic()
         try:
-            response = requests.request(
-                method, url, params=params, json=data, headers=request_headers
-            )
-            response.raise_for_status()  # Raise an exception for bad status codes
-            return response.json()
+            if idempotent and self.hedging["enabled"]:
+                result = self._hedged_send(method, url, params, data, request_headers, window)
+            else:
+                result = self._send(method, url, params, data, request_headers)
         except requests.exceptions.RequestException as e:
+            breaker.record_failure()
             print(f"Error during request to {url}: {e}")
+            return self._stale_value(cache_key, stale_ok)
+
+        breaker.record_success()
+        window.record(time.monotonic() - started)
+        if stale_ok:
+            self._last_values[cache_key] = result
+        return result
+
+    def _stale_value(self, cache_key, stale_ok):
+        if not stale_ok or cache_key not in self._last_values:
             return None
+        self.request_stats["stale_served"] += 1
+        return self._last_values[cache_key]
+
+    def get_endpoint_health(self):
+        """엔드포인트별 브레이커 상태 및 p95 지연시간"""
+        return {
+            endpoint: {
+                "state": breaker.state,
+                "consecutive_failures": breaker.consecutive_failures,
+                "p95_latency": self._latency(endpoint).percentile(95),
+            }
+            for endpoint, breaker in self._breakers.items()
+        }
 
     def get_price(self, symbol):
         return self._request("GET", f"spot/price/{symbol}")
@@ -53,7 +168,21 @@ class SpotMCPClient:
             "price": price,
             "quantity": quantity,
         }
-        return self._request("POST", "spot/order", data=data)
+        result = self._request("POST", "spot/order", data=data)
+        if self.position_keeper is not None and isinstance(result, dict) and result.get("status") == "FILLED":
+            side = str(result.get("side", order_type)).upper()
+            if side in SIDE_SIGN:
+                self.position_keeper.apply_fill(
+                    symbol, side, result.get("executed_quantity", quantity), result.get("price", price)
+                )
+        return result
 
     def cancel_order(self, order_id):
-        return self._request("DELETE", f"spot/order/{order_id}")
\ No newline at end of file
+        return self._request("DELETE", f"spot/order/{order_id}")
+
+    def get_order_status(self, order_id):
+        return self._request("GET", f"spot/order/{order_id}")
+
+    def get_order_statuses(self, order_ids):
+        # 여러 주문 상태를 한 번의 요청으로 조회
+        return self._request("GET", "spot/orders", params={"order_ids": ",".join(map(str, order_ids))})
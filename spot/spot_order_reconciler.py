@@ -0,0 +1,264 @@
+"""
+🔄 주문 상태 대사 서비스
+- 미체결 주문 상태를 배치 단위로 조회 (get_order_statuses, 없으면 주문별 get_order_status)
+- 로컬 주문 저장소와 비교하여 변경된 주문만 반영
+- 변화 없는 주문은 폴링 주기를 늘리고, 변화가 있는 주문은 짧은 주기로 재조회
+- 토큰 버킷으로 초당 대사 요청 수 상한 적용
+- 조회 실패/응답 누락 주문은 폴링 주기를 늘리지 않음 (장애 중에도 같은 주기로 재시도)
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, Any, Callable, List, Optional
+
+from spot_config import SPOT_RECONCILE
+from spot_order_store import STATUS_CODES, OPEN_STATUSES
+from spot_split_order import SpotSplitOrder
+
+# 거래소/클라이언트별 상태 표기 정규화
+STATUS_ALIASES = {
+    "PENDING": "NEW",
+    "OPEN": "NEW",
+    "PARTIAL": "PARTIALLY_FILLED",
+    "CANCELED": "CANCELLED",
+    "NOT_FOUND": "EXPIRED",
+}
+
+
+def normalize_status(status) -> Optional[str]:
+    status = str(status or "").upper()
+    status = STATUS_ALIASES.get(status, status)
+    return status if status in STATUS_CODES else None
+
+
+class TokenBucket:
+    """초당 요청 수 제한"""
+
+    def __init__(self, rate: float, burst: float, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, now: float = None) -> bool:
+        self._refill(self.clock() if now is None else now)
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def next_available(self, now: float) -> float:
+        """토큰 1개가 적립되는 시각"""
+        return now + max(1.0 - self.tokens, 0.0) / self.rate
+
+
+class TrackedOrder:
+    """대사 대상 주문의 폴링 상태"""
+
+    __slots__ = ('order_id', 'venue_order_id', 'interval', 'next_due')
+
+    def __init__(self, order_id, venue_order_id, interval, next_due):
+        self.order_id = order_id
+        self.venue_order_id = venue_order_id
+        self.interval = interval
+        self.next_due = next_due
+
+
+class SpotOrderReconciler:
+    def __init__(self, mcp_client, order_store, clock=time.monotonic, config=None,
+                 on_change: Optional[Callable[[str, str, float], Any]] = None):
+        self.mcp = mcp_client
+        self.store = order_store
+        self.clock = clock
+        self.config = dict(SPOT_RECONCILE, **(config or {}))
+        self.on_change = on_change
+        self.bucket = TokenBucket(self.config["max_requests_per_second"], self.config["burst"], clock)
+
+        self.tracked = {}          # 로컬 주문 ID -> TrackedOrder
+        self._scheduler_children = {}  # 자식 주문 ID -> SpotExecutionScheduler
+        self._due = []             # (다음 조회 시각, 순번, 로컬 주문 ID)
+        self._sequence = itertools.count()
+        self._lock = threading.RLock()
+        self._thread = None
+        self._stopping = threading.Event()
+        self.stats = {"requests": 0, "orders_polled": 0, "changes": 0, "throttled": 0, "errors": 0}
+
+    # ---- 등록 ----
+
+    def track(self, order_id: str, venue_order_id: str = None, now: float = None):
+        """저장소에 있는 주문을 대사 대상으로 등록"""
+        if order_id not in self.store:
+            raise KeyError(f"Unknown order id: {order_id}")
+        now = self.clock() if now is None else now
+        with self._lock:
+            tracked = TrackedOrder(order_id, venue_order_id or order_id, self.config["min_interval"],
+                                   now + self.config["min_interval"])
+            self.tracked[order_id] = tracked
+            self._push(tracked)
+
+    def untrack(self, order_id: str):
+        with self._lock:
+            self.tracked.pop(order_id, None)  # 힙 항목은 꺼낼 때 무시
+            self._scheduler_children.pop(order_id, None)
+
+    def _push(self, tracked):
+        heapq.heappush(self._due, (tracked.next_due, next(self._sequence), tracked.order_id))
+
+    def attach_scheduler(self, scheduler, now: float = None) -> int:
+        """실행 스케줄러의 거래소 대기 자식 주문을 저장소에 추가하고 대사 대상으로 등록
+
+        종료 상태가 확인되면 scheduler.on_child_update로 체결 수량을 돌려줌
+        """
+        added = 0
+        with scheduler._lock:
+            children = [
+                (child_id, venue_id, scheduler.parents[scheduler._child_parent[child_id]])
+                for child_id, venue_id in list(scheduler.venue_order_ids.items())
+                if child_id in scheduler._child_parent
+            ]
+        for child_id, venue_id, parent in children:
+            if child_id in self.tracked:
+                continue
+            if child_id not in self.store:
+                self.store.add(SpotSplitOrder(child_id, parent.symbol, parent.limit_price,
+                                              parent.children.get(child_id, 0.0), parent.side,
+                                              self.clock() if now is None else now))
+            self.track(child_id, venue_id, now)
+            self._scheduler_children[child_id] = scheduler
+            added += 1
+        return added
+
+    # ---- 조회 ----
+
+    def _fetch(self, venue_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        batch_fn = getattr(self.mcp, "get_order_statuses", None)
+        if batch_fn is not None:
+            response = batch_fn(venue_ids)
+            if response is None:
+                raise ConnectionError("order status batch returned no response")
+            if isinstance(response, dict):
+                response = response.get("orders", [response] if "order_id" in response else [])
+            return {str(row.get("order_id")): row for row in response or [] if isinstance(row, dict)}
+        # 배치 조회가 없는 클라이언트: 주문별 조회
+        results = {}
+        for venue_id in venue_ids:
+            row = self.mcp.get_order_status(venue_id)
+            if isinstance(row, dict):
+                results[str(venue_id)] = row
+        return results
+
+    def run_once(self, now: float = None) -> int:
+        """도래한 주문 상태를 배치 조회하여 반영, 변경된 주문 수 반환"""
+        now = self.clock() if now is None else now
+        with self._lock:
+            due = []
+            while self._due and self._due[0][0] <= now:
+                due_time, _, order_id = heapq.heappop(self._due)
+                tracked = self.tracked.get(order_id)
+                if tracked is None or tracked.next_due != due_time:
+                    continue  # 등록 해제되었거나 재예약된 항목
+                due.append(tracked)
+
+        changed = 0
+        batch_size = self.config["batch_size"] if hasattr(self.mcp, "get_order_statuses") else 1
+        for start in range(0, len(due), batch_size):
+            batch = due[start:start + batch_size]
+            with self._lock:
+                allowed = self.bucket.try_acquire(now)
+            if not allowed:
+                # 요청 상한 초과: 남은 주문은 다음 토큰 적립 시각으로 미룸
+                retry_at = self.bucket.next_available(now)
+                with self._lock:
+                    for tracked in due[start:]:
+                        if tracked.order_id in self.tracked:
+                            tracked.next_due = retry_at
+                            self._push(tracked)
+                    self.stats["throttled"] += len(due) - start
+                break
+            changed += self._reconcile_batch(batch, now)
+        return changed
+
+    def _reconcile_batch(self, batch, now):
+        self.stats["requests"] += 1
+        self.stats["orders_polled"] += len(batch)
+        try:
+            rows = self._fetch([tracked.venue_order_id for tracked in batch])
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"Order status batch failed ({len(batch)} orders): {e}")
+            rows = {}
+
+        changes = []
+        with self._lock:
+            for tracked in batch:
+                if tracked.order_id not in self.tracked:
+                    continue
+                row = rows.get(str(tracked.venue_order_id))
+                change = self._diff(tracked.order_id, row) if row else None
+                if change is not None:
+                    changes.append(change)
+                    tracked.interval = self.config["min_interval"]
+                elif row:
+                    # 상태를 확인했지만 변화 없음: 폴링 주기 증가
+                    tracked.interval = min(tracked.interval * self.config["backoff"], self.config["max_interval"])
+                # 조회 실패/응답 누락: 변화 여부를 모르므로 현재 주기 유지
+
+                if change is not None and change[1] not in OPEN_STATUSES:
+                    del self.tracked[tracked.order_id]
+                else:
+                    tracked.next_due = now + tracked.interval
+                    self._push(tracked)
+            self.stats["changes"] += len(changes)
+
+        for order_id, status, filled in changes:
+            if self.on_change is not None:
+                self.on_change(order_id, status, filled)
+            if status not in OPEN_STATUSES and order_id in self._scheduler_children:
+                self._scheduler_children.pop(order_id).on_child_update(order_id, filled, status)
+        return len(changes)
+
+    def _diff(self, order_id, row):
+        """거래소 상태와 저장소 상태가 다르면 반영 후 (주문 ID, 상태, 체결 수량) 반환"""
+        status = normalize_status(row.get("status"))
+        if status is None:
+            return None
+        local = self.store.get(order_id)
+        filled = row.get("executed_quantity")
+        if filled is None:
+            filled = local.quantity if status == "FILLED" else local.filled_quantity
+        filled = min(float(filled), local.quantity)
+        if status == local.status and abs(filled - local.filled_quantity) <= 1e-12:
+            return None
+        if not self.store.transition([order_id], status, filled=[filled]):
+            return None  # 이미 종료된 주문
+        return order_id, status, filled
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats, tracked=len(self.tracked), tokens=round(self.bucket.tokens, 3))
+
+    # ---- 백그라운드 구동 ----
+
+    def start(self, poll_interval: float = 0.2):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, args=(poll_interval,),
+                                        name="spot-order-reconciler", daemon=True)
+        self._thread.start()
+
+    def _run(self, poll_interval):
+        while not self._stopping.wait(poll_interval):
+            self.run_once()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join(timeout=2.0)
+            self._thread = None
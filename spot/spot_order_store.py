@@ -0,0 +1,243 @@
+"""
+🗂️ 열 기반 현물 주문 저장소
+- 주문 필드를 numpy 열 배열에 보관 (주문당 파이썬 객체 없음)
+- 주문 ID 조회 O(1), 미체결 주문은 심볼/방향/상태 보조 인덱스 유지
+- 종료된 과거 주문은 인덱스 없이 열 마스크로 조회하여 메모리 증가를 억제
+- 여러 주문의 상태를 한 번에 전이
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+
+import numpy as np
+
+from spot_split_order import SpotSplitOrder
+
+STATUSES = ("NEW", "PARTIALLY_FILLED", "FILLED", "CANCELLED", "REJECTED", "EXPIRED")
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+OPEN_STATUSES = frozenset({"NEW", "PARTIALLY_FILLED"})
+SIDES = ("BUY", "SELL")
+SIDE_CODES = {side: code for code, side in enumerate(SIDES)}
+
+
+def _epoch(timestamp) -> float:
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return float(timestamp or 0.0)
+
+
+class SpotOrderStore:
+    """열 배열 기반 주문 저장소"""
+
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._alloc(capacity)
+        self.order_ids = []      # 행 번호 -> 주문 ID
+        self._rows = {}          # 주문 ID -> 행 번호
+        self._symbols = []       # 심볼 코드 -> 심볼
+        self._symbol_codes = {}
+        # 미체결 주문 보조 인덱스 (종료 시 제거)
+        self._open_by_symbol = {}
+        self._open_by_side = {code: set() for code in range(len(SIDES))}
+        self._open_by_status = {STATUS_CODES[status]: set() for status in OPEN_STATUSES}
+        self._lock = threading.RLock()
+
+    def _alloc(self, capacity):
+        self.symbol = np.zeros(capacity, dtype=np.int32)
+        self.side = np.zeros(capacity, dtype=np.int8)
+        self.status = np.zeros(capacity, dtype=np.int8)
+        self.price = np.zeros(capacity, dtype=np.float64)
+        self.quantity = np.zeros(capacity, dtype=np.float64)
+        self.filled = np.zeros(capacity, dtype=np.float64)
+        self.timestamp = np.zeros(capacity, dtype=np.float64)
+
+    def _grow(self, needed):
+        capacity = len(self.symbol)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name in ("symbol", "side", "status", "price", "quantity", "filled", "timestamp"):
+            column = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+    def _symbol_code(self, symbol):
+        code = self._symbol_codes.get(symbol)
+        if code is None:
+            code = self._symbol_codes[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+            self._open_by_symbol[code] = set()
+        return code
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, order_id):
+        return order_id in self._rows
+
+    # ---- 추가 ----
+
+    def add(self, order: SpotSplitOrder) -> int:
+        return self.add_many([order])[0]
+
+    def add_many(self, orders: Iterable[SpotSplitOrder]) -> List[int]:
+        """주문 일괄 추가 - 모든 주문을 먼저 검증하고, 하나라도 잘못되면 아무것도 기록하지 않음"""
+        orders = list(orders)
+        with self._lock:
+            # 1단계: 검증 및 코드 변환 (저장소 상태 변경 없음)
+            seen = set()
+            prepared = []
+            for order in orders:
+                if order.order_id in self._rows or order.order_id in seen:
+                    raise ValueError(f"Duplicate order id: {order.order_id}")
+                seen.add(order.order_id)
+                side = order.order_type.upper()
+                if side not in SIDE_CODES:
+                    raise ValueError(f"Unknown order side: {order.order_type}")
+                status = getattr(order, "status", "NEW")
+                if status not in STATUS_CODES:
+                    raise ValueError(f"Unknown order status: {status}")
+                prepared.append((order, SIDE_CODES[side], STATUS_CODES[status], _epoch(order.timestamp)))
+
+            # 2단계: 기록
+            self._grow(self._size + len(prepared))
+            rows = []
+            for order, side_code, status_code, timestamp in prepared:
+                row = self._size
+                self._size += 1
+                symbol_code = self._symbol_code(order.symbol)
+                self.symbol[row] = symbol_code
+                self.side[row] = side_code
+                self.status[row] = status_code
+                self.price[row] = order.price or 0.0
+                self.quantity[row] = order.quantity
+                self.filled[row] = getattr(order, "filled_quantity", 0.0)
+                self.timestamp[row] = timestamp
+                self.order_ids.append(order.order_id)
+                self._rows[order.order_id] = row
+                if STATUSES[status_code] in OPEN_STATUSES:
+                    self._index_open(row, symbol_code, side_code, status_code)
+                rows.append(row)
+            return rows
+
+    def _index_open(self, row, symbol_code, side_code, status_code):
+        self._open_by_symbol[symbol_code].add(row)
+        self._open_by_side[side_code].add(row)
+        self._open_by_status[status_code].add(row)
+
+    def _unindex_open(self, row):
+        self._open_by_symbol[int(self.symbol[row])].discard(row)
+        self._open_by_side[int(self.side[row])].discard(row)
+        status_rows = self._open_by_status.get(int(self.status[row]))
+        if status_rows is not None:
+            status_rows.discard(row)
+
+    # ---- 조회 ----
+
+    def get(self, order_id) -> Optional[SpotSplitOrder]:
+        row = self._rows.get(order_id)
+        return None if row is None else self._materialize(row)
+
+    def _materialize(self, row) -> SpotSplitOrder:
+        return SpotSplitOrder(
+            self.order_ids[row], self._symbols[self.symbol[row]], float(self.price[row]),
+            float(self.quantity[row]), SIDES[self.side[row]], float(self.timestamp[row]),
+            STATUSES[self.status[row]], float(self.filled[row])
+        )
+
+    def open_orders(self, symbol: Optional[str] = None, side: Optional[str] = None,
+                    status: Optional[str] = None) -> List[str]:
+        # 미체결 주문은 보조 인덱스 교집합으로 조회
+        with self._lock:
+            candidates = []
+            if symbol is not None:
+                code = self._symbol_codes.get(symbol)
+                candidates.append(self._open_by_symbol.get(code, set()))
+            if side is not None:
+                candidates.append(self._open_by_side[SIDE_CODES[side.upper()]])
+            if status is not None:
+                candidates.append(self._open_by_status.get(STATUS_CODES[status], set()))
+            if not candidates:
+                candidates = [set().union(*self._open_by_status.values())]
+            candidates.sort(key=len)
+            rows = candidates[0].intersection(*candidates[1:])
+            return [self.order_ids[row] for row in sorted(rows)]
+
+    def find(self, symbol: Optional[str] = None, side: Optional[str] = None,
+             status: Optional[str] = None) -> List[str]:
+        # 과거 주문 포함 전체 조회 - 열 마스크 벡터 연산
+        if status in OPEN_STATUSES:
+            return self.open_orders(symbol, side, status)
+        with self._lock:
+            mask = np.ones(self._size, dtype=bool)
+            if symbol is not None:
+                if symbol not in self._symbol_codes:
+                    return []
+                mask &= self.symbol[:self._size] == self._symbol_codes[symbol]
+            if side is not None:
+                mask &= self.side[:self._size] == SIDE_CODES[side.upper()]
+            if status is not None:
+                mask &= self.status[:self._size] == STATUS_CODES[status]
+            return [self.order_ids[row] for row in np.flatnonzero(mask)]
+
+    # ---- 상태 전이 ----
+
+    def transition(self, order_ids: Iterable, new_status: str, filled: Optional[Iterable[float]] = None) -> int:
+        # 여러 주문의 상태를 한 번에 변경 (종료된 주문은 변경하지 않음), 변경 수 반환
+        new_code = STATUS_CODES[new_status]
+        with self._lock:
+            rows = np.fromiter((self._rows[order_id] for order_id in order_ids), dtype=np.int64)
+            fills = None if filled is None else np.asarray(list(filled), dtype=np.float64)
+            return self._transition_rows(rows, new_code, fills)
+
+    def transition_where(self, new_status: str, symbol: Optional[str] = None, side: Optional[str] = None) -> int:
+        # 조건에 맞는 미체결 주문 일괄 전이 (예: 심볼 전체 취소)
+        with self._lock:
+            order_ids = self.open_orders(symbol, side)
+            return self.transition(order_ids, new_status)
+
+    def _transition_rows(self, rows, new_code, fills):
+        if rows.size == 0:
+            return 0
+        current = self.status[rows]
+        open_codes = [STATUS_CODES[status] for status in OPEN_STATUSES]
+        movable = np.isin(current, open_codes)
+        rows = rows[movable]
+        if fills is not None:
+            self.filled[rows] = np.minimum(fills[movable], self.quantity[rows])
+        elif STATUSES[new_code] == "FILLED":
+            self.filled[rows] = self.quantity[rows]
+
+        new_is_open = STATUSES[new_code] in OPEN_STATUSES
+        for row in rows.tolist():
+            self._unindex_open(row)
+        self.status[rows] = new_code
+        if new_is_open:
+            for row in rows.tolist():
+                self._index_open(row, int(self.symbol[row]), int(self.side[row]), new_code)
+        return int(rows.size)
+
+    def counts(self) -> Dict[str, int]:
+        codes = np.bincount(self.status[:self._size], minlength=len(STATUSES))
+        return {status: int(count) for status, count in zip(STATUSES, codes)}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "orders": self._size,
+            "open": sum(len(rows) for rows in self._open_by_status.values()),
+            "symbols": len(self._symbols),
+            "by_status": self.counts(),
+            "memory_bytes": self.memory_bytes(),
+        }
+
+    def memory_bytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in
+                   ("symbol", "side", "status", "price", "quantity", "filled", "timestamp"))
+
+    def to_dict(self, order_id) -> Optional[Dict[str, Any]]:
+        order = self.get(order_id)
+        return None if order is None else order.get_order_details()
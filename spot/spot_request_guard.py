@@ -0,0 +1,91 @@
+"""
+🛡️ 요청 보호 장치
+- 지연시간 분위수 추적 (헤지 요청 지연 계산용)
+- 엔드포인트별 서킷 브레이커
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class LatencyWindow:
+    """최근 요청 지연시간 슬라이딩 윈도우"""
+
+    def __init__(self, size: int = 200):
+        self.samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """지연시간 기록"""
+        with self._lock:
+            self.samples.append(seconds)
+
+    def percentile(self, pct: float):
+        """분위수 계산 (표본이 없으면 None)"""
+        with self._lock:
+            if not self.samples:
+                return None
+            ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * pct / 100.0))
+        return ordered[index]
+
+    def hedge_delay(self, pct: float, min_delay: float, initial_delay: float, min_samples: int) -> float:
+        """헤지 요청을 보내기 전 대기 시간"""
+        if len(self.samples) < min_samples:
+            return initial_delay
+        return max(min_delay, self.percentile(pct))
+
+
+class CircuitBreaker:
+    """엔드포인트별 서킷 브레이커 (CLOSED → OPEN → HALF_OPEN)"""
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """요청 허용 여부 (OPEN 상태에서는 즉시 실패)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if self.clock() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            # HALF_OPEN: 시험 요청은 한 번에 하나만 허용
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        """성공 기록 - 브레이커 닫기"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """실패 기록 - 임계치 도달 시 브레이커 열기"""
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+
+    def is_open(self) -> bool:
+        """브레이커 열림 여부"""
+        return self.state == self.OPEN
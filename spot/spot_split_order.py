@@ -1,14 +1,19 @@
 class SpotSplitOrder:
-    def __init__(self, order_id, symbol, price, quantity, order_type, timestamp):
+    # 인스턴스별 __dict__ 없이 고정 슬롯만 사용 (대량 보관 시 메모리 절약)
+    __slots__ = ("order_id", "symbol", "price", "quantity", "order_type", "timestamp", "status", "filled_quantity")
+
+    def __init__(self, order_id, symbol, price, quantity, order_type, timestamp, status="NEW", filled_quantity=0.0):
         self.order_id = order_id
         self.symbol = symbol
         self.price = price
         self.quantity = quantity
         self.order_type = order_type
         self.timestamp = timestamp
+        self.status = status
+        self.filled_quantity = filled_quantity
 
     def __str__(self):
-        return f"SpotSplitOrder(order_id={self.order_id}, symbol={self.symbol}, price={self.price}, quantity={self.quantity}, order_type={self.order_type}, timestamp={self.timestamp})"
+        return f"SpotSplitOrder(order_id={self.order_id}, symbol={self.symbol}, price={self.price}, quantity={self.quantity}, order_type={self.order_type}, timestamp={self.timestamp}, status={self.status})"
 
     def get_order_details(self):
         return {
@@ -17,7 +22,9 @@ class SpotSplitOrder:
             "price": self.price,
             "quantity": self.quantity,
             "order_type": self.order_type,
-            "timestamp": self.timestamp
+            "timestamp": self.timestamp,
+            "status": self.status,
+            "filled_quantity": self.filled_quantity
         }
 
     def update_quantity(self, new_quantity):
@@ -30,4 +37,4 @@ class SpotSplitOrder:
         return self.order_type == "BUY"
 
     def is_sell_order(self):
-        return self.order_type == "SELL"
\ No newline at end of file
+        return self.order_type == "SELL"
@@ -0,0 +1,114 @@
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from spot_execution_scheduler import SpotExecutionScheduler
+
+
+class StubVenue:
+    def __init__(self, fill_ratio=1.0):
+        self.fill_ratio = fill_ratio
+        self.orders = []
+        self._lock = threading.Lock()
+
+    def create_order(self, symbol, order_type, price, quantity):
+        with self._lock:
+            self.orders.append((symbol, order_type, quantity))
+        return {"status": "PARTIALLY_FILLED" if self.fill_ratio < 1 else "FILLED",
+                "executed_quantity": quantity * self.fill_ratio}
+
+
+def drive(scheduler, until, step=10.0):
+    now = 0.0
+    while now <= until:
+        scheduler.run_once(now)
+        scheduler.wait_idle()
+        now += step
+
+
+def test_twap_slices_evenly_and_completes():
+    venue = StubVenue()
+    scheduler = SpotExecutionScheduler(venue, clock=lambda: 0.0)
+    parent = scheduler.submit("BTC-USD", "buy", 1.0, strategy="TWAP", duration=50)
+    drive(scheduler, 60)
+    assert [round(q, 6) for _, _, q in venue.orders] == [0.2] * 5
+    assert scheduler.get_parent(parent.parent_id)["status"] == "COMPLETED"
+
+
+def test_vwap_follows_volume_curve_and_replans_partial_fills():
+    venue = StubVenue(fill_ratio=0.5)
+    scheduler = SpotExecutionScheduler(venue, clock=lambda: 0.0)
+    parent = scheduler.submit("ETH-USD", "SELL", 10.0, strategy="VWAP", duration=30,
+                              volume_curve=[1, 1, 2, 2, 1, 1])
+    drive(scheduler, 120)
+    quantities = [q for _, _, q in venue.orders]
+    assert abs(quantities[0] - 2.5) < 1e-9          # 10 * 2/8
+    assert abs(quantities[1] - 8.75 * 4 / 6) < 1e-9  # 미체결분(1.25)을 포함한 잔량을 남은 가중치로 재배분
+    assert scheduler.stats["replans"] >= 3
+    assert scheduler.get_parent(parent.parent_id)["filled"] > 9.0
+
+
+def test_vwap_weights_follow_hour_of_week_profile():
+    monday = 1704067200  # 2024-01-01 00:00 UTC (월요일)
+
+    class HistoryVenue(StubVenue):
+        def __init__(self):
+            super().__init__()
+            self.kline_requests = []
+
+        def get_kline(self, symbol, interval="1m", limit=100):
+            self.kline_requests.append((interval, limit))
+            # 2주간 1시간봉: 월요일 14시(UTC)만 거래량 4배
+            return [[(monday + hour * 3600) * 1000, 100, 101, 99, 100, 40.0 if hour % 168 == 14 else 10.0]
+                    for hour in range(336)]
+
+    venue = HistoryVenue()
+    start = monday + 7 * 86400 + 13.5 * 3600  # 다음 주 월요일 13:30
+    scheduler = SpotExecutionScheduler(venue, clock=lambda: start, config={"slice_interval": 1800})
+    parent = scheduler.submit("BTC-USD", "BUY", 10.0, strategy="VWAP", duration=7200)
+
+    # 슬라이스 중간 시각 13:45 / 14:15 / 14:45 / 15:15 -> 해당 시간대 과거 거래량 비율
+    assert [round(w / parent.weights[0], 6) for w in parent.weights] == [1.0, 4.0, 4.0, 1.0]
+    assert venue.kline_requests == [("1h", 672)]
+    scheduler.submit("BTC-USD", "BUY", 1.0, strategy="VWAP", duration=7200)
+    assert len(venue.kline_requests) == 1  # 학습한 프로파일 재사용
+    scheduler.stop()
+
+
+def test_pov_tracks_market_volume():
+    venue = StubVenue()
+    scheduler = SpotExecutionScheduler(venue, clock=lambda: 0.0, volume_fn=lambda symbol: 60.0)
+    scheduler.submit("SOL-USD", "BUY", 100.0, strategy="POV", duration=40, participation=0.1)
+    drive(scheduler, 30)
+    assert [round(q, 6) for _, _, q in venue.orders] == [1.0, 1.0, 1.0, 1.0]
+
+
+def test_pov_volume_fetched_outside_lock_and_expires():
+    venue = StubVenue()
+    scheduler = SpotExecutionScheduler(venue, clock=lambda: 0.0)
+    lock_free = []
+
+    def volume_fn(symbol):
+        # 조회 중 다른 스레드가 잠금을 얻을 수 있어야 함
+        acquired = []
+
+        def try_lock():
+            acquired.append(scheduler._lock.acquire(timeout=1.0))
+            if acquired[0]:
+                scheduler._lock.release()
+
+        worker = threading.Thread(target=try_lock)
+        worker.start()
+        worker.join()
+        lock_free.append(acquired[0])
+        return 6.0
+
+    scheduler.volume_fn = volume_fn
+    parent = scheduler.submit("SOL-USD", "BUY", 100.0, strategy="POV", duration=30, participation=0.1)
+    drive(scheduler, 60)
+    assert lock_free and all(lock_free)
+    assert [round(q, 6) for _, _, q in venue.orders] == [0.1, 0.1, 0.1]
+    assert scheduler.get_parent(parent.parent_id)["status"] == "EXPIRED"
+    assert len(lock_free) == 3  # 만료 후에는 거래량 조회 없음
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+🧪 SpotMCPClient 헤징/서킷 브레이커 테스트
+- 로컬 스텁 HTTP 서버 사용
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from spot_mcp_client import SpotMCPClient
+
+
+class StubMarketHandler(BaseHTTPRequestHandler):
+    """느린 복제본과 장애 엔드포인트를 흉내내는 스텁"""
+
+    hits = {}
+
+    def do_GET(self):
+        count = self.hits.get(self.path, 0) + 1
+        self.hits[self.path] = count
+
+        if self.path.startswith("/api/spot/price/SLOW") and count == 1:
+            time.sleep(1.0)  # 첫 요청만 느린 복제본으로 라우팅
+        flaky = self.path.startswith("/api/spot/depth/FLAKY") or self.path.startswith("/api/spot/orders")
+        if flaky and count > 1:
+            self.send_response(500)
+            self.end_headers()
+            return
+
+        body = {"path": self.path, "price": 100.0}
+        if self.path.startswith("/api/spot/orders"):
+            body = [{"order_id": "o0", "status": "NEW", "executed_quantity": 0.0}]
+        body = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubMarketHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_hedged_read_beats_slow_replica():
+    """느린 첫 응답을 헤지 요청이 대체"""
+    server = start_stub_server()
+    try:
+        client = SpotMCPClient(port=server.server_address[1], hedging={"initial_delay": 0.05})
+        started = time.monotonic()
+        result = client.get_price("SLOW")
+        elapsed = time.monotonic() - started
+
+        assert result["price"] == 100.0
+        assert elapsed < 0.8, f"헤지 요청이 지연을 줄이지 못함: {elapsed:.2f}s"
+        assert client.request_stats["hedged"] == 1
+        assert client.request_stats["hedge_wins"] == 1
+        print(f"✅ 헤지 응답 시간: {elapsed * 1000:.0f}ms")
+    finally:
+        server.shutdown()
+
+
+def test_circuit_breaker_serves_last_value():
+    """브레이커가 열리면 네트워크 호출 없이 마지막 값 반환"""
+    server = start_stub_server()
+    try:
+        client = SpotMCPClient(
+            port=server.server_address[1],
+            hedging={"enabled": False},
+            circuit_breaker={"failure_threshold": 2, "reset_timeout": 60.0},
+        )
+        first = client.get_depth("FLAKY")
+        assert first["price"] == 100.0
+
+        # 두 번 실패하면 브레이커 열림 (실패 중에도 마지막 값 제공)
+        assert client.get_depth("FLAKY") == first
+        assert client.get_depth("FLAKY") == first
+        assert client.get_endpoint_health()["spot/depth"]["state"] == "OPEN"
+
+        hits_before = StubMarketHandler.hits["/api/spot/depth/FLAKY?limit=5"]
+        assert client.get_depth("FLAKY") == first
+        assert StubMarketHandler.hits["/api/spot/depth/FLAKY?limit=5"] == hits_before
+        assert client.request_stats["short_circuited"] == 1
+        print("✅ 서킷 브레이커 즉시 실패 및 캐시 값 제공")
+    finally:
+        server.shutdown()
+
+
+def test_failed_order_status_reads_are_not_served_stale():
+    """주문 상태 조회 실패는 마지막 값으로 대체하지 않음 - 대사 서비스가 실패로 처리"""
+    from spot_order_reconciler import SpotOrderReconciler
+    from spot_order_store import SpotOrderStore
+    from spot_split_order import SpotSplitOrder
+
+    server = start_stub_server()
+    try:
+        client = SpotMCPClient(port=server.server_address[1], hedging={"enabled": False})
+        store = SpotOrderStore()
+        store.add(SpotSplitOrder("o0", "BTCUSDT", 100.0, 1.0, "BUY", 0.0))
+        reconciler = SpotOrderReconciler(client, store, clock=lambda: 0.0, config={"burst": 10})
+        reconciler.track("o0", now=0.0)
+
+        reconciler.run_once(1.0)
+        interval = reconciler.tracked["o0"].interval
+        assert interval > reconciler.config["min_interval"]  # 변화 없음 확인 후 주기 증가
+
+        reconciler.run_once(1.0 + interval)  # 두 번째 조회부터 500
+        assert reconciler.stats["errors"] == 1
+        assert reconciler.tracked["o0"].interval == interval
+        assert client.request_stats["stale_served"] == 0
+        print("✅ 주문 상태 조회 실패 시 이전 값 미사용")
+    finally:
+        server.shutdown()
+
+
+def main():
+    print("🧪 SpotMCPClient 테스트 시작")
+    print("=" * 30)
+
+    test_hedged_read_beats_slow_replica()
+    test_circuit_breaker_serves_last_value()
+    test_failed_order_status_reads_are_not_served_stale()
+
+    print("\n✅ 모든 테스트 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from spot_execution_scheduler import SpotExecutionScheduler
+from spot_order_reconciler import SpotOrderReconciler
+from spot_order_store import SpotOrderStore
+from spot_split_order import SpotSplitOrder
+
+
+class StubVenue:
+    def __init__(self):
+        self.statuses = {}
+        self.batches = []
+        self.next_id = 0
+
+    def get_order_statuses(self, order_ids):
+        self.batches.append(list(order_ids))
+        return [dict(self.statuses[order_id], order_id=order_id) for order_id in order_ids]
+
+    def create_order(self, symbol, order_type, price, quantity):
+        self.next_id += 1
+        venue_id = f"v{self.next_id}"
+        self.statuses[venue_id] = {"status": "NEW", "executed_quantity": 0.0}
+        return {"order_id": venue_id, "status": "NEW"}
+
+
+def make_reconciler(venue, count, **config):
+    store = SpotOrderStore()
+    for i in range(count):
+        store.add(SpotSplitOrder(f"o{i}", "BTCUSDT", 100.0, 2.0, "BUY", 0.0))
+        venue.statuses[f"o{i}"] = {"status": "NEW", "executed_quantity": 0.0}
+    changes = []
+    reconciler = SpotOrderReconciler(venue, store, clock=lambda: 0.0,
+                                     config=dict({"batch_size": 2, "burst": 10}, **config),
+                                     on_change=lambda *change: changes.append(change))
+    for i in range(count):
+        reconciler.track(f"o{i}", now=0.0)
+    return store, reconciler, changes
+
+
+def test_batches_and_applies_only_changes():
+    venue = StubVenue()
+    store, reconciler, changes = make_reconciler(venue, 3)
+    venue.statuses["o1"] = {"status": "partially_filled", "executed_quantity": 0.5}
+    venue.statuses["o2"] = {"status": "filled"}
+
+    assert reconciler.run_once(1.0) == 2
+    assert venue.batches == [["o0", "o1"], ["o2"]]
+    assert changes == [("o1", "PARTIALLY_FILLED", 0.5), ("o2", "FILLED", 2.0)]
+    assert store.get("o1").filled_quantity == 0.5
+    assert "o2" not in reconciler.tracked  # 종료된 주문은 대사 대상에서 제외
+
+
+def test_quiet_orders_back_off_and_active_orders_stay_fast():
+    venue = StubVenue()
+    _, reconciler, _ = make_reconciler(venue, 2, batch_size=10)
+    reconciler.run_once(1.0)
+    venue.statuses["o1"] = {"status": "PARTIALLY_FILLED", "executed_quantity": 1.0}
+    reconciler.run_once(3.0)
+
+    assert reconciler.tracked["o0"].interval == 4.0
+    assert reconciler.tracked["o1"].interval == 1.0
+    reconciler.run_once(4.0)
+    assert venue.batches[-1] == ["o1"]
+
+
+def test_request_rate_is_capped():
+    venue = StubVenue()
+    _, reconciler, _ = make_reconciler(venue, 6, burst=2, max_requests_per_second=1.0)
+    reconciler.bucket.updated = 1.0
+
+    reconciler.run_once(1.0)
+    assert len(venue.batches) == 2
+    assert reconciler.get_stats()["throttled"] == 2
+    reconciler.run_once(2.0)
+    assert venue.batches[-1] == ["o4", "o5"]
+
+
+def test_terminal_status_feeds_execution_scheduler():
+    venue = StubVenue()
+    scheduler = SpotExecutionScheduler(venue, clock=lambda: 0.0)
+    parent = scheduler.submit("BTCUSDT", "BUY", 1.0, duration=10)
+    scheduler.run_once(0.0)
+    scheduler.wait_idle()
+
+    store = SpotOrderStore()
+    reconciler = SpotOrderReconciler(venue, store, clock=lambda: 0.0)
+    assert reconciler.attach_scheduler(scheduler, now=0.0) == 1
+    venue.statuses["v1"] = {"status": "FILLED", "executed_quantity": 1.0}
+
+    assert reconciler.run_once(1.0) == 1
+    assert parent.status == "COMPLETED"
+    assert scheduler.venue_order_ids == {}
+    scheduler.stop()
+
+
+def test_fetch_errors_keep_poll_interval(capsys):
+    class FlakyVenue(StubVenue):
+        down = False
+
+        def get_order_statuses(self, order_ids):
+            if self.down:
+                raise ConnectionError("exchange unavailable")
+            return super().get_order_statuses(order_ids)
+
+    venue = FlakyVenue()
+    _, reconciler, _ = make_reconciler(venue, 2, batch_size=10)
+    reconciler.run_once(1.0)
+    assert reconciler.tracked["o0"].interval == 2.0
+
+    venue.down = True
+    for now in (3.0, 5.0, 7.0):
+        reconciler.run_once(now)
+    # 장애 중에는 주기를 늘리지 않고 같은 간격으로 재시도
+    assert reconciler.tracked["o0"].interval == 2.0
+    assert reconciler.stats["errors"] == 3
+    assert "exchange unavailable" in capsys.readouterr().out
+
+    venue.down = False
+    venue.statuses["o0"] = {"status": "FILLED"}
+    assert reconciler.run_once(9.0) == 1
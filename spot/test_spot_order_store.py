@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from spot_order_store import SpotOrderStore
+from spot_split_order import SpotSplitOrder
+
+
+def make_orders(count, symbols=("BTCUSDT", "ETHUSDT")):
+    return [
+        SpotSplitOrder(f"o{i}", symbols[i % len(symbols)], 100.0 + i, 1.0,
+                       "BUY" if i % 3 else "SELL", 1_700_000_000 + i)
+        for i in range(count)
+    ]
+
+
+def test_slots_order_has_no_dict():
+    order = SpotSplitOrder("o1", "BTCUSDT", 100.0, 1.0, "BUY", "2024-01-01T00:00:00")
+    assert not hasattr(order, "__dict__")
+    assert order.get_order_details()["status"] == "NEW"
+
+
+def test_lookup_and_secondary_indexes_grow_past_capacity():
+    store = SpotOrderStore(capacity=4)
+    store.add_many(make_orders(10))
+
+    assert len(store) == 10
+    order = store.get("o7")
+    assert (order.symbol, order.price, order.order_type, order.status) == ("ETHUSDT", 107.0, "BUY", "NEW")
+    assert store.get("missing") is None
+    assert store.open_orders(symbol="BTCUSDT", side="SELL") == ["o0", "o6"]
+    assert store.find(symbol="DOGEUSDT") == []
+    with pytest.raises(ValueError):
+        store.add(make_orders(1)[0])
+
+
+def test_bulk_transitions_keep_terminal_states():
+    store = SpotOrderStore()
+    store.add_many(make_orders(6))
+
+    assert store.transition(["o0", "o1"], "FILLED") == 2
+    assert store.get("o1").filled_quantity == 1.0
+    assert store.transition(["o2"], "PARTIALLY_FILLED", filled=[0.4]) == 1
+    assert store.open_orders(status="PARTIALLY_FILLED") == ["o2"]
+
+    # 종료된 주문은 다시 전이하지 않음
+    assert store.transition(["o0", "o3"], "CANCELLED") == 1
+    assert store.get("o0").status == "FILLED"
+
+    assert store.transition_where("CANCELLED", symbol="BTCUSDT") == 2
+    assert store.open_orders() == ["o5"]
+    assert store.find(status="CANCELLED") == ["o2", "o3", "o4"]
+    assert store.get_stats()["by_status"]["FILLED"] == 2
+
+
+def test_failed_batch_leaves_store_unchanged():
+    store = SpotOrderStore(capacity=4)
+    store.add_many(make_orders(3))
+    before = store.get_stats()
+
+    existing = make_orders(5)[2:]  # o2는 이미 저장됨
+    with pytest.raises(ValueError):
+        store.add_many(existing)
+    with pytest.raises(ValueError):
+        store.add_many([SpotSplitOrder("n1", "SOLUSDT", 10.0, 1.0, "BUY", 0)] * 2)  # 배치 내부 중복
+    with pytest.raises(ValueError):
+        store.add_many([SpotSplitOrder("n2", "SOLUSDT", 10.0, 1.0, "HOLD", 0)])
+
+    assert store.get_stats() == before
+    assert "o3" not in store and "n1" not in store
+    assert store.add_many(make_orders(5)[3:]) == [3, 4]
@@ -0,0 +1,60 @@
+import csv
+import io
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "futures"))
+
+import main
+from futures_trade_journal import TradeJournal
+
+
+def run(capsys, *argv):
+    assert main.run_cli(list(argv)) == 0
+    captured = capsys.readouterr()
+    return captured.out, captured.err
+
+
+def test_sweep_streams_progress_and_ranks_results(capsys):
+    out, err = run(capsys, "sweep", "--symbols", "BTC-USD,ETH-USD", "--ma-windows", "3,5",
+                   "--format", "csv", "--seed", "7")
+    rows = list(csv.DictReader(io.StringIO(out)))
+    assert len(rows) == 4
+    assert [float(row["roi_percent"]) for row in rows] == sorted((float(row["roi_percent"]) for row in rows), reverse=True)
+    assert "[4/4]" in err
+
+    # 같은 시드는 같은 결과 (프로세스 풀 사용 여부와 무관)
+    parallel, _ = run(capsys, "sweep", "--symbols", "BTC-USD,ETH-USD", "--ma-windows", "3,5",
+                      "--format", "csv", "--seed", "7", "--workers", "2")
+    strip = lambda text: [row[:-1] for row in csv.reader(io.StringIO(text))]  # elapsed_ms 제외
+    assert strip(parallel) == strip(out)
+
+    # 반복 실행해도 sys.path에 중복 항목이 쌓이지 않음
+    path_length = len(sys.path)
+    run(capsys, "sweep", "--symbols", "BTC-USD", "--ma-windows", "3,5", "--seed", "7")
+    assert len(sys.path) == path_length
+
+
+def test_backtest_reads_csv_data_source(tmp_path, capsys):
+    path = tmp_path / "prices.csv"
+    lines = ["date,symbol,price"] + [f"2023-01-{day:02d},SOL-USD,{100 + day}" for day in range(1, 21)]
+    path.write_text("\n".join(lines))
+    out, _ = run(capsys, "backtest", "--data-source", f"csv:{path}", "--symbols", "SOL-USD",
+                 "--start", "2023-01-01", "--end", "2023-01-10", "--format", "json")
+    result = json.loads(out)[0]
+    assert result["bars"] == 10 and result["total_trades"] > 0
+
+
+def test_replay_applies_journal_trades(tmp_path, capsys):
+    journal = TradeJournal(str(tmp_path / "trades.journal"))
+    for action, amount, price in (("BUY", 4000.0, 40000.0), ("SELL", 4400.0, 44000.0)):
+        journal.append({"symbol": "BTC/USDT", "amount": amount, "signal": {"action": action, "confidence": 90},
+                        "market_data": {"price": price}, "executed": True, "success": True,
+                        "timestamp": "2024-01-01T00:00:00"})
+    journal.close()
+
+    out, _ = run(capsys, "replay", "--journal", str(tmp_path / "trades.journal"), "--format", "json")
+    result = json.loads(out)[0]
+    assert result["journal_entries"] == 2 and result["total_trades"] == 2
+    assert result["profit_loss"] > 0
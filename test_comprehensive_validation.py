@@ -87,7 +87,7 @@ def test_futures_trader():
         
         # Dummy 클라이언트 생성
         class DummyClaudeClient:
-            def generate_trading_signal(self, symbol, amount):
+            def generate_trading_signal(self, symbol, amount, market_data=None):
                 return {"action": "BUY" if amount > 1000 else "SELL", "confidence": 85}
         
         class DummyMCPClient:
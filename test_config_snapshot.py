@@ -0,0 +1,111 @@
+import types
+
+import pytest
+
+from config_snapshot import ConfigRegistry, build_snapshot, get_config
+
+
+def make_modules(**spot_overrides):
+    futures = types.SimpleNamespace(
+        FEES={"maker": 0.0002, "taker": 0.0004},
+        TRADING_HOURS={"active_start": 8, "active_end": 18, "funding_times": [0, 8, 16]},
+        SUPPORTED_SYMBOLS=["BTC/USDT", "ETH/USDT"],
+    )
+    spot = types.SimpleNamespace(SUPPORTED_ASSETS=dict({
+        "BTC": {"min_order": 0.001, "price_precision": 2},
+        "SOL": {"min_order": 0.1, "price_precision": 4},
+    }, **spot_overrides))
+    return futures, spot
+
+
+def test_repo_config_snapshot_is_frozen_and_flags_redefinitions():
+    snapshot = get_config()
+    assert snapshot.is_supported("BTC/USDT")
+    assert snapshot.futures["TRADING_HOURS"]["active_end"] == 18  # 마지막 정의가 적용됨
+    assert any("TRADING_HOURS" in warning for warning in snapshot.warnings)
+    with pytest.raises(TypeError):
+        snapshot.futures["FEES"]["taker"] = 0.0
+    with pytest.raises(AttributeError):
+        snapshot.version = 99
+
+
+def test_tick_and_lot_rounding_by_any_symbol_spelling():
+    snapshot = build_snapshot(*make_modules())
+    assert snapshot.round_price("BTC/USDT", 50000.123, "SELL") == 50000.13
+    assert snapshot.round_price("BTCUSDT", 50000.129, "BUY") == 50000.12
+    assert snapshot.round_quantity("SOL-USD", 1.27) == 1.2
+    assert snapshot.tick_size("SOL/USDT") == pytest.approx(0.0001)
+    assert snapshot.round_quantity("DOGE/USDT", 3.3) == 3.3  # 규칙 없는 심볼은 그대로
+
+
+def test_reload_swaps_atomically_and_keeps_old_snapshot_on_error():
+    registry = ConfigRegistry(build_snapshot(*make_modules()))
+    seen = []
+    registry.subscribe(lambda snapshot: seen.append(snapshot.version))
+
+    result = registry.reload(*make_modules(BTC={"min_order": 0.01, "price_precision": 1}))
+    assert result["success"] and seen == [2]
+    assert registry.current.round_quantity("BTC/USDT", 0.019) == 0.01
+
+    result = registry.reload(*make_modules(BTC={"min_order": -1, "price_precision": 1}))
+    assert not result["success"]
+    assert registry.current.version == 2
+
+
+def test_time_based_trader_reads_injected_snapshot():
+    import os
+    import sys
+    from datetime import datetime, timezone
+
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "futures"))
+    from futures_time_based_trader import TimeBasedTradingManager
+
+    futures, spot = make_modules()
+    futures.TIME_BASED_LEVERAGE = {"high_volume": 7, "low_volume": 2, "funding_time": 1}
+    snapshot = build_snapshot(futures, spot)
+    manager = TimeBasedTradingManager(clock=lambda: datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+                                      config=snapshot)
+    assert manager.config is snapshot
+    assert manager.leverage_table[12] == 7 and manager.leverage_table[3] == 2 and manager.leverage_table[8] == 1
+
+
+def test_init_config_reports_warnings(capsys):
+    from config_snapshot import init_config
+
+    snapshot = init_config()
+    assert snapshot is get_config()
+    assert "Config warning" in capsys.readouterr().out
+
+
+def test_reload_reaches_live_consumers():
+    import os
+    import sys
+    from datetime import datetime, timezone
+
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "futures"))
+    from config_snapshot import CONFIG
+    from execution_algos import LimitChaser
+    from futures_scalping_simulator import ScalpingSimulator
+    from futures_time_based_trader import TimeBasedTradingManager
+
+    manager = TimeBasedTradingManager()
+    simulator = ScalpingSimulator()
+    chaser = LimitChaser("SOL/USDT", "BUY", 1.0)
+    early = datetime(2024, 1, 1, 5, 30, tzinfo=timezone.utc)
+    assert not manager.is_high_volume_time(early)
+
+    futures, spot = make_modules()
+    futures.TRADING_HOURS = {"active_start": 0, "active_end": 23, "funding_times": [0, 8, 16]}
+    futures.TIME_BASED_LEVERAGE = {"high_volume": 7, "low_volume": 2, "funding_time": 1}
+    futures.SCALPING_MODE = {"max_positions": 1, "max_hold_time": 60}
+    original = CONFIG.current
+    CONFIG.swap(build_snapshot(futures, spot, version=original.version + 1))
+    try:
+        assert manager.is_high_volume_time(early)
+        assert manager.get_leverage_multiplier(early) == 7
+        assert chaser.tick_size == pytest.approx(0.0001)
+        result = simulator.run([0, 1, 2, 3], [100.0, 100.0, 100.0, 100.0], [1, 1, 0, 0])
+        assert simulator.max_hold_time == 60 and result["rejected_entries"] == 1
+    finally:
+        CONFIG.swap(original)
+    assert not manager.is_high_volume_time(early)
@@ -0,0 +1,157 @@
+from execution_algos import (
+    ACTION_DONE, ACTION_HOLD, ACTION_PLACE, ACTION_REPLACE, AlgoExecutor, IcebergOrder, LimitChaser
+)
+
+
+class StubBook:
+    """호가를 바꿀 수 있는 현물 거래소 스텁 (주문은 걸어두고 체결은 수동)"""
+
+    def __init__(self, bid=100.0, ask=100.1, bid_qty=4.0, ask_qty=4.0):
+        self.depth = {"bids": [[bid, bid_qty]], "asks": [[ask, ask_qty]]}
+        self.orders = []
+        self.cancelled = []
+
+    def get_depth(self, symbol, limit=5):
+        return self.depth
+
+    def create_order(self, symbol, order_type, price, quantity):
+        self.orders.append((order_type, price, quantity))
+        return {"order_id": f"o{len(self.orders)}", "status": "NEW"}
+
+    def cancel_order(self, order_id):
+        self.cancelled.append(order_id)
+        return {"order_id": order_id, "status": "CANCELLED"}
+
+
+def test_iceberg_shows_depth_limited_slices_and_refills():
+    iceberg = IcebergOrder("BTCUSDT", "BUY", 3.0, display_quantity=2.0, depth_fraction=0.25)
+    venue = StubBook(bid_qty=4.0)
+    executor = AlgoExecutor(venue)
+
+    assert executor.step(iceberg) == ACTION_PLACE
+    assert venue.orders[-1] == ("BUY", 100.0, 1.0)  # 잔량 4의 25%만 노출
+    assert executor.step(iceberg) == ACTION_HOLD
+
+    iceberg.on_fill(1.0)
+    venue.depth["bids"][0][1] = 40.0
+    executor.step(iceberg)
+    assert venue.orders[-1] == ("BUY", 100.0, 2.0)  # display_quantity 상한
+    iceberg.on_fill(2.0)
+    assert executor.step(iceberg) == ACTION_DONE
+    assert iceberg.refills == 2
+
+
+def test_limit_chaser_reprices_only_past_threshold():
+    chaser = LimitChaser("BTCUSDT", "BUY", 1.0, tick_size=0.1, offset_ticks=0, reprice_ticks=2, limit_price=100.6)
+    venue = StubBook(bid=100.0, ask=100.5)
+    executor = AlgoExecutor(venue)
+
+    assert executor.step(chaser) == ACTION_PLACE
+    venue.depth["bids"][0][0] = 100.1
+    assert executor.step(chaser) == ACTION_HOLD  # 1틱 변화는 무시
+    venue.depth["bids"][0][0] = 100.3
+    venue.depth["asks"][0][0] = 100.8
+    assert executor.step(chaser) == ACTION_REPLACE
+    assert venue.cancelled == ["o1"]
+    assert venue.orders[-1] == ("BUY", 100.3, 1.0)
+
+    venue.depth["bids"][0][0] = 101.0
+    venue.depth["asks"][0][0] = 101.2
+    assert executor.step(chaser) == ACTION_REPLACE
+    assert venue.orders[-1][1] == 100.6  # 추격 상한
+    assert chaser.reprices == 2
+
+
+def test_sell_chaser_stays_inside_spread():
+    chaser = LimitChaser("ETHUSDT", "SELL", 2.0, tick_size=0.01, offset_ticks=5)
+    assert chaser.target_price(2000.00, 2000.03) == 2000.01
+    assert chaser.decide(2000.00, 1.0, 2000.03, 1.0) == (ACTION_PLACE, 2000.01, 2.0)
+
+
+def test_futures_client_without_depth_uses_market_price():
+    class FuturesStub:
+        def get_market_data(self, symbol):
+            return {"price": 50000.0}
+
+        def place_order(self, symbol, side, amount, price=None):
+            return {"order_id": "f1", "status": "FILLED", "price": price}
+
+    iceberg = IcebergOrder("BTCUSDT", "SELL", 0.5, display_quantity=0.2)
+    result = AlgoExecutor(FuturesStub()).run(iceberg, max_steps=10, sleep=lambda _: None)
+    assert result["filled"] == 0.5
+    assert result["stats"]["placed"] == 3
+
+
+class StatusBook(StubBook):
+    """주문 상태 조회를 지원하는 스텁 - 체결은 fill()로 거래소 쪽에서만 발생"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.statuses = {}
+
+    def create_order(self, symbol, order_type, price, quantity):
+        response = super().create_order(symbol, order_type, price, quantity)
+        self.statuses[response["order_id"]] = {"status": "NEW", "executed_quantity": 0.0, "quantity": quantity}
+        return response
+
+    def fill(self, order_id, quantity):
+        order = self.statuses[order_id]
+        order["executed_quantity"] += quantity
+        order["status"] = "FILLED" if order["executed_quantity"] >= order["quantity"] else "PARTIALLY_FILLED"
+
+    def get_order_status(self, order_id):
+        return {"order_id": order_id, "status": self.statuses[order_id]["status"],
+                "executed_quantity": self.statuses[order_id]["executed_quantity"]}
+
+
+def test_iceberg_refills_from_polled_order_status():
+    iceberg = IcebergOrder("BTCUSDT", "BUY", 2.5, display_quantity=1.0, depth_fraction=1.0)
+    venue = StatusBook(bid_qty=10.0)
+    executor = AlgoExecutor(venue)
+
+    assert executor.step(iceberg) == ACTION_PLACE
+    assert executor.step(iceberg) == ACTION_HOLD
+    venue.fill("o1", 0.4)
+    assert executor.step(iceberg) == ACTION_HOLD and iceberg.filled == 0.4
+    venue.fill("o1", 0.6)
+    assert executor.step(iceberg) == ACTION_PLACE  # 체결 확인 후 다음 조각 노출
+    assert venue.orders[-1] == ("BUY", 100.0, 1.0)
+
+    venue.fill("o2", 1.0)
+    executor.step(iceberg)
+    venue.statuses["o3"]["status"] = "EXPIRED"  # 거래소에서 종료된 조각은 다시 노출
+    assert executor.step(iceberg) == ACTION_PLACE
+    assert venue.orders[-1] == ("BUY", 100.0, 0.5)
+    venue.fill("o4", 0.5)
+
+    result = executor.run(iceberg, max_steps=5, sleep=lambda _: None)
+    assert result["filled"] == 2.5 and result["stats"]["steps"] == 7
+
+
+def test_chaser_keeps_working_order_until_cancel_is_confirmed():
+    class FlakyCancelBook(StatusBook):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.cancel_ok = False
+
+        def cancel_order(self, order_id):
+            if not self.cancel_ok:
+                return None  # 요청 실패 / 브레이커 차단
+            self.statuses[order_id]["status"] = "CANCELLED"
+            return super().cancel_order(order_id)
+
+    chaser = LimitChaser("BTCUSDT", "BUY", 1.0, tick_size=0.1, reprice_ticks=2)
+    venue = FlakyCancelBook(bid=100.0, ask=101.0)
+    executor = AlgoExecutor(venue)
+
+    assert executor.step(chaser) == ACTION_PLACE
+    for bid in (100.3, 100.6, 100.9):
+        venue.depth["bids"][0][0] = bid
+        assert executor.step(chaser) == ACTION_HOLD
+    assert len(venue.orders) == 1 and chaser.working_id == "o1"
+
+    venue.fill("o1", 0.4)
+    venue.cancel_ok = True
+    assert executor.step(chaser) == ACTION_REPLACE
+    assert venue.cancelled == ["o1"]
+    assert venue.orders[-1] == ("BUY", 100.9, 0.6)  # 취소 전 체결분을 제외한 수량만 재주문
@@ -0,0 +1,53 @@
+"""
+⏱️ import 시간 예산 테스트
+- 새 인터프리터에서 `python -X importtime`으로 진입 모듈의 누적 import 시간 측정
+- 무거운 의존성(pandas/anthropic/requests)이 import 시점에 로드되지 않는지 확인
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ("pandas", "anthropic", "requests")
+IMPORT_BUDGET_MS = 150  # 진입 모듈당 누적 import 시간 상한 (여유 있게 설정)
+
+ENTRY_POINTS = [
+    ("main", ROOT),
+    ("backtester", ROOT),
+    ("futures", ROOT),
+    ("spot_backtester", os.path.join(ROOT, "spot")),
+    ("claude_market_intelligence", os.path.join(ROOT, "futures")),
+]
+
+
+def measure_import(module, path):
+    code = (f"import sys; sys.path.insert(0, {path!r}); import {module}; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=path,
+                            capture_output=True, text=True, check=True)
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative_us = int(parts[1])
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return cumulative_us / 1000.0, loaded
+
+
+@pytest.mark.parametrize("module,path", ENTRY_POINTS)
+def test_entry_point_import_budget(module, path):
+    elapsed_ms, loaded = measure_import(module, path)
+    assert loaded == [], f"{module} eagerly imports {loaded}"
+    assert elapsed_ms < IMPORT_BUDGET_MS, f"{module} import took {elapsed_ms:.1f}ms"
+
+
+def test_futures_package_members_load_on_first_access():
+    code = ("import sys; import futures; assert 'futures.futures_main' not in sys.modules; "
+            "futures.FuturesTrader; assert 'futures.futures_main' in sys.modules; "
+            "print(futures.SUPPORTED_FUTURES[0])")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "BTC-PERPETUAL"
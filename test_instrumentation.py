@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+🧪 계측 모듈 테스트
+"""
+
+import json
+import random
+
+from instrumentation import Histogram, LLMInstrumentation
+
+
+def test_histogram_percentiles():
+    """히스토그램 분위수 상대 오차 확인"""
+    random.seed(7)
+    values = sorted(random.randint(1, 5_000_000) for _ in range(20000))
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+
+    for pct in (50, 90, 99):
+        exact = values[int(len(values) * pct / 100) - 1]
+        assert abs(histogram.percentile(pct) - exact) / exact < 0.03
+    assert histogram.count == len(values)
+    assert histogram.max == values[-1]
+    print("✅ 히스토그램 분위수 테스트 통과")
+
+
+def test_llm_call_tracking_and_export():
+    """호출 결과, 토큰, 비용, 실패 기록 및 내보내기"""
+    metrics = LLMInstrumentation()
+
+    with metrics.track('futures.trading_signal') as call:
+        call.input_tokens = 1000
+        call.output_tokens = 200
+    with metrics.track('futures.trading_signal') as call:
+        call.cache_hit = True
+    try:
+        with metrics.track('futures.trading_signal'):
+            raise TimeoutError("model timeout")
+    except TimeoutError:
+        pass
+
+    summary = metrics.summary()['futures.trading_signal']
+    assert summary['calls'] == 3
+    assert summary['cache_hits'] == 1
+    assert summary['errors'] == 1
+    assert summary['input_tokens'] == 1000
+    assert abs(summary['cost_usd'] - (1000 * 3.0 + 200 * 15.0) / 1e6) < 1e-12
+
+    prometheus = metrics.to_prometheus()
+    assert 'llm_calls_total{path="futures.trading_signal",outcome="error"} 1' in prometheus
+    assert 'llm_latency_us_count{path="futures.trading_signal"} 3' in prometheus
+    assert json.loads(metrics.to_json())['summary']['futures.trading_signal']['calls'] == 3
+    print("✅ LLM 호출 계측 테스트 통과")
+
+
+def main():
+    print("🧪 계측 모듈 테스트 시작")
+    print("=" * 30)
+
+    test_histogram_percentiles()
+    test_llm_call_tracking_and_export()
+
+    print("\n✅ 모든 테스트 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+from position_keeper import PositionKeeper
+
+
+def test_fills_update_entry_pnl_and_margin():
+    keeper = PositionKeeper(initial_balance=10000.0, leverage=10)
+    keeper.apply_fill("BTC/USDT", "BUY", 0.1, 50000)
+    keeper.apply_fill("BTC/USDT", "BUY", 0.1, 52000)
+    assert keeper.get_position("BTC/USDT")["entry_price"] == 51000
+
+    keeper.update_mark("BTC/USDT", 53000)
+    position = keeper.get_position("BTC/USDT")
+    assert position["unrealized_pnl"] == 400 and position["margin"] == 1060
+
+    keeper.apply_fill("BTC/USDT", "SELL", 0.3, 50000)  # 청산 후 숏 전환
+    position = keeper.get_position("BTC/USDT")
+    assert round(position["size"], 10) == -0.1 and position["entry_price"] == 50000
+    assert keeper.realized_pnl == -200
+
+    account = keeper.get_account_info()
+    assert account["balance"] == 9800 and round(account["margin_used"], 6) == 500
+
+
+def test_reconcile_only_after_interval():
+    now = [0.0]
+    keeper = PositionKeeper(reconcile_interval=30.0, clock=lambda: now[0])
+    keeper.apply_fill("ETH/USDT", "BUY", 1, 3000)
+    venue = {"ETH/USDT": {"size": 2.0, "entry_price": 3100.0}}
+
+    assert keeper.maybe_reconcile(lambda: venue) is None
+    now[0] = 31.0
+    assert keeper.maybe_reconcile(lambda: venue) == {"ETH/USDT": {"local": 1, "venue": 2.0}}
+    assert keeper.get_position("ETH/USDT")["size"] == 2.0
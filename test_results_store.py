@@ -0,0 +1,66 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "spot"))
+
+from backtester import UnifiedBacktester
+from results_store import ResultsStore
+
+
+def equity(values):
+    start = datetime(2023, 1, 1)
+    return [{"date": start + timedelta(days=i), "total_value": value, "price": 100.0 + i}
+            for i, value in enumerate(values)]
+
+
+def test_write_query_and_reload_index(tmp_path):
+    store = ResultsStore(str(tmp_path))
+    for window, roi in ((3, 2.5), (5, 7.0), (10, -1.0)):
+        store.write_run({"symbol": "BTC-USD", "ma_window": window}, {"roi_percent": roi},
+                        equity_curve=equity([10000, 10000 + roi * 100]), kind="sweep")
+    store.write_run({"symbol": "ETH-USD", "ma_window": 5}, {"roi_percent": 9.0})
+
+    reopened = ResultsStore(str(tmp_path))
+    assert len(reopened) == 4
+    best = reopened.query(symbol="BTC-USD", roi_percent__gte=0, order_by="roi_percent", descending=True)
+    assert [row["ma_window"] for row in best] == [5, 3]
+    assert [row["symbol"] for row in reopened.query(ma_window__in=[5], order_by="roi_percent")] == ["BTC-USD", "ETH-USD"]
+    assert reopened.query(kind="sweep", limit=1)[0]["ma_window"] == 3
+
+    curve = reopened.load_equity(best[0]["run_id"])
+    assert curve["value"].tolist() == [10000.0, 10700.0]
+    assert reopened.load_equity(reopened.query(symbol="ETH-USD")[0]["run_id"]) == {}
+
+
+def test_backtester_trades_and_drawdown(tmp_path):
+    store = ResultsStore(str(tmp_path))
+    backtester = UnifiedBacktester(10000)
+    backtester.buy("BTC", 45000, 0.1)
+    backtester.sell("BTC", 47000, 0.1)
+    run_id = store.write_backtester(backtester, {"strategy": "manual"}, equity_curve=equity([100, 120, 90, 130]))
+
+    trades = store.load_trades(run_id)
+    assert trades["side"].tolist() == [1, -1]
+    assert trades["assets"][trades["asset"]].tolist() == ["BTC", "BTC"]
+    assert store.get(run_id)["total_trades"] == 2
+    assert store.compare_equity([run_id])[run_id]["max_drawdown_percent"] == pytest.approx(25.0)
+    with pytest.raises(ValueError):
+        store.write_run({"roi_percent": 1.0}, {"roi_percent": 2.0})
+
+
+def test_spot_trader_keeps_equity_curve(tmp_path):
+    from spot_claude_client import SpotClaudeClient
+    from spot_main import SpotTrader
+
+    store = ResultsStore(str(tmp_path))
+    trader = SpotTrader(SpotClaudeClient("demo_api_key"), results_store=store)
+    result = trader.run_backtest("BTC-USD", "2023-01-01", "2023-01-31")
+
+    assert result["success"] and len(result["equity_curve"]) == 31
+    stored = store.load_equity(result["run_id"])["value"]
+    assert np.allclose(stored, [point["total_value"] for point in result["equity_curve"]])
+    assert store.get(result["run_id"])["symbol"] == "BTC-USD"
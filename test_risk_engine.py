@@ -0,0 +1,84 @@
+import numpy as np
+
+from risk_engine import PreTradeRiskEngine
+
+
+def test_incremental_exposure_and_pnl():
+    engine = PreTradeRiskEngine({"max_single_position": 20000.0, "max_portfolio_value": 30000.0})
+    engine.on_fill("BTC-USD", "BUY", 0.2, 50000)
+    engine.on_fill("ETH-USD", "BUY", 2, 3000)
+    assert engine.gross_exposure == 16000
+
+    engine.on_price("BTC-USD", 55000)
+    assert engine.gross_exposure == 17000 and engine.unrealized_pnl == 1000
+
+    engine.on_fill("BTC-USD", "SELL", 0.1, 55000)
+    assert engine.realized_pnl == 500 and engine.unrealized_pnl == 500
+    assert engine.gross_exposure == 11500
+
+
+def test_check_order_limits():
+    engine = PreTradeRiskEngine({"max_single_position": 20000.0, "max_portfolio_value": 30000.0})
+    engine.on_fill("BTC-USD", "BUY", 0.3, 50000)
+
+    assert not engine.check_order("BTC-USD", "BUY", 0.2, 50000)["allowed"]
+    assert engine.check_order("BTC-USD", "SELL", 0.3, 50000)["allowed"]
+    assert engine.check_order("ETH-USD", "BUY", 5, 3000)["allowed"]
+    assert not engine.check_order("SOL-USD", "BUY", 100, 160)["allowed"]
+
+
+def test_fractional_position_size_and_daily_loss():
+    now = [0.0]
+    engine = PreTradeRiskEngine({"max_position_size": 0.1, "max_daily_loss": 100.0},
+                                equity=10000.0, clock=lambda: now[0])
+    assert engine.position_limit() == 1000.0
+    assert not engine.check_order("BTC/USDT", "BUY", 0.03, 50000)["allowed"]
+
+    engine.on_fill("BTC/USDT", "BUY", 0.02, 50000)
+    engine.on_price("BTC/USDT", 44000)
+    result = engine.check_order("ETH/USDT", "BUY", 0.1, 3000)
+    assert not result["allowed"] and "Daily loss" in result["reason"]
+    assert engine.check_order("BTC/USDT", "SELL", 0.01, 44000)["allowed"]
+
+    now[0] += 86400  # 다음 날에는 일일 손익 초기화
+    assert engine.daily_pnl == 0
+    assert engine.check_order("ETH/USDT", "BUY", 0.1, 3000)["allowed"]
+
+
+def test_check_batch_matches_cumulative_basket():
+    engine = PreTradeRiskEngine({"max_single_position": 20000.0, "max_portfolio_value": 40000.0})
+    engine.on_fill("BTC-USD", "BUY", 0.3, 50000)
+
+    allowed = engine.check_batch(
+        ["ETH-USD", "ETH-USD", "BTC-USD", "SOL-USD", "ETH-USD"],
+        ["BUY", "BUY", "SELL", "BUY", "BUY"],
+        [3, 3, 0.1, 100, 1],
+        [3000, 3000, 50000, 150, 3000],
+    )
+    # ETH 9000 -> 18000 허용, BTC 축소 허용, SOL 15000 누적 노출 초과, ETH 21000 단일 한도 초과
+    assert allowed.tolist() == [True, True, True, False, False]
+    assert isinstance(allowed, np.ndarray)
+
+
+def test_check_batch_ignores_rejected_orders():
+    engine = PreTradeRiskEngine({"max_single_position": 20000.0, "max_portfolio_value": 30000.0})
+    allowed = engine.check_batch(["SOL", "ETH"], ["BUY", "BUY"], [1000, 1], [150, 3000])
+    # SOL 150000은 단일 한도 초과로 거부 - 뒤의 ETH 주문 노출에 포함되지 않음
+    assert allowed.tolist() == [False, True]
+    assert engine.check_order("ETH", "BUY", 1, 3000)["allowed"]
+
+    allowed = engine.check_batch(["ETH", "BTC", "ETH"], ["BUY", "BUY", "BUY"], [5, 1, 1], [3000, 50000, 3000])
+    assert allowed.tolist() == [True, False, True]
+
+
+def test_on_fill_zero_quantity_and_flat_position():
+    engine = PreTradeRiskEngine({})
+    engine.on_fill("X", "BUY", 0, 100)
+    assert engine.positions == {}
+
+    engine.on_fill("X", "BUY", 2, 100)
+    engine.on_fill("X", "SELL", 2, 110)
+    assert engine.positions == {} and engine.realized_pnl == 20 and engine.gross_exposure == 0
+
+    engine.on_fill("X", "SELL", 1, 120)
+    assert engine.positions["X"][:2] == [-1, 120]
@@ -0,0 +1,32 @@
+import json
+
+from tracing import NOOP_SPAN, Tracer
+
+
+def test_ring_buffer_keeps_latest_spans_and_stage_histograms():
+    tracer = Tracer(capacity=4)
+    for _ in range(6):
+        with tracer.span("futures.signal"):
+            pass
+    try:
+        with tracer.span("futures.order"):
+            raise ValueError("rejected")
+    except ValueError:
+        pass
+
+    spans = tracer.dump()
+    assert len(spans) == 4
+    assert spans[-1]["stage"] == "futures.order" and spans[-1]["error"]
+    assert [span["start_ns"] for span in spans] == sorted(span["start_ns"] for span in spans)
+
+    summary = tracer.stage_summary()
+    assert summary["futures.signal"]["count"] == 6
+    assert summary["futures.order"]["count"] == 1
+    assert json.loads(tracer.to_json(last=2))["total_spans"] == 7
+
+
+def test_disabled_tracer_returns_noop_span():
+    tracer = Tracer(enabled=False)
+    with tracer.span("spot.order") as span:
+        assert span is NOOP_SPAN
+    assert tracer.total_spans == 0 and tracer.dump() == []
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+🔍 경량 스팬 트레이싱
+- 단조 시계(ns) 기반 스팬, 미리 할당된 링 버퍼에 저장
+- 단계별 HDR 스타일 히스토그램 집계
+- 필요 시 덤프 / JSON 내보내기, 비활성화 시 공용 no-op 스팬 반환
+"""
+
+import json
+import threading
+import time
+from array import array
+from typing import Dict, Any, List, Optional
+
+from instrumentation import Histogram
+
+_now_ns = time.perf_counter_ns
+
+
+class _NoopSpan:
+    """트레이싱 비활성화 시 사용하는 빈 스팬"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """단계 하나의 실행 구간"""
+
+    __slots__ = ('tracer', 'stage_id', 'started')
+
+    def __init__(self, tracer: 'Tracer', stage_id: int):
+        self.tracer = tracer
+        self.stage_id = stage_id
+        self.started = 0
+
+    def __enter__(self):
+        self.started = _now_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer._record(self.stage_id, self.started, _now_ns() - self.started, exc_type is not None)
+        return False
+
+
+class Tracer:
+    """링 버퍼 기반 스팬 트레이서"""
+
+    def __init__(self, capacity: int = 8192, enabled: bool = True):
+        self.capacity = capacity
+        self.enabled = enabled
+        # 링 버퍼 (기록 시 메모리 할당 없음)
+        self._stages = array('H', [0]) * capacity
+        self._starts = array('q', [0]) * capacity
+        self._durations = array('q', [0]) * capacity
+        self._errors = array('B', [0]) * capacity
+        self._cursor = 0
+        self.total_spans = 0
+
+        self._stage_ids = {}
+        self._stage_names = []
+        self._histograms = []
+        self._lock = threading.Lock()
+
+    def _stage_id(self, stage: str) -> int:
+        stage_id = self._stage_ids.get(stage)
+        if stage_id is None:
+            with self._lock:
+                stage_id = self._stage_ids.get(stage)
+                if stage_id is None:
+                    stage_id = len(self._stage_names)
+                    self._stage_names.append(stage)
+                    self._histograms.append(Histogram())
+                    self._stage_ids[stage] = stage_id
+        return stage_id
+
+    def span(self, stage: str):
+        """단계 스팬 컨텍스트 (with tracer.span('futures.signal'): ...)"""
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(self, self._stage_id(stage))
+
+    def _record(self, stage_id: int, started: int, duration: int, failed: bool):
+        with self._lock:
+            slot = self._cursor
+            self._stages[slot] = stage_id
+            self._starts[slot] = started
+            self._durations[slot] = duration
+            self._errors[slot] = failed
+            self._cursor = (slot + 1) % self.capacity
+            self.total_spans += 1
+            self._histograms[stage_id].record(duration)
+
+    def reset(self):
+        """버퍼와 히스토그램 초기화"""
+        with self._lock:
+            self._cursor = 0
+            self.total_spans = 0
+            self._histograms = [Histogram() for _ in self._stage_names]
+
+    def dump(self, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        """링 버퍼의 스팬을 오래된 순서로 반환"""
+        with self._lock:
+            size = min(self.total_spans, self.capacity)
+            if last is not None:
+                size = min(size, last)
+            first = (self._cursor - size) % self.capacity
+            spans = []
+            for offset in range(size):
+                slot = (first + offset) % self.capacity
+                spans.append({
+                    'stage': self._stage_names[self._stages[slot]],
+                    'start_ns': self._starts[slot],
+                    'duration_ns': self._durations[slot],
+                    'error': bool(self._errors[slot])
+                })
+            return spans
+
+    def stage_summary(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 지연시간 요약 (ns)"""
+        with self._lock:
+            return {
+                name: histogram.summary()
+                for name, histogram in zip(self._stage_names, self._histograms)
+                if histogram.count
+            }
+
+    def to_json(self, last: Optional[int] = None) -> str:
+        """단계 요약과 최근 스팬을 JSON으로 내보내기"""
+        return json.dumps({
+            'total_spans': self.total_spans,
+            'stages': self.stage_summary(),
+            'spans': self.dump(last)
+        }, indent=2)
+
+
+# 전역 기본 트레이서
+TRACER = Tracer()